@@ -48,3 +48,5 @@ AUTHOR_EMAIL        = "arno@childmind.org"
 PLATFORMS           = "Linux"
 VERSION             = __version__
 PROVIDES            = ["mhdb"]
+# optional faster xlsx parsing (see spreadsheet_io.open_workbook)
+EXTRAS_REQUIRE      = {"calamine": ["python-calamine"]}
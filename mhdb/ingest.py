@@ -11,21 +11,62 @@ Copyright 2020, Child Mind Institute (http://childmind.org), Apache v2.0 License
 
 """
 try:
-    from mhdb.spreadsheet_io import download_google_sheet
-    from mhdb.write_ttl import check_iri, language_string
+    from mhdb.spreadsheet_io import column_lists, download_google_sheet, \
+        exclude_rows, index_values, lookup_by_index, \
+        parse_worksheets, prefix_column, split_column, split_indices, \
+        strip_columns
+    from mhdb.write_ttl import check_iri, check_iri_column, \
+        check_iri_lookup, language_string, language_string_column
 except:
-    from mhdb.mhdb.spreadsheet_io import download_google_sheet
-    from mhdb.mhdb.write_ttl import check_iri, language_string
+    from mhdb.mhdb.spreadsheet_io import column_lists, download_google_sheet, \
+        exclude_rows, index_values, lookup_by_index, \
+        parse_worksheets, prefix_column, split_column, split_indices, \
+        strip_columns
+    from mhdb.mhdb.write_ttl import check_iri, check_iri_column, \
+        check_iri_lookup, language_string, language_string_column
 import numpy as np
+import os
 import pandas as pd
 import re
 
 emptyValue = 'EmptyValue'
 exclude_list = [emptyValue, '', [], 'NaN', 'NAN', 'nan', np.nan, None]
-
-
-def add_to_statements(subject, predicate, object, statements={},
-                      exclude_list=exclude_list):
+# hashable members of exclude_list, for constant-time membership tests
+exclude_set = frozenset(x for x in exclude_list if not isinstance(x, list))
+
+# string columns stripped of surrounding whitespace when a worksheet is loaded
+stripped_columns = ["ClassName", "property", "label", "definition", "note",
+                    "state", "state_type", "disorder", "sign_symptom",
+                    "example_sign_symptom", "severity",
+                    "diagnostic_specifier", "diagnostic_criterion",
+                    "disorder_category", "disorder_subcategory",
+                    "disorder_subsubcategory", "disorder_subsubsubcategory",
+                    "link"]
+
+# quoted response options of a question, such as 0="never", 1="sometimes"
+response_option_pattern = re.compile(r'[-+]?[0-9]+=".*?"')
+
+# predicate and object label type (None: that of the object's worksheet)
+# for each Cognitive Atlas relationship type other than ASSERTS
+cogatlas_relations = {
+    "HASCITATION": (":hasBibliographicCitation", None),
+    "HASCONDITION": (":hasTaskCondition", None),
+    "HASCONTRAST": (":hasTaskContrast", 'delimited'),
+    "HASIMPLEMENTATION": (":hasTaskImplementation", 'delimited'),
+    "HASINDICATOR": (":hasTaskIndicator", 'delimited'),
+    "KINDOF": (":isKindOf", 'PascalCase'),
+    "MEASUREDBY": (":measuredBy", 'delimited'),
+    "PARTOF": (":isPartOf", 'PascalCase')}
+
+# parsed worksheets of workbooks given as file paths are cached here,
+# keyed by the workbook's SHA-256 digest ($XDG_CACHE_HOME/mhdb or ~/.cache/mhdb)
+cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME') or
+                         os.path.join(os.path.expanduser('~'), '.cache'),
+                         'mhdb')
+
+
+def add_to_statements(subject, predicate, object, statements=None,
+                      exclude_list=exclude_set):
     """
     Function to add predicate and object to a dictionary, after checking predicate.
 
@@ -35,8 +76,10 @@ def add_to_statements(subject, predicate, object, statements={},
     predicate: string
     object: string
     statements: dictionary
-    exclude_list: list
+        (a new dictionary if None)
+    exclude_list: set or list
         do not add statement if it contains any of these
+        (a set such as exclude_set makes each check a single hash lookup)
 
     Return
     ------
@@ -54,36 +97,37 @@ def add_to_statements(subject, predicate, object, statements={},
     >>> print(add_to_statements(":goose", ":chases", ":it"))
     {':goose': {':chases': {':it'}}}
     """
-    if subject not in exclude_list and \
-        predicate not in exclude_list and \
-        object not in exclude_list:
-        subject.strip()
-        predicate.strip()
-        object.strip()
-
-        if subject not in statements:
-            statements[subject] = {}
-        if predicate not in statements[subject]:
-            statements[subject][predicate] = {
-                object
-            }
-        else:
-            statements[subject][predicate].add(
-                object
-            )
+    if statements is None:
+        statements = {}
+    if subject in exclude_list or predicate in exclude_list or \
+            object in exclude_list:
+        return statements
+    statements.setdefault(subject, {}).setdefault(predicate, set()).add(object)
 
     return statements
 
 
-def ingest_states(states_xls, statements={}):
+def add_predicates(subject, predicates_list, statements=None,
+                   exclude_list=exclude_set):
     """
-    Function to ingest states spreadsheet
+    Function to add (predicate, object) pairs for one subject to a dictionary.
+
+    Equivalent to calling add_to_statements for each pair, but the subject
+    is checked and looked up once, and repeated pairs are checked once.
 
     Parameters
     ----------
-    states_xls: pandas ExcelFile
+    subject: string
+    predicates_list: list of 2-tuples
+        (predicate, object) pairs
+    statements: dictionary
+        (a new dictionary if None)
+    exclude_list: set or list
+        do not add statement if it contains any of these
 
-    statements:  dictionary
+    Return
+    ------
+    statements: dictionary
         key: string
             RDF subject
         value: dictionary
@@ -92,9 +136,106 @@ def ingest_states(states_xls, statements={}):
             value: {string}
                 set of RDF objects
 
+    Example
+    -------
+    >>> print(add_predicates(":goose", [(":chases", ":it"),
+    ...                                 (":chases", "EmptyValue")]))
+    {':goose': {':chases': {':it'}}}
+    """
+    if statements is None:
+        statements = {}
+    if subject in exclude_list:
+        return statements
+    subject_predicates = None
+    for predicate, object in dict.fromkeys(predicates_list):
+        if predicate in exclude_list or object in exclude_list:
+            continue
+        if subject_predicates is None:
+            subject_predicates = statements.setdefault(subject, {})
+        subject_predicates.setdefault(predicate, set()).add(object)
+
+    return statements
+
+
+def merge_statements(statements, other):
+    """
+    Function to add all statements of one dictionary to another.
+
+    Parameters
+    ----------
+    statements: dictionary
+        nested dictionary to add to (see add_to_statements)
+    other: dictionary
+        nested dictionary to add from
+
     Returns
     -------
     statements: dictionary
+        the updated first dictionary
+
+    Example
+    -------
+    >>> print(merge_statements({":goose": {":chases": {":it"}}},
+    ...                        {":duck": {":sits": {":still"}}}))
+    {':goose': {':chases': {':it'}}, ':duck': {':sits': {':still'}}}
+    """
+    for subject, predicates in other.items():
+        subject_predicates = statements.setdefault(subject, {})
+        for predicate, objects in predicates.items():
+            subject_predicates.setdefault(predicate, set()).update(objects)
+
+    return statements
+
+
+def ingest_worksheets(handlers, processes=None):
+    """
+    Function to run independent worksheet ingest functions.
+
+    Each function gets a new statements dictionary, so the results can be
+    merged (in order) with merge_statements.
+
+    Parameters
+    ----------
+    handlers: list of tuples
+        (function, arguments) pairs; each function is called with its
+        arguments and a new, empty statements dictionary as the statements
+        keyword argument, and must return that statements dictionary
+    processes: integer or None
+        number of worker processes (None or 1 runs in this process)
+
+    Returns
+    -------
+    results: list of dictionaries
+        statements returned by each function, in the order of handlers
+
+    Example
+    -------
+    >>> ingest_worksheets([(add_to_statements, (":goose", ":chases", ":it"))])
+    [{':goose': {':chases': {':it'}}}]
+    """
+    if processes and processes > 1:
+        from multiprocessing import Pool
+        with Pool(processes) as pool:
+            results = [pool.apply_async(function, arguments,
+                                        {"statements": {}})
+                       for function, arguments in handlers]
+            return [result.get() for result in results]
+
+    return [function(*arguments, statements={})
+            for function, arguments in handlers]
+
+
+def ingest_classes(classes, statements=None):
+    """
+    Function to ingest a Classes worksheet
+
+    Parameters
+    ----------
+    classes: pandas dataframe
+        Classes worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
         key: string
             RDF subject
         value: dictionary
@@ -103,159 +244,197 @@ def ingest_states(states_xls, statements={}):
             value: {string}
                 set of RDF objects
 
-    Example
+    Returns
     -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
     """
-
-    # load worksheets as pandas dataframes
-    state_classes = states_xls.parse("Classes")
-    state_properties = states_xls.parse("Properties")
-    states = states_xls.parse("states")
-    state_types = states_xls.parse("state_types")
-
-    # fill NANs with emptyValue
-    state_classes = state_classes.fillna(emptyValue)
-    state_properties = state_properties.fillna(emptyValue)
-    states = states.fillna(emptyValue)
-    state_types = state_types.fillna(emptyValue)
-
-    statements = audience_statements(statements)
-
-    # Classes worksheet
-    for row in states_classes.iterrows():
-        class_iri = check_iri(row[1]["ClassName"])
-        class_label = language_string(row[1]["label"])
+    if statements is None:
+        statements = {}
+    for (class_iri, class_label, definition, sameAs, subClassOf,
+         equivalentClasses) in zip(
+            check_iri_column(classes["ClassName"]),
+            language_string_column(classes["label"]),
+            *column_lists(classes, ["definition", "sameAs", "subClassOf"]),
+            split_column(classes["equivalentClasses"],
+                         exclude_set)):
         predicates_list = []
         predicates_list.append(("a", "rdf:Class"))
         predicates_list.append(("rdfs:label", class_label))
-        if row[1]["definition"] not in exclude_list:
+        if definition not in exclude_set:
             predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs", row[1]["sameAs"]))
-        if row[1]["equivalentClasses"] not in exclude_list:
-            equivalentClasses = row[1]["equivalentClasses"]
-            equivalentClasses = [x.strip() for x in
-                             equivalentClasses.strip().split(',') if len(x) > 0]
-            for equivalentClass in equivalentClasses:
-                if equivalentClass not in exclude_list:
-                    predicates_list.append(("rdfs:equivalentClass",
-                                            equivalentClass))
-        if row[1]["subClassOf"] not in exclude_list:
+                                    language_string(definition)))
+        if sameAs not in exclude_set:
+            predicates_list.append(("owl:sameAs", sameAs))
+        for equivalentClass in equivalentClasses:
+            predicates_list.append(("rdfs:equivalentClass", equivalentClass))
+        if subClassOf not in exclude_set:
             predicates_list.append(("rdfs:subClassOf",
-                                    check_iri(row[1]["subClassOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                class_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+                                    check_iri(subClassOf)))
+        statements = add_predicates(class_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_properties(properties, statements=None):
+    """
+    Function to ingest a Properties worksheet
+
+    Parameters
+    ----------
+    properties: pandas dataframe
+        Properties worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-    # Properties worksheet
-    for row in states_properties.iterrows():
-        property_iri = check_iri(row[1]["property"])
-        property_label = language_string(row[1]["label"])
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    for (property_iri, property_label, propertyDomain, propertyRange,
+         definition, sameAs, equivalentProperty, subPropertyOf) in zip(
+            check_iri_column(properties["property"]),
+            language_string_column(properties["label"]),
+            *column_lists(properties, ["propertyDomain", "propertyRange",
+                                       "definition", "sameAs",
+                                       "equivalentProperty",
+                                       "subPropertyOf"])):
         predicates_list = []
         predicates_list.append(("a", "rdf:Property"))
         predicates_list.append(("rdfs:label", property_label))
-        if row[1]["propertyDomain"] not in exclude_list:
+        if propertyDomain not in exclude_set:
             predicates_list.append(("rdfs:domain",
-                                    check_iri(row[1]["propertyDomain"])))
-        if row[1]["propertyRange"] not in exclude_list:
+                                    check_iri(propertyDomain)))
+        if propertyRange not in exclude_set:
             predicates_list.append(("rdfs:range",
-                                    check_iri(row[1]["propertyRange"])))
-        if row[1]["definition"] not in exclude_list:
+                                    check_iri(propertyRange)))
+        if definition not in exclude_set:
             predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
+                                    language_string(definition)))
+        if sameAs not in exclude_set:
             predicates_list.append(("owl:sameAs",
-                                    row[1]["sameAs"]))
-        if row[1]["equivalentProperty"] not in exclude_list:
+                                    sameAs))
+        if equivalentProperty not in exclude_set:
             predicates_list.append(("rdfs:equivalentProperty",
-                                    row[1]["equivalentProperty"]))
-        if row[1]["subPropertyOf"] not in exclude_list:
+                                    equivalentProperty))
+        if subPropertyOf not in exclude_set:
             predicates_list.append(("rdfs:subPropertyOf",
-                                    check_iri(row[1]["subPropertyOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                property_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
-
-    # states worksheet
-    for row in states.iterrows():
+                                    check_iri(subPropertyOf)))
+        statements = add_predicates(property_iri, predicates_list,
+                                    statements, exclude_set)
 
-        state_label = language_string(row[1]["state"])
-        state_iri = check_iri(row[1]["state"], 'PascalCase')
+    return statements
 
-        predicates_list = []
-        predicates_list.append(("rdfs:subClassOf", "m3-lite:DomainOfInterest"))
-        predicates_list.append(("rdfs:label", state_label))
 
-        indices_state_type = row[1]["indices_state_type"]
-        if indices_state_type not in exclude_list:
-            indices = [np.int(x) for x in
-                       indices_state_type.strip().split(',') if len(x)>0]
-            for index in indices:
-                objectRDF = state_types[state_types["index"] ==
-                                         index]["state_type"].values[0]
-                if isinstance(objectRDF, str):
-                    predicates_list.append((":hasDomainType",
-                                            check_iri(objectRDF, 'PascalCase')))
-        indices_state_category = row[1]["indices_state_category"]
-        if indices_state_category not in exclude_list:
-            indices = [np.int(x) for x in
-                       indices_state_category.strip().split(',') if len(x)>0]
-            for index in indices:
-                objectRDF = states[states["index"] ==
-                                         index]["state"].values[0]
-                if isinstance(objectRDF, str):
-                    predicates_list.append(("rdfs:subClassOf",
-                                            check_iri(objectRDF, 'PascalCase')))
+def ingest_references(references, statements=None):
+    """
+    Function to ingest a references worksheet
 
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                state_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+    Labels and IRIs are converted once per column before the loop; the
+    year and pubdate columns are optional.
 
-    # state_types worksheet
-    for row in state_types.iterrows():
+    Parameters
+    ----------
+    references: pandas dataframe
+        references worksheet, with NANs filled with emptyValue
 
-        state_type_label = language_string(row[1]["state_type"])
-        state_type_iri = check_iri(row[1]["state_type"], 'PascalCase')
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    references = exclude_rows(references, "title", exclude_set)
+    missing = pd.Series(emptyValue, index=references.index)
+    for (reference_iri, title_label, link, authors_label, pubdate_label,
+         year, PubMedID) in zip(
+            check_iri_column(references["title"]),
+            language_string_column(references["title"]),
+            references["link"].tolist(),
+            language_string_column(references["authors"],
+                                   exclude=exclude_set),
+            language_string_column(references.get("pubdate", missing),
+                                   exclude=exclude_set),
+            index_values(references.get("year", missing)),
+            index_values(references["PubMedID"])):
         predicates_list = []
-        predicates_list.append(("rdfs:subClassOf", ":DomainType"))
-        predicates_list.append(("rdfs:label", state_type_label))
 
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                state_type_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+        # reference IRI
+        predicates_list.append(("a", ":BibliographicResource"))
+        predicates_list.append(("rdfs:label", title_label))
+        predicates_list.append((":hasTitle", title_label))
+
+        # general columns
+        if link not in exclude_set:
+            predicates_list.append((":hasWebsite",
+                                    '"{0}"^^xsd:anyURI'.format(link)))
+
+        # research article-specific columns
+        if authors_label is not None:
+            predicates_list.append((":hasAuthorList", authors_label))
+        if pubdate_label is not None:
+            predicates_list.append((":hasPublicationDate", pubdate_label))
+        if year is not None:
+            predicates_list.append((":hasPublicationYear",
+                                    '"{0}"^^xsd:gyear'.format(year)))
+        if PubMedID is not None:
+            predicates_list.append((":hasPubMedID",
+                                    '"{0}"^^xsd:nonNegativeInteger'.format(PubMedID)))
+
+        statements = add_predicates(reference_iri, predicates_list,
+                                    statements, exclude_set)
 
     return statements
 
 
-def ingest_disorders(disorders_xls, statements={}):
+def ingest_states(states_xls, statements={}):
     """
-    Function to ingest disorders spreadsheet
+    Function to ingest states spreadsheet
 
     Parameters
     ----------
-    disorders_xls: pandas ExcelFile
+    states_xls: pandas ExcelFile or string (file path)
 
     statements:  dictionary
         key: string
@@ -279,821 +458,1926 @@ def ingest_disorders(disorders_xls, statements={}):
 
     Example
     -------
-    >>> try:
-    ...     from mhdb.spreadsheet_io import download_google_sheet
-    ...     from mhdb.write_ttl import turtle_from_dict
-    ... except:
-    ...     from mhdb.mhdb.spreadsheet_io import download_google_sheet
-    ...     from mhdb.mhdb.write_ttl import turtle_from_dict
-    >>> import os
-    >>> import pandas as pd
-    >>> try:
-    ...     disordersFILE = download_google_sheet(
-    ...         'data/disorders.xlsx',
-    ...         "13a0w3ouXq5sFCa0fBsg9xhWx67RGJJJqLjD_Oy1c3b0"
-    ...     )
-    ... except:
-    ...     disordersFILE = 'data/disorders.xlsx'
-    >>> disorders_xls = pd.ExcelFile(disordersFILE)
-    >>> behaviors_xls = pd.ExcelFile(behaviorsFILE)
-    >>> statements = ingest_disorders(disorders_xls, statements={})
-    >>> print(turtle_from_dict({
-    ...     statement: statements[
-    ...         statement
-    ...     ] for statement in statements if statement == ":despair"
-    ... }).split("\\n\\t")[0])
-    #mhdb:despair rdfs:label "despair"@en ;
     """
-    import math
-
-    # load worksheets as pandas dataframes
-    disorders_classes = disorders_xls.parse("Classes")
-    disorders_properties = disorders_xls.parse("Properties")
-    disorders = disorders_xls.parse("disorders")
-    signs_symptoms = disorders_xls.parse("signs_symptoms")
-    examples_signs_symptoms = disorders_xls.parse("examples_signs_symptoms")
-    severities = disorders_xls.parse("severities")
-    diagnostic_specifiers = disorders_xls.parse("diagnostic_specifiers")
-    diagnostic_criteria = disorders_xls.parse("diagnostic_criteria")
-    disorder_categories = disorders_xls.parse("disorder_categories")
-    disorder_subcategories = disorders_xls.parse("disorder_subcategories")
-    disorder_subsubcategories = disorders_xls.parse("disorder_subsubcategories")
-    disorder_subsubsubcategories = disorders_xls.parse("disorder_subsubsubcategories")
-    references = disorders_xls.parse("references")
-
-    # fill NANs with emptyValue
-    disorders_classes = disorders_classes.fillna(emptyValue)
-    disorders_properties = disorders_properties.fillna(emptyValue)
-    disorders = disorders.fillna(emptyValue)
-    signs_symptoms = signs_symptoms.fillna(emptyValue)
-    examples_signs_symptoms = examples_signs_symptoms.fillna(emptyValue)
-    severities = severities.fillna(emptyValue)
-    diagnostic_specifiers = diagnostic_specifiers.fillna(emptyValue)
-    diagnostic_criteria = diagnostic_criteria.fillna(emptyValue)
-    disorder_categories = disorder_categories.fillna(emptyValue)
-    disorder_subcategories = disorder_subcategories.fillna(emptyValue)
-    disorder_subsubcategories = disorder_subsubcategories.fillna(emptyValue)
-    disorder_subsubsubcategories = disorder_subsubsubcategories.fillna(emptyValue)
-    references = references.fillna(emptyValue)
-
-    # Classes worksheet
-    for row in disorders_classes.iterrows():
-        class_iri = check_iri(row[1]["ClassName"])
-        class_label = language_string(row[1]["label"])
-        predicates_list = []
-        predicates_list.append(("a", "rdf:Class"))
-        predicates_list.append(("rdfs:label", class_label))
-        if row[1]["definition"] not in exclude_list:
-            predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs", row[1]["sameAs"]))
-        if row[1]["equivalentClasses"] not in exclude_list:
-            equivalentClasses = row[1]["equivalentClasses"]
-            equivalentClasses = [x.strip() for x in
-                             equivalentClasses.strip().split(',') if len(x) > 0]
-            for equivalentClass in equivalentClasses:
-                if equivalentClass not in exclude_list:
-                    predicates_list.append(("rdfs:equivalentClass",
-                                            equivalentClass))
-        if row[1]["subClassOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subClassOf",
-                                    check_iri(row[1]["subClassOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                class_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
-
-    # Properties worksheet
-    for row in disorders_properties.iterrows():
-        property_iri = check_iri(row[1]["property"])
-        property_label = language_string(row[1]["label"])
-        predicates_list = []
-        predicates_list.append(("a", "rdf:Property"))
-        predicates_list.append(("rdfs:label", property_label))
-        if row[1]["propertyDomain"] not in exclude_list:
-            predicates_list.append(("rdfs:domain",
-                                    check_iri(row[1]["propertyDomain"])))
-        #if predicates_list == property_label:        
-        if row[1]["propertyRange"] not in exclude_list:
-            predicates_list.append(("rdfs:range",
-                                    check_iri(row[1]["propertyRange"])))
-        if row[1]["definition"] not in exclude_list:
-            predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs",
-                                    row[1]["sameAs"]))
-        if row[1]["equivalentProperty"] not in exclude_list:
-            predicates_list.append(("rdfs:equivalentProperty",
-                                    row[1]["equivalentProperty"]))
-        if row[1]["subPropertyOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subPropertyOf",
-                                    check_iri(row[1]["subPropertyOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                property_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
-
-    # signs_symptoms worksheet
-    for row in signs_symptoms.iterrows():
-        sign_symptom = row[1]["sign_symptom"].strip()
-        if sign_symptom not in exclude_list:
 
-            # sign or symptom?
-            """@
-            sign_symptom_number = np.int(row[1]["sign_symptom_number"])
-            """
-            symptom_label = language_string(sign_symptom)
-            symptom_iri = check_iri(sign_symptom, 'PascalCase')
+    # load worksheets as pandas dataframes, filling NANs with emptyValue
+    state_classes, state_properties, states, state_types = [
+        strip_columns(worksheet.fillna(emptyValue), stripped_columns)
+        for worksheet in parse_worksheets(
+            states_xls, ["Classes", "Properties", "states", "state_types"],
+            cache_dir)]
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", symptom_label))
+    statements = audience_statements(statements)
 
-            # reference
-            if row[1]["index_reference"] not in exclude_list:
-                source = references[references["index"] == row[1]["index_reference"]
-                    ]["title"].values[0]
-                source_iri = check_iri(source)
-                predicates_list.append((":isReferencedBy", source_iri))
+    # Classes and Properties worksheets
+    statements = ingest_classes(state_classes, statements)
+    statements = ingest_properties(state_properties, statements)
 
-            # specific to females/males?
-            if row[1]["index_gender"] not in exclude_list:
-                if np.int(row[1]["index_gender"]) == 1:  # female
-                    predicates_list.append(
-                        ("schema:epidemiology", ":Female"))
-                elif np.int(row[1]["index_gender"]) == 2:  # male
-                    predicates_list.append(
-                        ("schema:epidemiology", ":Male"))
-
-            # indices for disorders
-            indices_disorder = row[1]["indices_disorder"]
-            if indices_disorder not in exclude_list:
-                if isinstance(indices_disorder, float) or \
-                        isinstance(indices_disorder, int):
-                    indices_disorder = [np.int(indices_disorder)]
-                else:
-                    indices_disorder = [np.int(x) for x in
-                               indices_disorder.strip().split(',') if len(x)>0]
-                for index in indices_disorder:
-                    disorder = disorders[disorders["index"] == index
-                                        ]["disorder"].values[0]
-            """@
-                    if isinstance(disorder, str):
-                        if sign_symptom_number == 1:
-                            predicates_list.append((":isMedicalSignOf",
-                                                    check_iri(disorder, 'PascalCase')))
-                        elif sign_symptom_number == 2:
-                            predicates_list.append((":isMedicalSymptomOf",
-                                                    check_iri(disorder, 'PascalCase')))
-                        else:
-                            predicates_list.append((":isMedicalSignOrSymptomOf",
-                                                    check_iri(disorder, 'PascalCase')))
+    # states worksheet
+    state_type_by_index = lookup_by_index(state_types, "state_type")
+    state_by_index = lookup_by_index(states, "state")
+    for (state_label, state_iri, indices_state_type,
+         indices_state_category) in zip(
+            language_string_column(states["state"]),
+            check_iri_column(states["state"], 'PascalCase'),
+            split_indices(states["indices_state_type"]),
+            split_indices(states["indices_state_category"])):
 
-            """
-            """@
-            # Is the sign/symptom a subclass of other another sign/symptom?
-            indices_sign_symptom = row[1]["indices_sign_symptom"]
-            if indices_sign_symptom not in exclude_list:
-                if isinstance(indices_sign_symptom, float) or \
-                        isinstance(indices_sign_symptom, int):
-                    indices_sign_symptom1 = [np.int(indices_sign_symptom)]
-                else:
-                    indices_sign_symptom1 = [np.int(x) for x in
-                               indices_sign_symptom.strip().split(',') if len(x)>0]
-                for index in indices_sign_symptom1:
-                    #print(index)
-                    super_sign = signs_symptoms[signs_symptoms["index"] ==
-                                                  index]["sign_symptom"].values[0]
-                    if isinstance(super_sign, str):
-                        predicates_list.append(("rdfs:subClassOf",
-                                                check_iri(super_sign, 'PascalCase')))
-            """
-            """@
-            if sign_symptom_number == 1:
-               predicates_list.append(("rdfs:subClassOf", ":MedicalSign"))
-            elif sign_symptom_number == 2:
-               predicates_list.append(("rdfs:subClassOf", ":MedicalSymptom"))
-            else:
-               predicates_list.append(("rdfs:subClassOf", ":MedicalSignOrSymptom"))
-            """
+        predicates_list = []
+        predicates_list.append(("rdfs:subClassOf", "m3-lite:DomainOfInterest"))
+        predicates_list.append(("rdfs:label", state_label))
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    symptom_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+        for index in indices_state_type:
+            objectRDF = state_type_by_index.get(index)
+            if isinstance(objectRDF, str):
+                predicates_list.append((":hasDomainType",
+                                        check_iri(objectRDF, 'PascalCase')))
+        for index in indices_state_category:
+            objectRDF = state_by_index.get(index)
+            if isinstance(objectRDF, str):
+                predicates_list.append(("rdfs:subClassOf",
+                                        check_iri(objectRDF, 'PascalCase')))
 
-    # examples_signs_symptoms worksheet
-    for row in examples_signs_symptoms.iterrows():
-        example_sign_symptom = row[1]["example_sign_symptom"].strip()
-        if example_sign_symptom not in exclude_list:
+        statements = add_predicates(state_iri, predicates_list,
+                                    statements, exclude_set)
 
-            example_symptom_label = language_string(example_sign_symptom)
-            example_symptom_iri = check_iri(example_sign_symptom)
+    # state_types worksheet
+    for state_type_label, state_type_iri in zip(
+            language_string_column(state_types["state_type"]),
+            check_iri_column(state_types["state_type"], 'PascalCase')):
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", example_symptom_label))
+        predicates_list = []
+        predicates_list.append(("rdfs:subClassOf", ":DomainType"))
+        predicates_list.append(("rdfs:label", state_type_label))
 
-            indices_sign_symptom = row[1]["indices_sign_symptom"]
-            if indices_sign_symptom not in exclude_list:
-                if isinstance(indices_sign_symptom, float) or \
-                        isinstance(indices_sign_symptom, int):
-                    indices_sign_symptom2 = [np.int(indices_sign_symptom)]
-                else:
-                    indices_sign_symptom2 = [np.int(x) for x in
-                               indices_sign_symptom.strip().split(',') if len(x)>0]
-                for index in indices_sign_symptom2:
-                    objectRDF = signs_symptoms[signs_symptoms["index"] ==
-                                                 index]["sign_symptom"].values[0]
-                    if isinstance(objectRDF, str):
-                        predicates_list.append((":isExampleOf",
-                                                check_iri(objectRDF, 'PascalCase')))
+        statements = add_predicates(state_type_iri, predicates_list,
+                                    statements, exclude_set)
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    example_symptom_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    return statements
 
-    # severities worksheet
-    for row in severities.iterrows():
-        severity = row[1]["severity"].strip()
-        if severity not in exclude_list:
 
-            severity_label = language_string(severity)
-            severity_iri = check_iri(severity, 'PascalCase')
+def ingest_examples_signs_symptoms(examples_signs_symptoms, sign_symptom_by_index,
+                                   statements=None):
+    """
+    Function to ingest the examples_signs_symptoms worksheet of disorders
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", severity_label))
+    Parameters
+    ----------
+    examples_signs_symptoms: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+    sign_symptom_by_index: dictionary
+        signs_symptoms index values mapped to sign_symptom cells
 
-            if row[1]["definition"] not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["definition"])))
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            if row[1]["subClassOf"] not in exclude_list:
-                predicates_list.append(("rdfs:subClassOf",
-                                        check_iri(row[1]["subClassOf"])))
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    for (example_sign_symptom, example_symptom_label, example_symptom_iri,
+         indices_sign_symptom) in zip(
+            examples_signs_symptoms["example_sign_symptom"].tolist(),
+            language_string_column(
+                examples_signs_symptoms["example_sign_symptom"],
+                exclude=exclude_set),
+            check_iri_column(examples_signs_symptoms["example_sign_symptom"],
+                             exclude=exclude_set),
+            split_indices(examples_signs_symptoms["indices_sign_symptom"])):
+        if example_sign_symptom not in exclude_set:
+
+            predicates_list = []
+            predicates_list.append(("rdfs:label", example_symptom_label))
+
+            for index in indices_sign_symptom:
+                objectRDF = sign_symptom_by_index.get(index)
+                if isinstance(objectRDF, str):
+                    predicates_list.append((":isExampleOf",
+                                            check_iri(objectRDF, 'PascalCase')))
+
+            statements = add_predicates(example_symptom_iri, predicates_list,
+                                        statements, exclude_set)
+
+    return statements
+
+
+def ingest_severities(severities, statements=None):
+    """
+    Function to ingest the severities worksheet of disorders
+
+    Parameters
+    ----------
+    severities: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    for (severity, severity_label, severity_iri, definition, subClassOf,
+         equivalentClasses) in zip(
+            severities["severity"].tolist(),
+            language_string_column(severities["severity"],
+                                   exclude=exclude_set),
+            check_iri_column(severities["severity"], 'PascalCase',
+                             exclude_set),
+            *column_lists(severities, ["definition", "subClassOf"]),
+            split_column(severities["equivalentClasses"], exclude_set)):
+        if severity not in exclude_set:
+
+            predicates_list = []
+            predicates_list.append(("rdfs:label", severity_label))
+
+            if definition not in exclude_set:
+                predicates_list.append(("rdfs:comment",
+                                        language_string(definition)))
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
+            if subClassOf not in exclude_set:
+                predicates_list.append(("rdfs:subClassOf",
+                                        check_iri(subClassOf)))
             else:
                 predicates_list.append(("rdfs:subClassOf", ":DisorderSeverity"))
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    severity_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(severity_iri, predicates_list,
+                                        statements, exclude_set)
+
+    return statements
+
+
+def ingest_diagnostic_specifiers(diagnostic_specifiers, statements=None):
+    """
+    Function to ingest the diagnostic_specifiers worksheet of disorders
+
+    Parameters
+    ----------
+    diagnostic_specifiers: pandas dataframe
+        worksheet, with NANs filled with emptyValue
 
-    # diagnostic_specifiers worksheet
-    for row in diagnostic_specifiers.iterrows():
-        diagnostic_specifier = row[1]["diagnostic_specifier"].strip()
-        if diagnostic_specifier not in exclude_list:
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-            diagnostic_specifier_label = language_string(diagnostic_specifier)
-            diagnostic_specifier_iri = check_iri(diagnostic_specifier, 'PascalCase')
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    for (diagnostic_specifier, diagnostic_specifier_label, diagnostic_specifier_iri,
+         equivalentClasses) in zip(
+            diagnostic_specifiers["diagnostic_specifier"].tolist(),
+            language_string_column(diagnostic_specifiers["diagnostic_specifier"],
+                                   exclude=exclude_set),
+            check_iri_column(diagnostic_specifiers["diagnostic_specifier"], 'PascalCase',
+                             exclude_set),
+            split_column(diagnostic_specifiers["equivalentClasses"],
+                         exclude_set)):
+        if diagnostic_specifier not in exclude_set:
 
             predicates_list = []
             predicates_list.append(("rdfs:label", diagnostic_specifier_label))
 
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if
-                                     len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
             predicates_list.append(("rdfs:subClassOf", ":DiagnosticSpecifier"))
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    diagnostic_specifier_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(diagnostic_specifier_iri,
+                                        predicates_list, statements,
+                                        exclude_set)
+
+    return statements
+
+
+def ingest_diagnostic_criteria(diagnostic_criteria, statements=None):
+    """
+    Function to ingest the diagnostic_criteria worksheet of disorders
+
+    Parameters
+    ----------
+    diagnostic_criteria: pandas dataframe
+        worksheet, with NANs filled with emptyValue
 
-    # diagnostic_criteria worksheet
-    for row in diagnostic_criteria.iterrows():
-        diagnostic_criterion = row[1]["diagnostic_criterion"].strip()
-        if diagnostic_criterion not in exclude_list:
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-            diagnostic_criterion_label = language_string(diagnostic_criterion)
-            diagnostic_criterion_iri = check_iri(diagnostic_criterion, 'PascalCase')
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    for (diagnostic_criterion, diagnostic_criterion_label, diagnostic_criterion_iri,
+         equivalentClasses) in zip(
+            diagnostic_criteria["diagnostic_criterion"].tolist(),
+            language_string_column(diagnostic_criteria["diagnostic_criterion"],
+                                   exclude=exclude_set),
+            check_iri_column(diagnostic_criteria["diagnostic_criterion"], 'PascalCase',
+                             exclude_set),
+            split_column(diagnostic_criteria["equivalentClasses"],
+                         exclude_set)):
+        if diagnostic_criterion not in exclude_set:
 
             predicates_list = []
             predicates_list.append(("rdfs:label", diagnostic_criterion_label))
 
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if
-                                     len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
             predicates_list.append(("rdfs:subClassOf", ":DiagnosticCriterion"))
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    diagnostic_criterion_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(diagnostic_criterion_iri,
+                                        predicates_list, statements,
+                                        exclude_set)
 
-    # disorders worksheet
-    exclude_categories = []
-    for row in disorders.iterrows():
-        if row[1]["disorder"] not in exclude_list:
+    return statements
+
+
+def ingest_disorder_categories(categories, column, statements=None):
+    """
+    Function to ingest a disorder_*categories worksheet of disorders
+
+    Parameters
+    ----------
+    categories: pandas dataframe
+        disorder_categories, disorder_subcategories,
+        disorder_subsubcategories or disorder_subsubsubcategories worksheet,
+        with NANs filled with emptyValue
+    column: string
+        header of the category name column, such as "disorder_category"
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    for (category, category_label, category_iri, ICD9_code, ICD10_code,
+         equivalentClasses) in zip(
+            categories[column].tolist(),
+            language_string_column(categories[column], exclude=exclude_set),
+            check_iri_column(categories[column], 'PascalCase', exclude_set),
+            prefix_column(categories["ICD9CM"], "ICD9CM:", exclude_set),
+            prefix_column(categories["ICD10CM"], "ICD10CM:", exclude_set),
+            split_column(categories["equivalentClasses"], exclude_set)):
+        if category not in exclude_set:
+
+            predicates_list = []
+            predicates_list.append(("rdfs:label", category_label))
+
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
+            if ICD9_code:
+                predicates_list.append((":hasICD9Code", ICD9_code))
+            if ICD10_code:
+                predicates_list.append((":hasICD10Code", ICD10_code))
+            #if row[1]["subClassOf"] not in exclude_set:
+            #    predicates_list.append(("rdfs:subClassOf",
+            #                            check_iri(row[1]["subClassOf"])))
+            #else:
+            predicates_list.append(("rdfs:subClassOf", ":Disorder"))
+
+            statements = add_predicates(category_iri, predicates_list,
+                                        statements, exclude_set)
+
+    return statements
+
+
+def ingest_disorders(disorders_xls, statements={}, processes=None):
+    """
+    Function to ingest disorders spreadsheet
+
+    Parameters
+    ----------
+    disorders_xls: pandas ExcelFile or string (file path)
+
+    statements:  dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    processes: integer or None
+        number of worker processes for the independent worksheets
+        (see ingest_worksheets)
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Example
+    -------
+    >>> try:
+    ...     from mhdb.spreadsheet_io import download_google_sheet
+    ...     from mhdb.write_ttl import turtle_from_dict
+    ... except:
+    ...     from mhdb.mhdb.spreadsheet_io import download_google_sheet
+    ...     from mhdb.mhdb.write_ttl import turtle_from_dict
+    >>> import os
+    >>> import pandas as pd
+    >>> try:
+    ...     disordersFILE = download_google_sheet(
+    ...         'data/disorders.xlsx',
+    ...         "13a0w3ouXq5sFCa0fBsg9xhWx67RGJJJqLjD_Oy1c3b0"
+    ...     )
+    ... except:
+    ...     disordersFILE = 'data/disorders.xlsx'
+    >>> disorders_xls = pd.ExcelFile(disordersFILE)
+    >>> behaviors_xls = pd.ExcelFile(behaviorsFILE)
+    >>> statements = ingest_disorders(disorders_xls, statements={})
+    >>> print(turtle_from_dict({
+    ...     statement: statements[
+    ...         statement
+    ...     ] for statement in statements if statement == ":despair"
+    ... }).split("\\n\\t")[0])
+    #mhdb:despair rdfs:label "despair"@en ;
+    """
+    import math
 
-            disorder_label = row[1]["disorder"]
-            disorder_iri_label = disorder_label
+    # load worksheets as pandas dataframes, filling NANs with emptyValue
+    worksheets = parse_worksheets(disorders_xls, [
+        "Classes", "Properties", "disorders", "signs_symptoms",
+        "examples_signs_symptoms", "severities", "diagnostic_specifiers",
+        "diagnostic_criteria", "disorder_categories", "disorder_subcategories",
+        "disorder_subsubcategories", "disorder_subsubsubcategories",
+        "references"], cache_dir, usecols={
+        "signs_symptoms": ["index", "sign_symptom", "index_reference",
+                           "index_gender", "sign_symptom_number"]})
+    (disorders_classes, disorders_properties, disorders, signs_symptoms,
+     examples_signs_symptoms, severities, diagnostic_specifiers,
+     diagnostic_criteria, disorder_categories, disorder_subcategories,
+     disorder_subsubcategories, disorder_subsubsubcategories,
+     references) = [strip_columns(worksheet.fillna(emptyValue),
+                                  stripped_columns)
+                    for worksheet in worksheets]
+
+    # map index values to worksheet cells
+    reference_title_by_index = lookup_by_index(references, "title")
+    sign_symptom_by_index = lookup_by_index(signs_symptoms, "sign_symptom")
+    diagnostic_specifier_by_index = lookup_by_index(diagnostic_specifiers,
+                                                    "diagnostic_specifier")
+    diagnostic_criterion_by_index = lookup_by_index(diagnostic_criteria,
+                                                    "diagnostic_criterion")
+    severity_by_index = lookup_by_index(severities, "severity")
+    disorder_category_by_index = lookup_by_index(disorder_categories,
+                                                 "disorder_category")
+    disorder_subcategory_by_index = lookup_by_index(disorder_subcategories,
+                                                    "disorder_subcategory")
+    disorder_subsubcategory_by_index = lookup_by_index(
+        disorder_subsubcategories, "disorder_subsubcategory")
+    disorder_subsubsubcategory_by_index = lookup_by_index(
+        disorder_subsubsubcategories, "disorder_subsubsubcategory")
+
+    # IRIs of severity and category names, converted once per name
+    iri_by_name = {}
+    for worksheet, column in [
+            (severities, "severity"),
+            (disorder_categories, "disorder_category"),
+            (disorder_subcategories, "disorder_subcategory"),
+            (disorder_subsubcategories, "disorder_subsubcategory"),
+            (disorder_subsubsubcategories, "disorder_subsubsubcategory")]:
+        iri_by_name.update(zip(worksheet[column].tolist(),
+                               check_iri_column(worksheet[column],
+                                                'PascalCase', [""])))
+
+    # worksheets that refer to no other worksheet (or only to a lookup)
+    (classes_statements, properties_statements, examples_statements,
+     severities_statements, diagnostic_specifiers_statements,
+     diagnostic_criteria_statements) = ingest_worksheets([
+        (ingest_classes, (disorders_classes,)),
+        (ingest_properties, (disorders_properties,)),
+        (ingest_examples_signs_symptoms, (examples_signs_symptoms,
+                                          sign_symptom_by_index)),
+        (ingest_severities, (severities,)),
+        (ingest_diagnostic_specifiers, (diagnostic_specifiers,)),
+        (ingest_diagnostic_criteria, (diagnostic_criteria,))], processes)
+
+    # Classes and Properties worksheets
+    statements = merge_statements(statements, classes_statements)
+    statements = merge_statements(statements, properties_statements)
+
+    # signs_symptoms worksheet
+    genders = pd.to_numeric(signs_symptoms["index_gender"], errors="coerce")
+    gender_iris = np.select([genders == 1, genders == 2],  # female, male
+                            [":Female", ":Male"], default=None).tolist()
+    for (sign_symptom, symptom_label, symptom_iri, sign_symptom_number,
+         source_iri, gender_iri) in zip(
+            signs_symptoms["sign_symptom"].tolist(),
+            language_string_column(signs_symptoms["sign_symptom"],
+                                   exclude=exclude_set),
+            check_iri_column(signs_symptoms["sign_symptom"], 'PascalCase',
+                             exclude_set),
+            signs_symptoms["sign_symptom_number"].tolist(),
+            check_iri_column(signs_symptoms["index_reference"].map(
+                reference_title_by_index).fillna(emptyValue),
+                exclude=exclude_set),
+            gender_iris):
+        if sign_symptom not in exclude_set:
+
+            # sign or symptom?
+            """@
+            sign_symptom_number = int(sign_symptom_number)
+            """
+            predicates_list = []
+            predicates_list.append(("rdfs:label", symptom_label))
+
+            # reference
+            if source_iri is not None:
+                predicates_list.append((":isReferencedBy", source_iri))
+
+            # specific to females/males?
+            if gender_iri is not None:
+                predicates_list.append(("schema:epidemiology", gender_iri))
+
+            """@
+            if sign_symptom_number == 1:
+               predicates_list.append(("rdfs:subClassOf", ":MedicalSign"))
+            elif sign_symptom_number == 2:
+               predicates_list.append(("rdfs:subClassOf", ":MedicalSymptom"))
+            else:
+               predicates_list.append(("rdfs:subClassOf", ":MedicalSignOrSymptom"))
+            """
+
+            statements = add_predicates(symptom_iri, predicates_list,
+                                        statements, exclude_set)
+
+    # examples_signs_symptoms, severities, diagnostic_specifiers and
+    # diagnostic_criteria worksheets
+    for sheet_statements in [examples_statements, severities_statements,
+                             diagnostic_specifiers_statements,
+                             diagnostic_criteria_statements]:
+        statements = merge_statements(statements, sheet_statements)
+
+    # disorders worksheet
+    exclude_categories = set()
+    for (disorder, ICD9CM, ICD10CM, note,
+         index_diagnostic_specifier, index_diagnostic_inclusion_criterion,
+         index_diagnostic_inclusion_criterion2,
+         index_diagnostic_exclusion_criterion,
+         index_diagnostic_exclusion_criterion2, index_severity,
+         index_disorder_subsubsubcategory, index_disorder_subsubcategory,
+         index_disorder_subcategory, index_disorder_category,
+         equivalentClasses) in zip(
+            *column_lists(disorders, ["disorder", "ICD9CM", "ICD10CM",
+                                      "note"]),
+            *[index_values(disorders[column]) for column in [
+                "index_diagnostic_specifier",
+                "index_diagnostic_inclusion_criterion",
+                "index_diagnostic_inclusion_criterion2",
+                "index_diagnostic_exclusion_criterion",
+                "index_diagnostic_exclusion_criterion2",
+                "index_severity",
+                "index_disorder_subsubsubcategory",
+                "index_disorder_subsubcategory",
+                "index_disorder_subcategory",
+                "index_disorder_category"]],
+            split_column(disorders["equivalentClasses"], exclude_set)):
+        if disorder not in exclude_set:
+
+            # label and IRI label fragments, joined once all are known
+            label_parts = [disorder]
+            iri_label_parts = [disorder]
 
             predicates_list = []
 
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if
-                                     len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            if row[1]["ICD9CM"] not in exclude_list:
-                ICD9 = str(row[1]["ICD9CM"])
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
+            if ICD9CM not in exclude_set:
+                ICD9 = str(ICD9CM)
                 predicates_list.append((":hasICD9Code", "ICD9CM:" + ICD9))
-                disorder_label += "; ICD9CM:{0}".format(ICD9)
-                disorder_iri_label += " ICD9 {0}".format(ICD9)
-            if row[1]["ICD10CM"] not in exclude_list:
-                ICD10 = row[1]["ICD10CM"]
+                label_parts += ["; ICD9CM:", ICD9]
+                iri_label_parts += ["ICD9", ICD9]
+            if ICD10CM not in exclude_set:
+                ICD10 = ICD10CM
                 predicates_list.append((":hasICD10Code", "ICD10CM:" + ICD10))
-                disorder_label += "; ICD10CM:{0}".format(ICD10)
-                disorder_iri_label += " ICD10 {0}".format(ICD10)
-            #if row[1]["subClassOf"] not in exclude_list:
+                label_parts += ["; ICD10CM:", ICD10]
+                iri_label_parts += ["ICD10", ICD10]
+            #if row[1]["subClassOf"] not in exclude_set:
             #    predicates_list.append(("rdfs:subClassOf",
             #                            check_iri(row[1]["subClassOf"])))
-            if row[1]["note"] not in exclude_list:
+            if note not in exclude_set:
                 predicates_list.append((":hasNote",
-                                        language_string(row[1]["note"])))
-            if row[1]["index_diagnostic_specifier"] not in exclude_list:
-                diagnostic_specifier = diagnostic_specifiers[
-                diagnostic_specifiers["index"] == int(row[1]["index_diagnostic_specifier"])
-                ]["diagnostic_specifier"].values[0]
+                                        language_string(note)))
+            if index_diagnostic_specifier is not None:
+                diagnostic_specifier = diagnostic_specifier_by_index.get(
+                    index_diagnostic_specifier)
                 if isinstance(diagnostic_specifier, str):
                     predicates_list.append((":hasDiagnosticSpecifier",
                                             check_iri(diagnostic_specifier, 'PascalCase')))
-                    disorder_label += "; specifier: {0}".format(diagnostic_specifier)
-                    disorder_iri_label += " specifier {0}".format(diagnostic_specifier)
+                    label_parts += ["; specifier: ", diagnostic_specifier]
+                    iri_label_parts += ["specifier", diagnostic_specifier]
 
-            if row[1]["index_diagnostic_inclusion_criterion"] not in exclude_list:
-                diagnostic_inclusion_criterion = diagnostic_criteria[
-                diagnostic_criteria["index"] == int(row[1]["index_diagnostic_inclusion_criterion"])
-                ]["diagnostic_criterion"].values[0]
+            if index_diagnostic_inclusion_criterion is not None:
+                diagnostic_inclusion_criterion = diagnostic_criterion_by_index.get(
+                    index_diagnostic_inclusion_criterion)
                 if isinstance(diagnostic_inclusion_criterion, str):
                     predicates_list.append((":hasInclusionCriterion",
                                             check_iri(diagnostic_inclusion_criterion, 'PascalCase')))
-                    disorder_label += \
-                        "; inclusion: {0}".format(diagnostic_inclusion_criterion)
-                    disorder_iri_label += \
-                        " inclusion {0}".format(diagnostic_inclusion_criterion)
-
-            if row[1]["index_diagnostic_inclusion_criterion2"] not in exclude_list:
-                diagnostic_inclusion_criterion2 = diagnostic_criteria[
-                diagnostic_criteria["index"] == int(row[1]["index_diagnostic_inclusion_criterion2"])
-                ]["diagnostic_criterion"].values[0]
+                    label_parts += ["; inclusion: ", diagnostic_inclusion_criterion]
+                    iri_label_parts += ["inclusion", diagnostic_inclusion_criterion]
+
+            if index_diagnostic_inclusion_criterion2 is not None:
+                diagnostic_inclusion_criterion2 = diagnostic_criterion_by_index.get(
+                    index_diagnostic_inclusion_criterion2)
                 if isinstance(diagnostic_inclusion_criterion2, str):
                     predicates_list.append((":hasInclusionCriterion",
                                             check_iri(diagnostic_inclusion_criterion2, 'PascalCase')))
-                    disorder_label += \
-                        ", {0}".format(diagnostic_inclusion_criterion2)
-                    disorder_iri_label += \
-                        " {0}".format(diagnostic_inclusion_criterion2)
-
-            if row[1]["index_diagnostic_exclusion_criterion"] not in exclude_list:
-                diagnostic_exclusion_criterion = diagnostic_criteria[
-                diagnostic_criteria["index"] == int(row[1]["index_diagnostic_exclusion_criterion"])
-                ]["diagnostic_criterion"].values[0]
+                    label_parts += [", ", diagnostic_inclusion_criterion2]
+                    iri_label_parts.append(diagnostic_inclusion_criterion2)
+
+            if index_diagnostic_exclusion_criterion is not None:
+                diagnostic_exclusion_criterion = diagnostic_criterion_by_index.get(
+                    index_diagnostic_exclusion_criterion)
                 if isinstance(diagnostic_exclusion_criterion, str):
                     predicates_list.append((":hasExclusionCriterion",
                                             check_iri(diagnostic_exclusion_criterion, 'PascalCase')))
-                    disorder_label += \
-                        "; exclusion: {0}".format(diagnostic_exclusion_criterion)
-                    disorder_iri_label += \
-                        " exclusion {0}".format(diagnostic_exclusion_criterion)
-
-            if row[1]["index_diagnostic_exclusion_criterion2"] not in exclude_list:
-                diagnostic_exclusion_criterion2 = diagnostic_criteria[
-                diagnostic_criteria["index"] == int(row[1]["index_diagnostic_exclusion_criterion2"])
-                ]["diagnostic_criterion"].values[0]
+                    label_parts += ["; exclusion: ", diagnostic_exclusion_criterion]
+                    iri_label_parts += ["exclusion", diagnostic_exclusion_criterion]
+
+            if index_diagnostic_exclusion_criterion2 is not None:
+                diagnostic_exclusion_criterion2 = diagnostic_criterion_by_index.get(
+                    index_diagnostic_exclusion_criterion2)
                 if isinstance(diagnostic_exclusion_criterion2, str):
                     predicates_list.append((":hasExclusionCriterion",
                                             check_iri(diagnostic_exclusion_criterion2, 'PascalCase')))
-                    disorder_label += \
-                        ", {0}".format(diagnostic_exclusion_criterion2)
-                    disorder_iri_label += \
-                        " {0}".format(diagnostic_exclusion_criterion2)
-
-            if row[1]["index_severity"] not in exclude_list:
-                severity = severities[
-                severities["index"] == int(row[1]["index_severity"])
-                ]["severity"].values[0]
-                if isinstance(severity, str) and severity not in exclude_list:
+                    label_parts += [", ", diagnostic_exclusion_criterion2]
+                    iri_label_parts.append(diagnostic_exclusion_criterion2)
+
+            if index_severity is not None:
+                severity = severity_by_index[index_severity]
+                if isinstance(severity, str) and severity not in exclude_set:
                     predicates_list.append((":hasSeverity",
-                                            check_iri(severity, 'PascalCase')))
-                    disorder_label += \
-                        "; severity: {0}".format(severity)
-                    disorder_iri_label += \
-                        " severity {0}".format(severity)
-
-            if row[1]["index_disorder_subsubsubcategory"] not in exclude_list:
-                disorder_subsubsubcategory = disorder_subsubsubcategories[
-                    disorder_subsubsubcategories["index"] ==
-                    int(row[1]["index_disorder_subsubsubcategory"])
-                ]["disorder_subsubsubcategory"].values[0]
-                disorder_subsubcategory = disorder_subsubcategories[
-                    disorder_subsubcategories["index"] ==
-                    int(row[1]["index_disorder_subsubcategory"])
-                ]["disorder_subsubcategory"].values[0]
-                disorder_subcategory = disorder_subcategories[
-                    disorder_subcategories["index"] ==
-                    int(row[1]["index_disorder_subcategory"])
-                ]["disorder_subcategory"].values[0]
-                disorder_category = disorder_categories[
-                    disorder_categories["index"] ==
-                    int(row[1]["index_disorder_category"])
-                ]["disorder_category"].values[0]
+                                            iri_by_name[severity]))
+                    label_parts += ["; severity: ", severity]
+                    iri_label_parts += ["severity", severity]
+
+            if index_disorder_subsubsubcategory is not None:
+                disorder_subsubsubcategory = disorder_subsubsubcategory_by_index[
+                    index_disorder_subsubsubcategory]
+                disorder_subsubcategory = disorder_subsubcategory_by_index[
+                    index_disorder_subsubcategory]
+                disorder_subcategory = disorder_subcategory_by_index[
+                    index_disorder_subcategory]
+                disorder_category = disorder_category_by_index[
+                    index_disorder_category]
                 predicates_list.append(("rdfs:subClassOf",
-                                        check_iri(disorder_subsubsubcategory, 'PascalCase')))
+                                        iri_by_name[disorder_subsubsubcategory]))
                 statements = add_to_statements(
-                    check_iri(disorder_subsubsubcategory, 'PascalCase'),
+                    iri_by_name[disorder_subsubsubcategory],
                     "rdfs:subClassOf",
-                    check_iri(disorder_subsubcategory, 'PascalCase'),
+                    iri_by_name[disorder_subsubcategory],
                     statements,
-                    exclude_list
+                    exclude_set
                 )
                 if disorder_subsubcategory not in exclude_categories and \
                     disorder_subcategory not in exclude_categories:
                     statements = add_to_statements(
-                        check_iri(disorder_subsubcategory, 'PascalCase'),
+                        iri_by_name[disorder_subsubcategory],
                         "rdfs:subClassOf",
-                        check_iri(disorder_subcategory, 'PascalCase'),
+                        iri_by_name[disorder_subcategory],
                         statements,
-                        exclude_list
+                        exclude_set
                     )
                     statements = add_to_statements(
-                        check_iri(disorder_subcategory, 'PascalCase'),
+                        iri_by_name[disorder_subcategory],
                         "rdfs:subClassOf",
-                        check_iri(disorder_category, 'PascalCase'),
+                        iri_by_name[disorder_category],
                         statements,
-                        exclude_list
+                        exclude_set
                     )
-                    exclude_categories.append(disorder_subsubcategory)
-            elif row[1]["index_disorder_subsubcategory"] not in exclude_list:
-                disorder_subsubcategory = disorder_subsubcategories[
-                    disorder_subsubcategories["index"] ==
-                    int(row[1]["index_disorder_subsubcategory"])
-                ]["disorder_subsubcategory"].values[0]
-                disorder_subcategory = disorder_subcategories[
-                    disorder_subcategories["index"] ==
-                    int(row[1]["index_disorder_subcategory"])
-                ]["disorder_subcategory"].values[0]
-                disorder_category = disorder_categories[
-                    disorder_categories["index"] ==
-                    int(row[1]["index_disorder_category"])
-                ]["disorder_category"].values[0]
+                    exclude_categories.add(disorder_subsubcategory)
+            elif index_disorder_subsubcategory is not None:
+                disorder_subsubcategory = disorder_subsubcategory_by_index[
+                    index_disorder_subsubcategory]
+                disorder_subcategory = disorder_subcategory_by_index[
+                    index_disorder_subcategory]
+                disorder_category = disorder_category_by_index[
+                    index_disorder_category]
                 predicates_list.append(("rdfs:subClassOf",
-                                        check_iri(disorder_subsubcategory, 'PascalCase')))
+                                        iri_by_name[disorder_subsubcategory]))
                 statements = add_to_statements(
-                    check_iri(disorder_subsubcategory, 'PascalCase'),
+                    iri_by_name[disorder_subsubcategory],
                     "rdfs:subClassOf",
-                    check_iri(disorder_subcategory, 'PascalCase'),
+                    iri_by_name[disorder_subcategory],
                     statements,
-                    exclude_list
+                    exclude_set
                 )
                 if disorder_subcategory not in exclude_categories and \
                     disorder_category not in exclude_categories:
                     statements = add_to_statements(
-                        check_iri(disorder_subcategory, 'PascalCase'),
+                        iri_by_name[disorder_subcategory],
                         "rdfs:subClassOf",
-                        check_iri(disorder_category, 'PascalCase'),
+                        iri_by_name[disorder_category],
                         statements,
-                        exclude_list
+                        exclude_set
                     )
-                    exclude_categories.append(disorder_subcategory)
-            elif row[1]["index_disorder_subcategory"] not in exclude_list:
-                disorder_subcategory = disorder_subcategories[
-                    disorder_subcategories["index"] == int(row[1]["index_disorder_subcategory"])
-                ]["disorder_subcategory"].values[0]
-                disorder_category = disorder_categories[
-                    disorder_categories["index"] == int(row[1]["index_disorder_category"])
-                ]["disorder_category"].values[0]
+                    exclude_categories.add(disorder_subcategory)
+            elif index_disorder_subcategory is not None:
+                disorder_subcategory = disorder_subcategory_by_index[
+                    index_disorder_subcategory]
+                disorder_category = disorder_category_by_index[
+                    index_disorder_category]
                 predicates_list.append(("rdfs:subClassOf",
-                                        check_iri(disorder_subcategory, 'PascalCase')))
+                                        iri_by_name[disorder_subcategory]))
                 if disorder_category not in exclude_categories:
                     statements = add_to_statements(
-                        check_iri(disorder_subcategory, 'PascalCase'),
+                        iri_by_name[disorder_subcategory],
                         "rdfs:subClassOf",
-                        check_iri(disorder_category, 'PascalCase'),
+                        iri_by_name[disorder_category],
                         statements,
-                        exclude_list
+                        exclude_set
                     )
-                    exclude_categories.append(disorder_category)
-            elif row[1]["index_disorder_category"] not in exclude_list:
-                disorder_category = disorder_categories[
-                    disorder_categories["index"] == int(row[1]["index_disorder_category"])
-                ]["disorder_category"].values[0]
+                    exclude_categories.add(disorder_category)
+            elif index_disorder_category is not None:
+                disorder_category = disorder_category_by_index[
+                    index_disorder_category]
                 predicates_list.append(("rdfs:subClassOf",
-                                        check_iri(disorder_category, 'PascalCase')))
+                                        iri_by_name[disorder_category]))
             else:
                 predicates_list.append(("rdfs:subClassOf", ":Disorder"))
 
-            disorder_label = language_string(disorder_label)
-            disorder_iri = check_iri(disorder_iri_label, 'PascalCase')
+            disorder_label = language_string("".join(label_parts))
+            disorder_iri = check_iri(" ".join(iri_label_parts), 'PascalCase')
             predicates_list.append(("rdfs:label", disorder_label))
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    disorder_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(disorder_iri, predicates_list,
+                                        statements, exclude_set)
+
+    # disorder_categories, disorder_subcategories, disorder_subsubcategories
+    # and disorder_subsubsubcategories worksheets
+    for categories, column in [
+            (disorder_categories, "disorder_category"),
+            (disorder_subcategories, "disorder_subcategory"),
+            (disorder_subsubcategories, "disorder_subsubcategory"),
+            (disorder_subsubsubcategories, "disorder_subsubsubcategory")]:
+        statements = ingest_disorder_categories(categories, column,
+                                                statements)
+
+    # references worksheet
+    statements = ingest_references(references, statements)
+
+    return statements
+
+
+def ingest_treatments(treatments, statements=None):
+    """
+    Function to ingest the treatments worksheet of resources
+
+    Parameters
+    ----------
+    treatments: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    treatment_by_index = lookup_by_index(treatments, "treatment")
+    treatments = exclude_rows(treatments, "treatment", exclude_set)
+    for (treatment, link_definition, aliases, equivalentClasses,
+         indices_treatment) in zip(
+            *column_lists(treatments, ["treatment", "link_definition"]),
+            split_column(treatments["aliases"], exclude_set),
+            split_column(treatments["equivalentClasses"], exclude_set),
+            split_indices(treatments["indices_treatment"])):
+        predicates_list = []
+        predicates_list.append(("rdfs:label", language_string(treatment)))
+        treatment_iri = check_iri(treatment, 'PascalCase')
+
+        # indices to parent classes
+        if indices_treatment:
+            for index in indices_treatment:
+                objectRDF = treatment_by_index[index]
+                if objectRDF not in exclude_set:
+                    predicates_list.append(("rdfs:subClassOf",
+                                            check_iri(objectRDF, 'PascalCase')))
+        else:
+            predicates_list.append(("rdfs:subClassOf", ":Treatment"))
+
+        # aliases
+        for alias in aliases:
+            predicates_list.append(("rdfs:label", language_string(alias)))
+
+        if link_definition not in exclude_set:
+            predicates_list.append((":hasWebsite",
+                                    '"{0}"^^xsd:anyURI'.format(link_definition)))
+
+        # equivalentClasses
+        for equivalentClass in equivalentClasses:
+            predicates_list.append(("rdfs:equivalentClass", equivalentClass))
+
+        statements = add_predicates(treatment_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_project_types(project_types, statements=None):
+    """
+    Function to ingest the project_types worksheet of resources
+
+    Parameters
+    ----------
+    project_types: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    project_type_by_index = lookup_by_index(project_types, "project_type")
+    project_types = exclude_rows(project_types, "project_type", exclude_set)
+    for (project_type, definition, aliases, equivalentClasses,
+         indices_project_type) in zip(
+            *column_lists(project_types, ["project_type", "definition"]),
+            split_column(project_types["aliases"], exclude_set),
+            split_column(project_types["equivalentClasses"], exclude_set),
+            split_indices(project_types["indices_project_type"])):
+        project_type_iri = check_iri(project_type, 'PascalCase')
+        predicates_list = []
+        predicates_list.append(("rdfs:label", language_string(project_type)))
+        if definition not in exclude_set:
+            predicates_list.append(("rdfs:comment",
+                                    language_string(definition)))
+        # aliases
+        for alias in aliases:
+            predicates_list.append(("rdfs:label", language_string(alias)))
+
+        # equivalentClasses
+        for equivalentClass in equivalentClasses:
+            predicates_list.append(("rdfs:equivalentClass", equivalentClass))
+        # subClassOf
+        if indices_project_type:
+            for index in indices_project_type:
+                objectRDF = project_type_by_index[index]
+                if objectRDF not in exclude_set:
+                    predicates_list.append(("rdfs:subClassOf",
+                                            check_iri(objectRDF, 'PascalCase')))
+        else:
+            predicates_list.append(("rdfs:subClassOf", ":ProjectCategory"))
+
+        statements = add_predicates(project_type_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_feature_types(feature_types, statements=None):
+    """
+    Function to ingest the feature_types worksheet of resources
+
+    Parameters
+    ----------
+    feature_types: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    feature_types = exclude_rows(feature_types, "feature_type", exclude_set)
+    for feature_type_name in feature_types["feature_type"].tolist():
+        predicates_list = []
+        feature_type_iri = check_iri(feature_type_name)
+        feature_type_label = language_string(feature_type_name)
+        predicates_list.append(("a", ":FeatureType"))
+        predicates_list.append(("rdfs:label", feature_type_label))
+
+        statements = add_predicates(feature_type_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_customizations(customizations, feature_types, statements=None):
+    """
+    Function to ingest the customizations worksheet of resources
+
+    Parameters
+    ----------
+    customizations: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+    feature_types: pandas dataframe
+        feature_types worksheet, for index lookups
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    customization_by_index = lookup_by_index(customizations, "customization")
+    feature_type_by_index = lookup_by_index(feature_types, "feature_type")
+    customizations = exclude_rows(customizations, "customization", exclude_set)
+    for (customization_name, index_feature_type,
+         indices_customization) in zip(
+            *column_lists(customizations, ["customization",
+                                           "index_feature_type"]),
+            split_indices(customizations["indices_customization"])):
+        predicates_list = []
+        customization_iri = check_iri(customization_name)
+        customization_label = language_string(customization_name)
+        predicates_list.append(("a", ":CustomizationFeature"))
+        predicates_list.append(("rdfs:label", customization_label))
+
+        # indices to parent classes
+        for index in indices_customization:
+            objectRDF = customization_by_index[index]
+            if objectRDF not in exclude_set:
+                predicates_list.append(("rdfs:subClassOf",
+                                        check_iri(objectRDF, 'PascalCase')))
+
+        # index to feature_type
+        if index_feature_type not in exclude_set:
+            objectRDF = feature_type_by_index[index_feature_type]
+            if objectRDF not in exclude_set:
+                predicates_list.append((":hasFeatureType",
+                                        check_iri(objectRDF, 'PascalCase')))
+
+        statements = add_predicates(customization_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_privacy_and_data(privacy_and_data, statements=None):
+    """
+    Function to ingest the privacy_and_data worksheet of resources
+
+    Parameters
+    ----------
+    privacy_and_data: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    privacy_and_data_by_index = lookup_by_index(privacy_and_data, "privacy_and_data")
+    privacy_and_data = exclude_rows(privacy_and_data, "privacy_and_data", exclude_set)
+    for privacy_and_data_name, index_privacy_and_data in zip(*column_lists(
+            privacy_and_data, ["privacy_and_data", "index_privacy_and_data"])):
+        predicates_list = []
+        privacy_and_data_iri = check_iri(privacy_and_data_name)
+        privacy_and_data_label = language_string(privacy_and_data_name)
+        predicates_list.append(("a", ":Feature"))
+        predicates_list.append((":hasFeatureType", check_iri("data_privacy", 'PascalCase')))
+        predicates_list.append(("rdfs:label", privacy_and_data_label))
+
+        # index to parent class
+        if index_privacy_and_data not in exclude_set:
+            objectRDF = privacy_and_data_by_index[index_privacy_and_data]
+            if objectRDF not in exclude_set:
+                predicates_list.append(("rdfs:subClassOf",
+                                        check_iri(objectRDF, 'PascalCase')))
+
+        statements = add_predicates(privacy_and_data_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_operating_systems(operating_systems, statements=None):
+    """
+    Function to ingest the operating_systems worksheet of resources
+
+    Parameters
+    ----------
+    operating_systems: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    operating_systems = exclude_rows(operating_systems, "operating_system", exclude_set)
+    for operating_system_name in operating_systems["operating_system"].tolist():
+        predicates_list = []
+        operating_system_iri = check_iri(operating_system_name)
+        operating_system_label = language_string(operating_system_name)
+        predicates_list.append(("a", ":OperatingSystem"))
+        predicates_list.append(("rdfs:label", operating_system_label))
+
+        statements = add_predicates(operating_system_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_costs(costs, statements=None):
+    """
+    Function to ingest the costs worksheet of resources
+
+    Parameters
+    ----------
+    costs: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    costs = exclude_rows(costs, "cost", exclude_set)
+    for cost_name in costs["cost"].tolist():
+        predicates_list = []
+        cost_iri = check_iri(cost_name)
+        cost_label = language_string(cost_name)
+        predicates_list.append(("a", ":CostType"))
+        predicates_list.append(("rdfs:label", cost_label))
+
+        statements = add_predicates(cost_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_organization_types(organization_types, statements=None):
+    """
+    Function to ingest the organization_types worksheet of resources
+
+    Parameters
+    ----------
+    organization_types: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    for organization_type_name in organization_types["organization_type"].tolist():
+
+        predicates_list = []
+        organization_type_iri = None
+        if organization_type_name not in exclude_set:
+            organization_type_iri = check_iri(organization_type_name)
+            organization_type_label = language_string(organization_type_name)
+            predicates_list.append(("a", ":OrganizationType"))
+            predicates_list.append(("rdfs:label", organization_type_label))
+
+        statements = add_predicates(organization_type_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_groups(groups, organization_types, statements=None):
+    """
+    Function to ingest the groups worksheet of resources
+
+    Parameters
+    ----------
+    groups: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+    organization_types: pandas dataframe
+        organization_types worksheet, for index lookups
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    organization_type_by_index = lookup_by_index(organization_types, "organization_type")
+    for (group_name, organization, link, abbreviation, member,
+         index_organization_type) in zip(*column_lists(
+            groups, ["group", "organization", "link", "abbreviation", "member",
+                     "index_organization_type"])):
+        predicates_list = []
+        subject_iri = None
+        if group_name not in exclude_set:
+            group_iri = check_iri(group_name)
+            group_label = language_string(group_name)
+            predicates_list.append(("a", ":Group"))
+            predicates_list.append(("rdfs:label", group_label))
+            subject_iri = group_iri
 
-    # disorder_categories worksheet
-    for row in disorder_categories.iterrows():
-        disorder_category = row[1]["disorder_category"].strip()
-        if disorder_category not in exclude_list:
+        if organization not in exclude_set:
+            org_name = organization
+            organization_iri = check_iri(org_name)
+            statements = add_to_statements(organization_iri, "a",
+                                           ":Organization", statements,
+                                           exclude_set)
+            statements = add_to_statements(organization_iri, "rdfs:label",
+                                           language_string(
+                                               organization),
+                                           statements, exclude_set)
+            if subject_iri:
+                subject_iri = check_iri(group_name + "_" + org_name)
+                predicates_list.append(
+                    (":isGroupMemberOf", organization_iri))
+            else:
+                subject_iri = organization_iri
 
-            disorder_category_label = language_string(disorder_category)
-            disorder_category_iri = check_iri(disorder_category, 'PascalCase')
+        if subject_iri:
+            if link not in exclude_set:
+                predicates_list.append((":hasWebsite",
+                                        '"{0}"^^xsd:anyURI'.format(link)))
+            if abbreviation not in exclude_set:
+                predicates_list.append((":hasAbbreviation",
+                                        check_iri(abbreviation)))
+            if member not in exclude_set:
+                member_iri = check_iri(member)
+                member_label = language_string(member)
+                statements = add_to_statements(member_iri, "a", ":Person",
+                                               statements, exclude_set)
+                statements = add_to_statements(member_iri, ":hasName",
+                                               member_label, statements,
+                                               exclude_set)
+                predicates_list.append((":hasMember", member_iri))
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", disorder_category_label))
-
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if
-                                     len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            if row[1]["ICD9CM"] not in exclude_list:
-                ICD9 = str(row[1]["ICD9CM"])
-                predicates_list.append((":hasICD9Code", "ICD9CM:" + ICD9))
-                disorder_label += "; ICD9CM:{0}".format(ICD9)
-                disorder_iri_label += " ICD9 {0}".format(ICD9)
-            if row[1]["ICD10CM"] not in exclude_list:
-                ICD10 = row[1]["ICD10CM"]
-                predicates_list.append((":hasICD10Code", "ICD10CM:" + ICD10))
-                disorder_label += "; ICD10CM:{0}".format(ICD10)
-                disorder_iri_label += " ICD10 {0}".format(ICD10)
-            #if row[1]["subClassOf"] not in exclude_list:
-            #    predicates_list.append(("rdfs:subClassOf",
-            #                            check_iri(row[1]["subClassOf"])))
-            #else:
-            predicates_list.append(("rdfs:subClassOf", ":Disorder"))
+            if index_organization_type not in exclude_set:
+                objectRDF = organization_type_by_index[index_organization_type]
+                if objectRDF not in exclude_set:
+                    statements = add_to_statements(subject_iri, ":hasOrganizationType",
+                        check_iri(objectRDF, 'PascalCase'), statements, exclude_set)
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    disorder_category_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(subject_iri, predicates_list,
+                                        statements, exclude_set)
 
-    # disorder_subcategories worksheet
-    for row in disorder_subcategories.iterrows():
-        disorder_subcategory = row[1]["disorder_subcategory"].strip()
-        if disorder_subcategory not in exclude_list:
+    return statements
 
-            disorder_subcategory_label = language_string(disorder_subcategory)
-            disorder_subcategory_iri = check_iri(disorder_subcategory, 'PascalCase')
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", disorder_subcategory_label))
-
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if
-                                     len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            if row[1]["ICD9CM"] not in exclude_list:
-                ICD9 = str(row[1]["ICD9CM"])
-                predicates_list.append((":hasICD9Code", "ICD9CM:" + ICD9))
-                disorder_label += "; ICD9CM:{0}".format(ICD9)
-                disorder_iri_label += " ICD9 {0}".format(ICD9)
-            if row[1]["ICD10CM"] not in exclude_list:
-                ICD10 = row[1]["ICD10CM"]
-                predicates_list.append((":hasICD10Code", "ICD10CM:" + ICD10))
-                disorder_label += "; ICD10CM:{0}".format(ICD10)
-                disorder_iri_label += " ICD10 {0}".format(ICD10)
-            #if row[1]["subClassOf"] not in exclude_list:
-            #    predicates_list.append(("rdfs:subClassOf",
-            #                            check_iri(row[1]["subClassOf"])))
-            #else:
-            predicates_list.append(("rdfs:subClassOf", ":Disorder"))
+def ingest_people(people, statements=None):
+    """
+    Function to ingest the people worksheet of resources
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    disorder_subcategory_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    Parameters
+    ----------
+    people: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    person_by_index = lookup_by_index(people, "person")
+    people = exclude_rows(people, "person", exclude_set)
+    for (person, definition, link_definition, aliases, equivalentClasses,
+         indices_person) in zip(
+            *column_lists(people, ["person", "definition",
+                                   "link_definition"]),
+            split_column(people["aliases"], exclude_set),
+            split_column(people["equivalentClasses"], exclude_set),
+            split_indices(people["indices_person"])):
+        predicates_list = []
+        predicates_list.append(("rdfs:label", language_string(person)))
+        person_iri = check_iri(person, 'PascalCase')
 
-    # disorder_subsubcategories worksheet
-    for row in disorder_subsubcategories.iterrows():
-        disorder_subsubcategory = row[1]["disorder_subsubcategory"].strip()
-        if disorder_subsubcategory not in exclude_list:
+        if definition not in exclude_set:
+            predicates_list.append(("rdfs:comment",
+                                    language_string(definition)))
+        if link_definition not in exclude_set:
+            predicates_list.append((":hasWebsite",
+                                    '"{0}"^^xsd:anyURI'.format(link_definition)))
+
+        # aliases
+        for alias in aliases:
+            predicates_list.append(("rdfs:label", language_string(alias)))
+
+        # equivalentClasses
+        for equivalentClass in equivalentClasses:
+            predicates_list.append(("rdfs:equivalentClass", equivalentClass))
+
+        # indices to parent classes
+        if indices_person:
+            for index in indices_person:
+                objectRDF = person_by_index[index]
+                if objectRDF not in exclude_set:
+                    predicates_list.append(("rdfs:subClassOf",
+                                            check_iri(objectRDF, 'PascalCase')))
+        else:
+            predicates_list.append(("rdfs:subClassOf", ":PersonType"))
 
-            disorder_subsubcategory_label = language_string(disorder_subsubcategory)
-            disorder_subsubcategory_iri = check_iri(disorder_subsubcategory, 'PascalCase')
+        statements = add_predicates(person_iri, predicates_list,
+                                    statements, exclude_set)
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", disorder_subsubcategory_label))
-
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if
-                                     len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            if row[1]["ICD9CM"] not in exclude_list:
-                ICD9 = str(row[1]["ICD9CM"])
-                predicates_list.append((":hasICD9Code", "ICD9CM:" + ICD9))
-                disorder_label += "; ICD9CM:{0}".format(ICD9)
-                disorder_iri_label += " ICD9 {0}".format(ICD9)
-            if row[1]["ICD10CM"] not in exclude_list:
-                ICD10 = row[1]["ICD10CM"]
-                predicates_list.append((":hasICD10Code", "ICD10CM:" + ICD10))
-                disorder_label += "; ICD10CM:{0}".format(ICD10)
-                disorder_iri_label += " ICD10 {0}".format(ICD10)
-            #if row[1]["subClassOf"] not in exclude_list:
-            #    predicates_list.append(("rdfs:subClassOf",
-            #                            check_iri(row[1]["subClassOf"])))
-            #else:
-            predicates_list.append(("rdfs:subClassOf", ":Disorder"))
+    return statements
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    disorder_subsubcategory_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
 
-    # disorder_subsubsubcategories worksheet
-    for row in disorder_subsubsubcategories.iterrows():
-        disorder_subsubsubcategory = row[1]["disorder_subsubsubcategory"].strip()
-        if disorder_subsubsubcategory not in exclude_list:
+def ingest_languages(languages, statements=None):
+    """
+    Function to ingest the languages worksheet of resources
 
-            disorder_subsubsubcategory_label = language_string(disorder_subsubsubcategory)
-            disorder_subsubsubcategory_iri = check_iri(disorder_subsubsubcategory, 'PascalCase')
+    Parameters
+    ----------
+    languages: pandas dataframe
+        worksheet, with NANs filled with emptyValue
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", disorder_subsubsubcategory_label))
-
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if
-                                     len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            if row[1]["ICD9CM"] not in exclude_list:
-                ICD9 = str(row[1]["ICD9CM"])
-                predicates_list.append((":hasICD9Code", "ICD9CM:" + ICD9))
-                disorder_label += "; ICD9CM:{0}".format(ICD9)
-                disorder_iri_label += " ICD9 {0}".format(ICD9)
-            if row[1]["ICD10CM"] not in exclude_list:
-                ICD10 = row[1]["ICD10CM"]
-                predicates_list.append((":hasICD10Code", "ICD10CM:" + ICD10))
-                disorder_label += "; ICD10CM:{0}".format(ICD10)
-                disorder_iri_label += " ICD10 {0}".format(ICD10)
-            #if row[1]["subClassOf"] not in exclude_list:
-            #    predicates_list.append(("rdfs:subClassOf",
-            #                            check_iri(row[1]["subClassOf"])))
-            #else:
-            predicates_list.append(("rdfs:subClassOf", ":Disorder"))
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    disorder_subsubsubcategory_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    language_by_index = lookup_by_index(languages, "language")
+    languages = exclude_rows(languages, "language", exclude_set)
+    for language, index_language, equivalentClasses in zip(
+            *column_lists(languages, ["language", "index_language"]),
+            split_column(languages["equivalentClasses"], exclude_set)):
+        predicates_list = []
+        predicates_list.append(("rdfs:label", language_string(language)))
+        language_iri = check_iri(language, 'PascalCase')
+
+        # index to parent class
+        if index_language not in exclude_set:
+            objectRDF = language_by_index[index_language]
+            if objectRDF not in exclude_set:
+                predicates_list.append(("rdfs:subClassOf",
+                                        check_iri(objectRDF, 'PascalCase')))
+        else:
+            predicates_list.append(("rdfs:subClassOf", ":Language"))
+
+        # equivalentClasses
+        for equivalentClass in equivalentClasses:
+            predicates_list.append(("rdfs:equivalentClass", equivalentClass))
+
+        statements = add_predicates(language_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_licenses(licenses, statements=None):
+    """
+    Function to ingest the licenses worksheet of resources
+
+    Parameters
+    ----------
+    licenses: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    license_by_index = lookup_by_index(licenses, "license")
+    licenses = exclude_rows(licenses, "license", exclude_set)
+    for license, equivalentClasses, indices_license in zip(
+            licenses["license"].tolist(),
+            split_column(licenses["equivalentClasses"], exclude_set),
+            split_indices(licenses["indices_license"])):
+        predicates_list = []
+        predicates_list.append(("rdfs:label", language_string(license)))
+        license_iri = check_iri(license, 'PascalCase')
+
+        # equivalentClasses
+        for equivalentClass in equivalentClasses:
+            predicates_list.append(("rdfs:equivalentClass", equivalentClass))
+        # indices to parent classes
+        if indices_license:
+            for index in indices_license:
+                objectRDF = license_by_index[index]
+                if objectRDF not in exclude_set:
+                    predicates_list.append(("rdfs:subClassOf",
+                                            check_iri(objectRDF, 'PascalCase')))
+        else:
+            predicates_list.append(("rdfs:subClassOf", ":License"))
+
+        statements = add_predicates(license_iri, predicates_list,
+                                    statements, exclude_set)
+
+    return statements
+
+
+def ingest_resources(resources_xls, sensors_xls, disorders_xls, states_xls,
+                     statements={}, processes=None):
+    """
+    Function to ingest resources spreadsheet
+
+    Parameters
+    ----------
+    resources_xls: pandas ExcelFile or string (file path)
+
+    sensors_xls: pandas ExcelFile or string (file path)
+
+    disorders_xls: pandas ExcelFile or string (file path)
+
+    states_xls: pandas ExcelFile or string (file path)
+
+    statements:  dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    processes: integer or None
+        number of worker processes for the independent worksheets
+        (see ingest_worksheets)
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Example
+    -------
+    """
+
+    # load worksheets as pandas dataframes, filling NANs with emptyValue
+    # (medications worksheet not yet ingested)
+    (resources_classes, resources_properties, guide_types, guides, treatments,
+     project_types, projects, projects_like_ML, feature_types, customizations,
+     privacy_and_data, operating_systems, costs, organization_types, groups,
+     references, people, languages, licenses) = [
+        worksheet.fillna(emptyValue) for worksheet in parse_worksheets(
+            resources_xls, [
+                "Classes", "Properties", "guide_types", "guides",
+                "treatments", "project_types", "projects",
+                "projects_like_ML", "feature_types", "customizations",
+                "privacy_and_data", "operating_systems", "costs",
+                "organization_types", "groups", "references", "people",
+                "languages", "licenses"], cache_dir)]
+    disorders = parse_worksheets(disorders_xls, ["disorders"],
+                                 cache_dir)[0].fillna(emptyValue)
+
+    # map index values to worksheet cells
+    guide_type_by_index = lookup_by_index(guide_types, "guide_type")
+    person_by_index = lookup_by_index(people, "person")
+    treatment_by_index = lookup_by_index(treatments, "treatment")
+    language_by_index = lookup_by_index(languages, "language")
+    license_by_index = lookup_by_index(licenses, "license")
+    project_type_by_index = lookup_by_index(project_types, "project_type")
+    group_by_index = lookup_by_index(groups, "group")
+    organization_by_index = lookup_by_index(groups, "organization")
+    cost_by_index = lookup_by_index(costs, "cost")
+    operating_system_by_index = lookup_by_index(operating_systems, "operating_system")
+    privacy_and_data_by_index = lookup_by_index(privacy_and_data, "privacy_and_data")
+    project_by_index = lookup_by_index(projects, "project")
+    disorder_by_index = lookup_by_index(disorders, "disorder")
+    reference_title_by_index = lookup_by_index(references, "title")
+
+    # strip text cells once for the whole worksheet
+    for worksheet in [guides, groups, references, treatments, people]:
+        strip_columns(worksheet, ["link", "link_definition"])
+
+    # worksheets that refer to no other worksheet (or only to a lookup)
+    (treatments_statements, project_types_statements, feature_types_statements,
+     customizations_statements, privacy_and_data_statements,
+     operating_systems_statements, costs_statements,
+     organization_types_statements, groups_statements, people_statements,
+     languages_statements, licenses_statements) = ingest_worksheets([
+        (ingest_treatments, (treatments,)),
+        (ingest_project_types, (project_types,)),
+        (ingest_feature_types, (feature_types,)),
+        (ingest_customizations, (customizations, feature_types)),
+        (ingest_privacy_and_data, (privacy_and_data,)),
+        (ingest_operating_systems, (operating_systems,)),
+        (ingest_costs, (costs,)),
+        (ingest_organization_types, (organization_types,)),
+        (ingest_groups, (groups, organization_types)),
+        (ingest_people, (people,)),
+        (ingest_languages, (languages,)),
+        (ingest_licenses, (licenses,))], processes)
+
+    # Classes and Properties worksheets
+    statements = ingest_classes(resources_classes, statements)
+    statements = ingest_properties(resources_properties, statements)
+
+    # guide_types worksheet
+    guide_types = exclude_rows(guide_types, "guide_type", exclude_set)
+    for guide_type, subClassOf in zip(*column_lists(
+            guide_types, ["guide_type", "subClassOf"])):
+        predicates_list = []
+
+        guide_type_iri = check_iri(guide_type, 'PascalCase')
+        predicates_list.append(("rdfs:label", language_string(guide_type)))
+
+        if subClassOf not in exclude_set:
+            predicates_list.append(("rdfs:subClassOf",
+                                    check_iri(subClassOf)))
+        else:
+            predicates_list.append(("rdfs:subClassOf", ":ReferenceType"))
+
+        statements = add_predicates(guide_type_iri, predicates_list,
+                                    statements, exclude_set)
+
+    # guides worksheet
+    guides = exclude_rows(guides, "title", exclude_set)
+    for (title, link, authors, publisher, pubdate, index_subject_treatment,
+         index_language_in_mhdb, index_language_not_in_mhdb, index_license,
+         index_gender, indices_guide_type, indices_audience,
+         indices_subject_people) in zip(
+            *column_lists(
+                guides, ["title", "link", "authors", "publisher", "pubdate",
+                         "index_subject_treatment", "index_language_in_mhdb",
+                         "index_language_not_in_mhdb", "index_license"]),
+            index_values(guides["index_gender"]),
+            split_indices(guides["indices_guide_type"]),
+            split_indices(guides["indices_audience"]),
+            split_indices(guides["indices_subject_people"])):
+        predicates_list = []
+
+        # guide IRI
+        guide_iri = check_iri(title)
+        predicates_list.append(("a", ":BibliographicResource"))
+        predicates_list.append(("rdfs:label", language_string(title)))
+        predicates_list.append((":hasTitle", language_string(title)))
+
+        # link, entry date
+        if link not in exclude_set:
+            predicates_list.append((":hasWebsite",
+                                    '"{0}"^^xsd:anyURI'.format(link)))
+
+        # research article-specific columns: authors, publisher, pubdate
+        if authors not in exclude_set:
+            predicates_list.append((":hasAuthorList",
+                                    language_string(authors)))
+        if publisher not in exclude_set:
+            predicates_list.append((":hasPublisher",
+                                    check_iri(publisher)))
+        if pubdate not in exclude_set:
+            predicates_list.append((":hasPublicationDate",
+                                    language_string(pubdate)))
+
+        # guide type
+        for index in indices_guide_type:
+            objectRDF = guide_type_by_index.get(index, emptyValue)
+            if objectRDF not in exclude_set:
+                predicates_list.append((":hasReferenceType",
+                                        check_iri(objectRDF, 'PascalCase')))
+        # specific to females/males?
+        if index_gender == 1:  # female
+            predicates_list.append((":isAbout", ":Female"))
+        elif index_gender == 2:  # male
+            predicates_list.append((":isAbout", ":Male"))
+
+        # audience, subject, language, license
+        for index in indices_audience:
+            objectRDF = person_by_index.get(index, emptyValue)
+            if objectRDF not in exclude_set:
+                predicates_list.append((":hasAudienceType",
+                                        check_iri(objectRDF, 'PascalCase')))
+        for index in indices_subject_people:
+            objectRDF = person_by_index.get(index, emptyValue)
+            if objectRDF not in exclude_set:
+                predicates_list.append((":isAbout",
+                                        check_iri(objectRDF, 'PascalCase')))
+        if index_subject_treatment not in exclude_set:
+            objectRDF = treatment_by_index[index_subject_treatment]
+            if objectRDF not in exclude_set:
+                predicates_list.append((":isAbout",
+                                            check_iri(objectRDF, 'PascalCase')))
+        if index_language_in_mhdb not in exclude_set:
+            objectRDF = language_by_index[index_language_in_mhdb]
+            if objectRDF not in exclude_set:
+                predicates_list.append((":hasLanguage", check_iri(objectRDF, 'PascalCase')))
+        if index_language_not_in_mhdb not in exclude_set:
+            objectRDF = language_by_index[index_language_not_in_mhdb]
+            if objectRDF not in exclude_set:
+                predicates_list.append((":hasLanguage", check_iri(objectRDF, 'PascalCase')))
+
+        if index_license not in exclude_set:
+            objectRDF = license_by_index[index_license]
+            if objectRDF not in exclude_set:
+                predicates_list.append((":hasLicense", check_iri(objectRDF, 'PascalCase')))
+
+        statements = add_predicates(guide_iri, predicates_list,
+                                    statements, exclude_set)
+
+    # treatments worksheet
+    statements = merge_statements(statements, treatments_statements)
+
+    # project_types worksheet
+    statements = merge_statements(statements, project_types_statements)
+
+    # projects worksheet
+    # index columns that refer to other worksheets, in output order:
+    # (predicate, referenced worksheet cells by index)
+    project_references = {
+        "indices_cost": (":hasCostType", cost_by_index),
+        "indices_operating_system": (":usesOperatingSystem",
+                                     operating_system_by_index),
+        "indices_privacy_and_data": (":hasDataPrivacyFeature",
+                                     privacy_and_data_by_index),
+        "indices_languages": (":hasLanguage", language_by_index),
+        "indices_compatible_projects": (":hasCompatibleProject",
+                                        project_by_index),
+        "indices_disorders": (":isAbout", disorder_by_index)}
+    # strip link and free-text cells once for the whole worksheet
+    projects = strip_columns(projects, [
+        "link", "latest_release_date", "cost_description",
+        "data_privacy_link", "data_privacy_claims"])
+    projects = exclude_rows(projects, "project", exclude_set)
+    for (project, description, abbreviation, link, dead,
+         website_copyright_year, latest_release_date, cost_description,
+         data_privacy_link, data_privacy_claims, indices_project_type,
+         indices_group, indices_people_users, indices_reference,
+         referenced_indices) in zip(
+            *column_lists(
+                projects, ["project", "description", "abbreviation", "link",
+                           "dead", "website_copyright_year",
+                           "latest_release_date", "cost_description",
+                           "data_privacy_link", "data_privacy_claims"]),
+            *[split_indices(projects[column]) for column in [
+                "indices_project_type", "indices_group",
+                "indices_people_users", "indices_reference"]],
+            zip(*[split_indices(projects[column])
+                  for column in project_references])):
+
+        project_iri = check_iri(project)
+        project_label = language_string(project)
+
+        predicates_list = []
+        predicates_list.append(("a", ":Project"))
+        predicates_list.append(("rdfs:label", project_label))
+        if description not in exclude_set:
+            predicates_list.append(("rdfs:comment",
+                                    language_string(description)))
+        if abbreviation not in exclude_set:
+            predicates_list.append((":hasAbbreviation",
+                                    check_iri(abbreviation)))
+        if link not in exclude_set:
+            predicates_list.append((":hasWebsite",
+                                    '"{0}"^^xsd:anyURI'.format(link)))
+
+        
+        # project types
+        for index in indices_project_type:
+            project_type = project_type_by_index[index]
+            predicates_list.append((":hasProjectCategory",
+                                    check_iri(project_type, 'PascalCase')))
+        # groups
+        for index in indices_group:
+
+            group_org_iri = None
+            if group_by_index[index] not in exclude_set:
+                group_org_iri = group_by_index[index]
+            if organization_by_index[index] not in exclude_set:
+                orgname = organization_by_index[index]
+                if group_org_iri not in exclude_set and orgname not in exclude_set:
+                    group_org_iri = group_org_iri + "_" + orgname
+                else:
+                    group_org_iri = orgname
+            if group_org_iri not in exclude_set:
+                predicates_list.append((":isMaintainedByGroup",
+                                        check_iri(group_org_iri)))
+
+        # people users
+        for index in indices_people_users:
+
+            if person_by_index[index] not in exclude_set:
+                people_users_iri = person_by_index[index]
+                predicates_list.append((":isUsedBy", check_iri(people_users_iri)))
+
+        # Project dead?
+        if dead not in exclude_set and dead > 0:
+            predicates_list.append((":isMoribund", "true"))
+        if website_copyright_year not in exclude_set:
+            predicates_list.append((":hasWebsiteCopyrightYear", 
+                language_string(website_copyright_year)))
+        if latest_release_date not in exclude_set:
+            predicates_list.append((":hasLatestReleaseDate", 
+                language_string(latest_release_date)))
+
+        # cost, operating systems, data privacy, languages, compatible
+        # projects and disorders
+        for (predicate, by_index), indices in zip(
+                project_references.values(), referenced_indices):
+            for index in indices:
+                objectRDF = by_index[index]
+                if objectRDF not in exclude_set:
+                    predicates_list.append((predicate,
+                                            check_iri(objectRDF, 'PascalCase')))
+            # cost and data privacy descriptions follow their index columns
+            if predicate == ":hasCostType":
+                if cost_description not in exclude_set:
+                    predicates_list.append((":hasCostDescription", language_string(cost_description)))
+            elif predicate == ":hasDataPrivacyFeature":
+                if data_privacy_link not in exclude_set:
+                    predicates_list.append((":hasDataPrivacyWebsite",
+                                            '"{0}"^^xsd:anyURI'.format(data_privacy_link)))
+                if data_privacy_claims not in exclude_set:
+                    predicates_list.append((":hasDataPrivacyClaims", language_string(data_privacy_claims)))
+
+        # References
+        for index in indices_reference:
+            source = reference_title_by_index[index]
+            source_iri = check_iri(source)
+            predicates_list.append((":isReferencedBy", source_iri))
+
+        statements = add_predicates(project_iri, predicates_list,
+                                    statements, exclude_set)
+ 
+    # feature_types, customizations, privacy_and_data, operating_systems,
+    # costs, organization_types and groups worksheets
+    statements = merge_statements(statements, feature_types_statements)
+    statements = merge_statements(statements, customizations_statements)
+    statements = merge_statements(statements, privacy_and_data_statements)
+    statements = merge_statements(statements, operating_systems_statements)
+    statements = merge_statements(statements, costs_statements)
+    statements = merge_statements(statements, organization_types_statements)
+    statements = merge_statements(statements, groups_statements)
 
     # references worksheet
-    for row in references.iterrows():
-        title = row[1]["title"]
-        if title not in exclude_list:
+    statements = ingest_references(references, statements)
 
-            predicates_list = []
+    # people, languages and licenses worksheets
+    statements = merge_statements(statements, people_statements)
+    statements = merge_statements(statements, languages_statements)
+    statements = merge_statements(statements, licenses_statements)
 
-            # reference IRI
-            reference_iri = check_iri(title)
-            predicates_list.append(("a", ":BibliographicResource"))
-            predicates_list.append(("rdfs:label", language_string(title)))
-            predicates_list.append((":hasTitle", language_string(title)))
+    return statements
 
-            # general columns
-            link = row[1]["link"]
-            if link not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(link.strip())))
-            """
-            entry_date = row[1]["entry_date"]
-            if entry_date not in exclude_list:
-                predicates_list.append((":hasDateLastUpdated",
-                                        language_string(entry_date)))
-            """
 
-            # research article-specific columns
-            authors = row[1]["authors"]
-            year = row[1]["year"]
-            PubMedID = row[1]["PubMedID"]
-            if authors not in exclude_list:
-                predicates_list.append((":hasAuthorList",
-                                        language_string(authors)))
-            if year not in exclude_list:
-                predicates_list.append((":hasPublicationYear",
-                                        '"{0}"^^xsd:gyear'.format(int(year))))
-            if PubMedID not in exclude_list:
-                predicates_list.append((":hasPubMedID",
-                                        '"{0}"^^xsd:nonNegativeInteger'.format(int(PubMedID))))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    reference_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+def ingest_tasks(tasks, statements=None):
+    """
+    Function to ingest the tasks worksheet of assessments
+
+    Parameters
+    ----------
+    tasks: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    tasks = strip_columns(tasks.copy(), ["name"])
+    tasks = exclude_rows(tasks, "name", exclude_set)
+    for name, description, aliases in zip(
+            *column_lists(tasks, ["name", "description"]),
+            split_column(tasks["aliases"], exclude_set)):
+        task_label = language_string(name)
+        task_iri = check_iri(name, 'PascalCase')
+
+        predicates_list = []
+        predicates_list.append(("rdfs:subClassOf", ":Task"))
+        predicates_list.append(("rdfs:label", task_label))
+
+        if description not in exclude_set:
+            predicates_list.append(("rdfs:comment",
+                                    language_string(description)))
+        for alias in aliases:
+            predicates_list.append(("rdfs:label", language_string(alias)))
+
+        # # Cognitive Atlas-specific column
+        # cogatlas_node_id = check_iri(row[1]["cogatlas_node_id"])
+        # if cogatlas_node_id not in exclude_list:
+        #     predicates_list.append((":hasCognitiveAtlasNodeID",
+        #                             cogatlas_node_id))
+
+        statements = add_predicates(task_iri, predicates_list,
+                                    statements, exclude_set)
 
     return statements
 
 
-def ingest_resources(resources_xls, sensors_xls, disorders_xls, states_xls, statements={}):
+def ingest_task_implementations(implementations, tasks, projects,
+                                statements=None):
     """
-    Function to ingest resources spreadsheet
+    Function to ingest the task_implementations worksheet of assessments
 
     Parameters
     ----------
-    resources_xls: pandas ExcelFile
-
-    sensors_xls: pandas ExcelFile
-
-    disorders_xls: pandas ExcelFile
-
-    states_xls: pandas ExcelFile
+    implementations: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+    tasks: pandas dataframe
+        tasks worksheet, for index lookups
+    projects: pandas dataframe
+        projects worksheet of resources, for index lookups
 
     statements:  dictionary
+        (a new dictionary if None)
         key: string
             RDF subject
         value: dictionary
@@ -1112,1062 +2396,383 @@ def ingest_resources(resources_xls, sensors_xls, disorders_xls, states_xls, stat
                 RDF predicate
             value: {string}
                 set of RDF objects
-
-    Example
-    -------
     """
+    if statements is None:
+        statements = {}
+    implementations = strip_columns(implementations.copy(), ["implementation"])
+    implementations = exclude_rows(implementations, "implementation",
+                                   exclude_set)
+    task_by_index = lookup_by_index(tasks, "name")
+    project_by_index = lookup_by_index(projects, "project")
+    for (implementation, description, link, indices_task,
+         indices_project) in zip(
+            *column_lists(implementations,
+                          ["implementation", "description", "link"]),
+            split_indices(implementations["indices_task"]),
+            split_indices(implementations["indices_project"])):
+        implementation_label = language_string(implementation)
+        implementation_iri = check_iri(implementation)
 
-    # load worksheets as pandas dataframes
-    resources_classes = resources_xls.parse("Classes")
-    resources_properties = resources_xls.parse("Properties")
-    # guides worksheets
-    guide_types = resources_xls.parse("guide_types")
-    guides = resources_xls.parse("guides")
-    # treatments, medications worksheets
-    treatments = resources_xls.parse("treatments")
-    #medications = resources_xls.parse("medications")
-    # projects worksheets
-    project_types = resources_xls.parse("project_types")
-    projects = resources_xls.parse("projects")
-    projects_like_ML = resources_xls.parse("projects_like_ML")
-    feature_types = resources_xls.parse("feature_types")
-    customizations = resources_xls.parse("customizations")
-    privacy_and_data = resources_xls.parse("privacy_and_data")
-    operating_systems = resources_xls.parse("operating_systems")
-    costs = resources_xls.parse("costs")
-    organization_types = resources_xls.parse("organization_types")
-    groups = resources_xls.parse("groups")
-    references = resources_xls.parse("references")
-    # worksheets shared across mhdb
-    people = resources_xls.parse("people")
-    languages = resources_xls.parse("languages")
-    licenses = resources_xls.parse("licenses")
-    # imported (non-resources) worksheets
-    sensors = sensors_xls.parse("sensors")
-    measurands = sensors_xls.parse("measurands")
-    disorders = disorders_xls.parse("disorders")
-    #states = states_xls.parse("states")
-
-    # fill NANs with emptyValue
-    resources_classes = resources_classes.fillna(emptyValue)
-    resources_properties = resources_properties.fillna(emptyValue)
-    guide_types = guide_types.fillna(emptyValue)
-    guides = guides.fillna(emptyValue)
-    treatments = treatments.fillna(emptyValue)
-    #medications = medications.fillna(emptyValue)
-    project_types = project_types.fillna(emptyValue)
-    projects = projects.fillna(emptyValue)
-    projects_like_ML = projects_like_ML.fillna(emptyValue)
-    feature_types = feature_types.fillna(emptyValue)
-    customizations = customizations.fillna(emptyValue)
-    privacy_and_data = privacy_and_data.fillna(emptyValue)
-    operating_systems = operating_systems.fillna(emptyValue)
-    costs = costs.fillna(emptyValue)
-    organization_types = organization_types.fillna(emptyValue)
-    groups = groups.fillna(emptyValue)
-    references = references.fillna(emptyValue)
-    people = people.fillna(emptyValue)
-    languages = languages.fillna(emptyValue)
-    licenses = licenses.fillna(emptyValue)
-    measurands = measurands.fillna(emptyValue)
-    sensors = sensors.fillna(emptyValue)
-    disorders = disorders.fillna(emptyValue)
-    #states = states_xls.parse("states")
-
-    # Classes worksheet
-    for row in resources_classes.iterrows():
-        class_iri = check_iri(row[1]["ClassName"])
-        class_label = language_string(row[1]["label"])
-        predicates_list = []
-        predicates_list.append(("a", "rdf:Class"))
-        predicates_list.append(("rdfs:label", class_label))
-        if row[1]["definition"] not in exclude_list:
-            predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs", row[1]["sameAs"]))
-        if row[1]["equivalentClasses"] not in exclude_list:
-            equivalentClasses = row[1]["equivalentClasses"]
-            equivalentClasses = [x.strip() for x in
-                             equivalentClasses.strip().split(',') if len(x) > 0]
-            for equivalentClass in equivalentClasses:
-                if equivalentClass not in exclude_list:
-                    predicates_list.append(("rdfs:equivalentClass",
-                                            equivalentClass))
-        if row[1]["subClassOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subClassOf",
-                                    check_iri(row[1]["subClassOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                class_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
-
-    # Properties worksheet
-    for row in resources_properties.iterrows():
-        property_iri = check_iri(row[1]["property"])
-        property_label = language_string(row[1]["label"])
         predicates_list = []
-        predicates_list.append(("a", "rdf:Property"))
-        predicates_list.append(("rdfs:label", property_label))
-        if row[1]["propertyDomain"] not in exclude_list:
-            predicates_list.append(("rdfs:domain",
-                                    check_iri(row[1]["propertyDomain"])))
-        if row[1]["propertyRange"] not in exclude_list:
-            predicates_list.append(("rdfs:range",
-                                    check_iri(row[1]["propertyRange"])))
-        if row[1]["definition"] not in exclude_list:
+        predicates_list.append(("a", ":TaskImplementation"))
+        predicates_list.append(("rdfs:label", implementation_label))
+        if description not in exclude_set:
             predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs",
-                                    row[1]["sameAs"]))
-        if row[1]["equivalentProperty"] not in exclude_list:
-            predicates_list.append(("rdfs:equivalentProperty",
-                                    row[1]["equivalentProperty"]))
-        if row[1]["subPropertyOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subPropertyOf",
-                                    check_iri(row[1]["subPropertyOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                property_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
-
-    # guide_types worksheet
-    for row in guide_types.iterrows():
-        guide_type = row[1]["guide_type"]
-        if guide_type not in exclude_list:
-            predicates_list = []
-
-            guide_type_iri = check_iri(guide_type, 'PascalCase')
-            predicates_list.append(("rdfs:label", language_string(guide_type)))
-
-            if row[1]["subClassOf"] not in exclude_list:
-                predicates_list.append(("rdfs:subClassOf",
-                                        check_iri(row[1]["subClassOf"])))
-            else:
-                predicates_list.append(("rdfs:subClassOf", ":ReferenceType"))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    guide_type_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
-
-    # guides worksheet
-    for row in guides.iterrows():
-        title = row[1]["title"]
-        if title not in exclude_list:
-            predicates_list = []
-
-            # guide IRI
-            guide_iri = check_iri(title)
-            predicates_list.append(("a", ":BibliographicResource"))
-            predicates_list.append(("rdfs:label", language_string(title)))
-            predicates_list.append((":hasTitle", language_string(title)))
-
-            # link, entry date
-            if row[1]["link"] not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["link"].strip())))
-
-            # research article-specific columns: authors, publisher, pubdate
-            authors = row[1]["authors"]
-            publisher = row[1]["publisher"]
-            pubdate = row[1]["pubdate"]
-            if authors not in exclude_list:
-                predicates_list.append((":hasAuthorList",
-                                        language_string(authors)))
-            if publisher not in exclude_list:
-                predicates_list.append((":hasPublisher",
-                                        check_iri(publisher)))
-            if pubdate not in exclude_list:
-                predicates_list.append((":hasPublicationDate",
-                                        language_string(pubdate)))
-
-            # guide type
-            indices_guide_type = row[1]["indices_guide_type"]
-            if indices_guide_type not in exclude_list:
-                if isinstance(indices_guide_type, float) or \
-                        isinstance(indices_guide_type, int):
-                    indices = [np.int(indices_guide_type)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_guide_type.strip().split(',') if len(x)>0]
-                if indices not in exclude_list:
-                    for index in indices:
-                        objectRDF = guide_types[
-                            guide_types["index"] == index]["guide_type"].values[0]
-                        if objectRDF not in exclude_list:
-                            predicates_list.append((":hasReferenceType",
-                                                    check_iri(objectRDF, 'PascalCase')))
-            # specific to females/males?
-            index_gender = row[1]["index_gender"]
-            if index_gender not in exclude_list:
-                if np.int(index_gender) == 1:  # female
-                    predicates_list.append((":isAbout", ":Female"))
-                elif np.int(index_gender) == 2:  # male
-                    predicates_list.append((":isAbout", ":Male"))
-
-            # audience, subject, language, license
-            indices_audience = row[1]["indices_audience"]
-            indices_subject_people = row[1]["indices_subject_people"]
-            index_subject_treatment = row[1]["index_subject_treatment"]
-            index_language_in_mhdb = row[1]["index_language_in_mhdb"]
-            index_language_not_in_mhdb = row[1]["index_language_not_in_mhdb"]
-            index_license = row[1]["index_license"]
-
-            if indices_audience not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_audience.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = people[
-                        people["index"] == index]["person"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":hasAudienceType",
-                                                check_iri(objectRDF, 'PascalCase')))
-            if indices_subject_people not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_subject_people.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = people[
-                        people["index"] == index]["person"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":isAbout",
-                                                check_iri(objectRDF, 'PascalCase')))
-            if index_subject_treatment not in exclude_list:
-                objectRDF = treatments[treatments["index"] == index_subject_treatment]["treatment"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append((":isAbout",
-                                                check_iri(objectRDF, 'PascalCase')))
-            if index_language_in_mhdb not in exclude_list:
-                objectRDF = languages[languages["index"] ==
-                        index_language_in_mhdb]["language"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append((":hasLanguage", check_iri(objectRDF, 'PascalCase')))
-            if index_language_not_in_mhdb not in exclude_list:
-                objectRDF = languages[languages["index"] ==
-                        index_language_not_in_mhdb]["language"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append((":hasLanguage", check_iri(objectRDF, 'PascalCase')))
-
-            if index_license not in exclude_list:
-                objectRDF = licenses[licenses["index"] ==
-                                    index_license]["license"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append((":hasLicense", check_iri(objectRDF, 'PascalCase')))
-
-            # indices to other worksheets about content of the shared
-            #indices_state = row[1]["indices_state"]
-            #indices_disorder = row[1]["indices_disorder"]
-            #indices_disorder_category = row[1]["indices_disorder_category"]
-            # if indices_state not in exclude_list:
-            #     indices = [np.int(x) for x in
-            #                indices_state.strip().split(',') if len(x)>0]
-            #     for index in indices:
-            #         objectRDF = states[states["index"] == index]["state"].values[0]
-            #         if objectRDF not in exclude_list:
-            #             predicates_list.append((":isAboutDomain",
-            #                                     check_iri(objectRDF, 'PascalCase')))
-            # if indices_disorder not in exclude_list:
-            #     indices = [np.int(x) for x in
-            #                indices_disorder.strip().split(',') if len(x)>0]
-            #     for index in indices:
-            #         objectRDF = disorders[disorders["index"] ==
-            #                               index]["disorder"].values[0]
-            #         if objectRDF not in exclude_list:
-            #             predicates_list.append(("schema:about", check_iri(objectRDF, 'PascalCase')))
-            # if indices_disorder_category not in exclude_list:
-            #     indices = [np.int(x) for x in
-            #                indices_disorder_category.strip().split(',') if len(x)>0]
-            #     for index in indices:
-            #         objectRDF = disorder_categories[disorder_categories["index"] ==
-            #                          index]["disorder_category"].values[0]
-            #         if objectRDF not in exclude_list:
-            #             predicates_list.append(("schema:about", check_iri(objectRDF, 'PascalCase')))
-
-            for predicates in predicates_list:
+                                    language_string(description)))
+        if link not in exclude_set:
+            predicates_list.append((":hasWebsite",
+                                    '"{0}"^^xsd:anyURI'.format(link)))
+
+        # indices to other worksheets
+        for index in indices_task:
+            objectRDF = task_by_index[index]
+            if isinstance(objectRDF, str):
+                #predicates_list.append(("rdfs:subClassOf",
+                #                        check_iri(objectRDF, 'PascalCase')))
                 statements = add_to_statements(
-                    guide_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
-
-    # treatments worksheet
-    for row in treatments.iterrows():
-        treatment = row[1]["treatment"]
-        if treatment not in exclude_list:
+                    check_iri(objectRDF, 'PascalCase'), ":hasTaskImplementation",
+                    implementation_iri, statements, exclude_set)
+        for index in indices_project:
+            objectRDF = project_by_index[index]
+            if isinstance(objectRDF, str):
+                predicates_list.append((":hasProject",
+                                        "mhdb-resources" + check_iri(objectRDF)))
+
+        # # Cognitive Atlas-specific column
+        # cogatlas_node_id = row[1]["cogatlas_node_id"]
+        # if cogatlas_node_id not in exclude_list:
+        #     predicates_list.append((":hasCognitiveAtlasNodeID",
+        #                             check_iri(cogatlas_node_id)))
+
+        statements = add_predicates(implementation_iri, predicates_list,
+                                    statements, exclude_set)
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", language_string(treatment)))
-            treatment_iri = check_iri(treatment, 'PascalCase')
-
-            # indices to parent classes
-            if row[1]["indices_treatment"] not in exclude_list:
-                indices_treatment = row[1]["indices_treatment"]
-                if isinstance(indices_treatment, float) or \
-                        isinstance(indices_treatment, int):
-                    indices = [np.int(indices_treatment)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_treatment.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = treatments[treatments["index"] ==
-                                           index]["treatment"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("rdfs:subClassOf",
-                                                check_iri(objectRDF, 'PascalCase')))
-            else:
-                predicates_list.append(("rdfs:subClassOf", ":Treatment"))
-
-            # aliases
-            if row[1]["aliases"] not in exclude_list:
-                aliases = row[1]["aliases"].split(',')
-                for alias in aliases:
-                    predicates_list.append(("rdfs:label", language_string(alias)))
-
-            # definition
-            #if row[1]["definition"] not in exclude_list:
-            #    predicates_list.append(("rdfs:comment",
-            #                            language_string(row[1]["definition"])))
-            if row[1]["link_definition"] not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["link_definition"].strip())))
-
-            # equivalentClasses
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    treatment_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    return statements
 
-    """
-    # medications worksheet
-    for row in medications.iterrows():
-        medication = row[1]["medication"]
-        if medication not in exclude_list:
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label",
-                                    language_string(row[1]["medication"])))
-            medication_iri = check_iri(row[1]["medication"], 'PascalCase')
-
-            # indices to parent classes
-            if row[1]["indices_medication"] not in exclude_list:
-                indices = [np.int(x) for x in
-                           row[1]["indices_medication"].strip().split(',')
-                           if len(x)>0]
-                for index in indices:
-                    objectRDF = medications[medications["index"] ==
-                                           index]["medication"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("rdfs:subClassOf",
-                                                check_iri(objectRDF, 'PascalCase')))
-            else:
-                predicates_list.append(("rdfs:subClassOf", ":Medication"))
-
-            # aliases
-            if row[1]["aliases"] not in exclude_list:
-                aliases = row[1]["aliases"].split(',')
-                for alias in aliases:
-                    predicates_list.append(("rdfs:label", language_string(alias)))
-
-            # equivalentClasses
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    medication_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+def ingest_task_conditions(conditions, statements=None):
     """
+    Function to ingest the task_conditions worksheet of assessments
 
-    # project_types worksheet
-    for row in project_types.iterrows():
-        project_type = row[1]["project_type"]
-        if project_type not in exclude_list:
-
-            project_type_iri = check_iri(project_type, 'PascalCase')
-            predicates_list = []
-            predicates_list.append(("rdfs:label", language_string(project_type)))
-            if row[1]["definition"] not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["definition"])))
-            # aliases
-            if row[1]["aliases"] not in exclude_list:
-                aliases = row[1]["aliases"].split(',')
-                for alias in aliases:
-                    predicates_list.append(("rdfs:label", language_string(alias)))
-
-            # equivalentClasses
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            # subClassOf
-            if row[1]["indices_project_type"] not in exclude_list:
-                indices = [np.int(x) for x in
-                           row[1]["indices_project_type"].strip().split(',')
-                           if len(x)>0]
-                for index in indices:
-                    objectRDF = project_types[project_types["index"] ==
-                                              index]["project_type"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("rdfs:subClassOf",
-                                                check_iri(objectRDF, 'PascalCase')))
-            else:
-                predicates_list.append(("rdfs:subClassOf", ":ProjectCategory"))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    project_type_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    Parameters
+    ----------
+    conditions: pandas dataframe
+        worksheet, with NANs filled with emptyValue
 
-    # projects worksheet
-    for row in projects.iterrows():
-        project = row[1]["project"]
-        if project not in exclude_list:
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-            project_iri = check_iri(project)
-            project_label = language_string(project)
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    conditions = strip_columns(conditions.copy(), ["condition"])
+    conditions = exclude_rows(conditions, "condition", exclude_set)
+    for condition, description in zip(*column_lists(
+            conditions, ["condition", "description"])):
+        condition_label = language_string(condition)
+        condition_iri = check_iri(condition)
 
-            predicates_list = []
-            predicates_list.append(("a", ":Project"))
-            predicates_list.append(("rdfs:label", project_label))
-            if row[1]["description"] not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["description"])))
-            if row[1]["abbreviation"] not in exclude_list:
-                predicates_list.append((":hasAbbreviation",
-                                        check_iri(row[1]["abbreviation"])))
-            if row[1]["link"] not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["link"].strip())))
-
-            indices_project_type = row[1]["indices_project_type"]
-            indices_group = row[1]["indices_group"]
-            indices_people_users = row[1]["indices_people_users"]
-            indices_sensor = row[1]["indices_sensor"]
-            indices_measurand = row[1]["indices_measurand"]
-            indices_cost = row[1]["indices_cost"]
-            indices_operating_system = row[1]["indices_operating_system"]
-            indices_privacy_and_data = row[1]["indices_privacy_and_data"]
-            indices_languages = row[1]["indices_languages"]
-            indices_compatible_projects = row[1]["indices_compatible_projects"]
-            indices_disorders = row[1]["indices_disorders"]
-            indices_compatible_projects = row[1]["indices_compatible_projects"]
-            indices_reference = row[1]["indices_reference"]
-            
-            # project types
-            if indices_project_type not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_project_type.strip().split(',') if len(x)>0]
-                for index in indices:
-                    project_type = project_types[project_types["index"] ==
-                                            index]["project_type"].values[0]
-                    predicates_list.append((":hasProjectCategory",
-                                            check_iri(project_type, 'PascalCase')))
-            # groups
-            if indices_group not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_group.strip().split(',') if len(x)>0]
-                for index in indices:
-
-                    group_org_iri = None
-                    if groups[groups["index"] == index]["group"].values[0] not in exclude_list:
-                        group_org_iri = groups[groups["index"] == index]["group"].values[0]
-                    if groups[groups["index"] == index]["organization"].values[0] not in exclude_list:
-                        orgname = groups[groups["index"] == index]["organization"].values[0]
-                        if group_org_iri not in exclude_list and orgname not in exclude_list:
-                            group_org_iri = group_org_iri + "_" + orgname
-                        else:
-                            group_org_iri = orgname
-                    if group_org_iri not in exclude_list:
-                        predicates_list.append((":isMaintainedByGroup",
-                                                check_iri(group_org_iri)))
-
-            # people users
-            if indices_people_users not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_people_users.strip().split(',') if len(x)>0]
-                for index in indices:
-
-                    if people[people["index"] == index]["person"].values[0] not in exclude_list:
-                        people_users_iri = people[people["index"] == index]["person"].values[0]
-                        predicates_list.append((":isUsedBy", check_iri(people_users_iri)))
+        predicates_list = []
+        predicates_list.append(("a", ":TaskCondition"))
+        predicates_list.append(("rdfs:label", condition_label))
+        if description not in exclude_set:
+            predicates_list.append(("rdfs:comment",
+                                    language_string(description)))
 
-            """
-            # sensors and measurands
-            if indices_sensor not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_sensor.strip().split(',') if len(x)>0]
-                for index in indices:
-                    print(index)
-                    objectRDF = sensors[sensors["index"] == index]["sensor"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":hasSubSystem",
-                                                check_iri(objectRDF, 'PascalCase')))
-            if indices_measurand not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_measurand.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = measurands[measurands["index"] ==
-                                         index]["measurand"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":observes",
-                                                check_iri(objectRDF, 'PascalCase')))
-            """
+        # # Cognitive Atlas-specific column
+        # cogatlas_node_id = row[1]["cogatlas_node_id"]
+        # if cogatlas_node_id not in exclude_list:
+        #     predicates_list.append((":hasCognitiveAtlasNodeID",
+        #                             check_iri(cogatlas_node_id)))
 
-            # Project dead?
-            if row[1]["dead"] not in exclude_list and row[1]["dead"] > 0:
-                predicates_list.append((":isMoribund", "true"))
-            if row[1]["website_copyright_year"] not in exclude_list:
-                predicates_list.append((":hasWebsiteCopyrightYear", 
-                    language_string(row[1]["website_copyright_year"])))
-            if row[1]["latest_release_date"] not in exclude_list:
-                predicates_list.append((":hasLatestReleaseDate", 
-                    language_string(row[1]["latest_release_date"].strip())))
-
-            # Cost
-            if indices_cost not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_cost.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = costs[costs["index"] == index]["cost"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":hasCostType", check_iri(objectRDF, 'PascalCase')))
-            if row[1]["cost_description"] not in exclude_list:
-                predicates_list.append((":hasCostDescription", language_string(row[1]["cost_description"].strip())))
-            
-            # OS
-            if indices_operating_system not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_operating_system.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = operating_systems[operating_systems["index"] == index]["operating_system"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":usesOperatingSystem", check_iri(objectRDF, 'PascalCase')))
-
-            # Data privacy
-            if indices_privacy_and_data not in exclude_list:
-                if type(indices_privacy_and_data) == int:
-                    objectRDF = privacy_and_data[privacy_and_data["index"] == indices_privacy_and_data]["privacy_and_data"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":hasDataPrivacyFeature", check_iri(objectRDF, 'PascalCase')))
-                else:
-                    indices = [np.int(x) for x in
-                            indices_privacy_and_data.strip().split(',') if len(x)>0]
-                    for index in indices:
-                        objectRDF = privacy_and_data[privacy_and_data["index"] == index]["privacy_and_data"].values[0]
-                        if objectRDF not in exclude_list:
-                            predicates_list.append((":hasDataPrivacyFeature", check_iri(objectRDF, 'PascalCase')))
-            if row[1]["data_privacy_link"] not in exclude_list:
-                predicates_list.append((":hasDataPrivacyWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["data_privacy_link"].strip())))
-            if row[1]["data_privacy_claims"] not in exclude_list:
-                predicates_list.append((":hasDataPrivacyClaims", language_string(row[1]["data_privacy_claims"].strip())))
-
-            # Languages
-            if indices_languages not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_languages.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = languages[languages["index"] == index]["language"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":hasLanguage", check_iri(objectRDF, 'PascalCase')))
-
-            # Compatible projects
-            if indices_compatible_projects not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_compatible_projects.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = projects[projects["index"] == index]["project"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":hasCompatibleProject", check_iri(objectRDF, 'PascalCase')))
-
-            # Disorders
-            if indices_disorders not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_disorders.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = disorders[disorders["index"] == index]["disorder"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":isAbout", check_iri(objectRDF, 'PascalCase')))
-
-            # References
-            if indices_reference not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_reference.strip().split(',') if len(x)>0]
-                for index in indices:
-                    source = references[references["index"] == index]["title"].values[0]
-                    source_iri = check_iri(source)
-                    predicates_list.append((":isReferencedBy", source_iri))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    project_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
- 
-    # feature_types worksheet
-    for row in feature_types.iterrows():
+        statements = add_predicates(condition_iri, predicates_list,
+                                    statements, exclude_set)
 
-        predicates_list = []
-        if row[1]["feature_type"] not in exclude_list:
-            feature_type_name = row[1]["feature_type"]
-            feature_type_iri = check_iri(feature_type_name)
-            feature_type_label = language_string(feature_type_name)
-            predicates_list.append(("a", ":FeatureType"))
-            predicates_list.append(("rdfs:label", feature_type_label))
-
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                feature_type_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+    return statements
 
-    # customizations worksheet
-    for row in customizations.iterrows():
 
-        predicates_list = []
-        if row[1]["customization"] not in exclude_list:
-            customization_name = row[1]["customization"]
-            customization_iri = check_iri(customization_name)
-            customization_label = language_string(customization_name)
-            predicates_list.append(("a", ":CustomizationFeature"))
-            predicates_list.append(("rdfs:label", customization_label))
-
-            # indices to parent classes
-            if row[1]["indices_customization"] not in exclude_list:
-                indices_customization = row[1]["indices_customization"]
-                if isinstance(indices_customization, float) or \
-                        isinstance(indices_customization, int):
-                    indices = [np.int(indices_customization)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_customization.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = customizations[customizations["index"] ==
-                                       index]["customization"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("rdfs:subClassOf",
-                                                check_iri(objectRDF, 'PascalCase')))
+def ingest_task_contrasts(contrasts, statements=None):
+    """
+    Function to ingest the task_contrasts worksheet of assessments
 
-            # index to feature_type
-            if row[1]["index_feature_type"] not in exclude_list:
-                index_feature_type = row[1]["index_feature_type"]
-                objectRDF = feature_types[feature_types["index"] ==
-                                          index_feature_type]["feature_type"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append((":hasFeatureType",
-                                            check_iri(objectRDF, 'PascalCase')))
+    Parameters
+    ----------
+    contrasts: pandas dataframe
+        worksheet, with NANs filled with emptyValue
 
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                customization_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-    # privacy_and_data worksheet
-    for row in privacy_and_data.iterrows():
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    contrasts = strip_columns(contrasts.copy(), ["contrast"])
+    contrasts = exclude_rows(contrasts, "contrast", exclude_set)
+    for contrast in contrasts["contrast"].tolist():
+        contrast_label = language_string(contrast)
+        contrast_iri = check_iri(contrast)
 
         predicates_list = []
-        if row[1]["privacy_and_data"] not in exclude_list:
-            privacy_and_data_name = row[1]["privacy_and_data"]
-            privacy_and_data_iri = check_iri(privacy_and_data_name)
-            privacy_and_data_label = language_string(privacy_and_data_name)
-            predicates_list.append(("a", ":Feature"))
-            predicates_list.append((":hasFeatureType", check_iri("data_privacy", 'PascalCase')))
-            predicates_list.append(("rdfs:label", privacy_and_data_label))
-
-            # index to parent class
-            if row[1]["index_privacy_and_data"] not in exclude_list:
-                index_privacy_and_data = row[1]["index_privacy_and_data"]
-                objectRDF = privacy_and_data[privacy_and_data["index"] ==
-                                       index_privacy_and_data]["privacy_and_data"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append(("rdfs:subClassOf",
-                                            check_iri(objectRDF, 'PascalCase')))
+        predicates_list.append(("a", ":TaskContrast"))
+        predicates_list.append(("rdfs:label", contrast_label))
 
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                privacy_and_data_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
-
-    # operating_systems worksheet
-    for row in operating_systems.iterrows():
+        # # Cognitive Atlas-specific column
+        # cogatlas_node_id = row[1]["cogatlas_node_id"]
+        # if cogatlas_node_id not in exclude_list:
+        #     predicates_list.append((":hasCognitiveAtlasNodeID",
+        #                             check_iri(cogatlas_node_id)))
 
-        predicates_list = []
-        if row[1]["operating_system"] not in exclude_list:
-            operating_system_name = row[1]["operating_system"]
-            operating_system_iri = check_iri(operating_system_name)
-            operating_system_label = language_string(operating_system_name)
-            predicates_list.append(("a", ":OperatingSystem"))
-            predicates_list.append(("rdfs:label", operating_system_label))
-
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                operating_system_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+        statements = add_predicates(contrast_iri, predicates_list,
+                                    statements, exclude_set)
 
-    # costs worksheet
-    for row in costs.iterrows():
+    return statements
 
-        predicates_list = []
-        if row[1]["cost"] not in exclude_list:
-            cost_name = row[1]["cost"]
-            cost_iri = check_iri(cost_name)
-            cost_label = language_string(cost_name)
-            predicates_list.append(("a", ":CostType"))
-            predicates_list.append(("rdfs:label", cost_label))
-
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                cost_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
 
-    # organization_types worksheet
-    for row in organization_types.iterrows():
+def ingest_task_indicators(indicators, statements=None):
+    """
+    Function to ingest the task_indicators worksheet of assessments
 
-        predicates_list = []
-        organization_type_iri = None
-        if row[1]["organization_type"] not in exclude_list:
-            organization_type_name = row[1]["organization_type"]
-            organization_type_iri = check_iri(organization_type_name)
-            organization_type_label = language_string(organization_type_name)
-            predicates_list.append(("a", ":OrganizationType"))
-            predicates_list.append(("rdfs:label", organization_type_label))
+    Parameters
+    ----------
+    indicators: pandas dataframe
+        worksheet, with NANs filled with emptyValue
 
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                organization_type_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-    # groups worksheet: require group or organization
-    for row in groups.iterrows():
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    """
+    if statements is None:
+        statements = {}
+    indicators = strip_columns(indicators.copy(), ["indicator"])
+    indicators = exclude_rows(indicators, "indicator", exclude_set)
+    for indicator in indicators["indicator"].tolist():
+        indicator_label = language_string(indicator)
+        indicator_iri = check_iri(indicator)
 
         predicates_list = []
-        subject_iri = None
-        if row[1]["group"] not in exclude_list:
-            group_name = row[1]["group"]
-            group_iri = check_iri(group_name)
-            group_label = language_string(group_name)
-            predicates_list.append(("a", ":Group"))
-            predicates_list.append(("rdfs:label", group_label))
-            subject_iri = group_iri
+        predicates_list.append(("a", ":TaskIndicator"))
+        predicates_list.append(("rdfs:label", indicator_label))
 
-        if row[1]["organization"] not in exclude_list:
-            org_name = row[1]["organization"]
-            organization_iri = check_iri(org_name)
-            statements = add_to_statements(organization_iri, "a",
-                                           ":Organization", statements,
-                                           exclude_list)
-            statements = add_to_statements(organization_iri, "rdfs:label",
-                                           language_string(
-                                               row[1]["organization"]),
-                                           statements, exclude_list)
-            if subject_iri:
-                subject_iri = check_iri(group_name + "_" + org_name)
-                predicates_list.append(
-                    (":isGroupMemberOf", organization_iri))
-            else:
-                subject_iri = organization_iri
+        # # Cognitive Atlas-specific column
+        # cogatlas_node_id = row[1]["cogatlas_node_id"]
+        # if cogatlas_node_id not in exclude_list:
+        #     predicates_list.append((":hasCognitiveAtlasNodeID",
+        #                             check_iri(cogatlas_node_id)))
 
-        if subject_iri:
-            if row[1]["link"] not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["link"].strip())))
-            if row[1]["abbreviation"] not in exclude_list:
-                predicates_list.append((":hasAbbreviation",
-                                        check_iri(row[1]["abbreviation"])))
-            if row[1]["member"] not in exclude_list:
-                member_iri = check_iri(row[1]["member"])
-                member_label = language_string(row[1]["member"])
-                statements = add_to_statements(member_iri, "a", ":Person",
-                                               statements, exclude_list)
-                statements = add_to_statements(member_iri, ":hasName",
-                                               member_label, statements,
-                                               exclude_list)
-                predicates_list.append((":hasMember", member_iri))
+        statements = add_predicates(indicator_iri, predicates_list,
+                                    statements, exclude_set)
 
-            if row[1]["index_organization_type"] not in exclude_list:
-                objectRDF = organization_types[organization_types["index"] ==
-                    row[1]["index_organization_type"]]["organization_type"].values[0]
-                if objectRDF not in exclude_list:
-                    statements = add_to_statements(subject_iri, ":hasOrganizationType",
-                        check_iri(objectRDF, 'PascalCase'), statements, exclude_list)
+    return statements
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    subject_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
 
-    # references worksheet
-    for row in references.iterrows():
-        title = row[1]["title"]
-        if title not in exclude_list:
-            predicates_list = []
+def ingest_task_assertions(assertions_indices, tasks, implementations,
+                           indicators, conditions, contrasts, statements=None):
+    """
+    Function to ingest the task_assertions_indices worksheet of assessments
 
-            # reference IRI
-            reference_iri = check_iri(title)
-            predicates_list.append(("a", ":BibliographicResource"))
-            predicates_list.append(("rdfs:label", language_string(title)))
-            predicates_list.append((":hasTitle", language_string(title)))
+    Parameters
+    ----------
+    assertions_indices: pandas dataframe
+        worksheet, with NANs filled with emptyValue
+    tasks: pandas dataframe
+        tasks worksheet, for node lookups
+    implementations: pandas dataframe
+        task_implementations worksheet, for node lookups
+    indicators: pandas dataframe
+        task_indicators worksheet, for node lookups
+    conditions: pandas dataframe
+        task_conditions worksheet, for node lookups
+    contrasts: pandas dataframe
+        task_contrasts worksheet, for node lookups
 
-            # general columns
-            link = row[1]["link"]
-            if link not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["link"].strip())))
-
-            # research article-specific columns
-            authors = row[1]["authors"]
-            year = row[1]["year"]
-            PubMedID = row[1]["PubMedID"]
-            if authors not in exclude_list:
-                predicates_list.append((":hasAuthorList",
-                                        language_string(authors)))
-            if year not in exclude_list:
-                predicates_list.append((":hasPublicationYear",
-                                        '"{0}"^^xsd:gyear'.format(int(year))))
-            if PubMedID not in exclude_list:
-                predicates_list.append((":hasPubMedID",
-                                        '"{0}"^^xsd:nonNegativeInteger'.format(int(PubMedID))))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    reference_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    statements:  dictionary
+        (a new dictionary if None)
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-    # people worksheet
-    for row in people.iterrows():
-        person = row[1]["person"]
-        if person not in exclude_list:
+    Returns
+    -------
+    statements: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
 
-            predicates_list = []
-            predicates_list.append(("rdfs:label", language_string(person)))
-            person_iri = check_iri(person, 'PascalCase')
+    Example
+    -------
+    >>> import pandas as pd
+    >>> tasks = pd.DataFrame({"name": ["Stroop task", "go task"],
+    ...                       "cogatlas_node_id": [1, 2]})
+    >>> concepts = pd.DataFrame({"implementation": ["attention"],
+    ...                          "cogatlas_node_id": [3]})
+    >>> empty = pd.DataFrame({"cogatlas_node_id": []})
+    >>> assertions = pd.DataFrame({"cogatlas_reln_type": ["ASSERTS"],
+    ...                            "cogatlas_startNode": [1],
+    ...                            "cogatlas_endNode": [2]})
+    >>> statements = ingest_task_assertions(
+    ...     assertions, tasks, concepts.iloc[:0], empty.assign(indicator=[]),
+    ...     empty.assign(condition=[]), empty.assign(contrast=[]))
+    >>> print(statements[":StroopTask"])
+    {':assertsCognitiveAtlasConcept': {':GoTask'}}
+    >>> assertions = pd.DataFrame({"cogatlas_reln_type": ["KINDOF", "ASSERTS"],
+    ...                            "cogatlas_startNode": [1, 1],
+    ...                            "cogatlas_endNode": [2, 3]})
+    >>> statements = ingest_task_assertions(
+    ...     assertions, tasks, concepts, empty.assign(indicator=[]),
+    ...     empty.assign(condition=[]), empty.assign(contrast=[]))
+    >>> print(statements[":StroopTask"])
+    {':isKindOf': {':GoTask'}, ':assertsCognitiveAtlasConcept': {':Attention'}}
+    """
+    if statements is None:
+        statements = {}
+    # map Cognitive Atlas node ids to worksheet cells, in search order
+    node_lookups = [
+        (lookup_by_index(tasks, "name", "cogatlas_node_id"), 'PascalCase'),
+        (lookup_by_index(implementations, "implementation",
+                         "cogatlas_node_id"), 'delimited'),
+        (lookup_by_index(indicators, "indicator", "cogatlas_node_id"),
+         'delimited'),
+        (lookup_by_index(conditions, "condition", "cogatlas_node_id"),
+         'delimited'),
+        (lookup_by_index(contrasts, "contrast", "cogatlas_node_id"),
+         'delimited')]
+
+    for (cogatlas_reln_type, cogatlas_startNode,
+         cogatlas_endNode) in zip(*column_lists(
+            assertions_indices, ["cogatlas_reln_type", "cogatlas_startNode",
+                                 "cogatlas_endNode"])):
+
+        reln_type = str(cogatlas_reln_type)
+        startNode = int(cogatlas_startNode)
+        endNode = int(cogatlas_endNode)
+        subject = ""
+        object = ""
+        subject_label_type = None
+        object_label_type = None
+        predicate_iri = ""
+        object_iri = ""
+
+        # Find subject and object from the different worksheets,
+        # stopping once both are found
+        for node_lookup, label_type in node_lookups:
+            if subject in exclude_set:
+                subject = node_lookup.get(startNode, subject)
+                subject_label_type = label_type
+            if object in exclude_set:
+                object = node_lookup.get(endNode, object)
+                object_label_type = label_type
+            if subject not in exclude_set and object not in exclude_set:
+                break
+
+        if subject not in exclude_set and object not in exclude_set and not subject == object:
 
-            if row[1]["definition"] not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["definition"])))
-            if row[1]["link_definition"] not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["link_definition"].strip())))
-
-            # aliases
-            if row[1]["aliases"] not in exclude_list:
-                aliases = row[1]["aliases"].split(',')
-                for alias in aliases:
-                    predicates_list.append(("rdfs:label", language_string(alias)))
-
-            # equivalentClasses
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-
-            # indices to parent classes
-            if row[1]["indices_person"] not in exclude_list:
-                indices_person = row[1]["indices_person"]
-                if isinstance(indices_person, float) or \
-                        isinstance(indices_person, int):
-                    indices = [np.int(indices_person)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_person.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = people[people["index"] ==
-                                       index]["person"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("rdfs:subClassOf",
-                                                check_iri(objectRDF, 'PascalCase')))
-            else:
-                predicates_list.append(("rdfs:subClassOf", ":PersonType"))
+            # Build subject - predicate - object triple
+            subject_iri = check_iri(subject, subject_label_type)
 
-            for predicates in predicates_list:
+            if reln_type == "ASSERTS":
+                object_iri = check_iri(object, 'PascalCase')
+                predicate_iri = ":assertsCognitiveAtlasConcept"
+                # task -> asserts -> concept (identify concept)
                 statements = add_to_statements(
-                    person_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
+                    object_iri, "rdfs:subClassOf", ":CognitiveAtlasConcept",
+                    statements, exclude_set
                 )
-
-    # languages worksheet
-    for row in languages.iterrows():
-        language = row[1]["language"]
-        if language not in exclude_list:
-
-            predicates_list = []
-            predicates_list.append(("rdfs:label", language_string(language)))
-            language_iri = check_iri(language, 'PascalCase')
-
-            # index to parent class
-            if row[1]["index_language"] not in exclude_list:
-                objectRDF = languages[languages["index"] ==
-                                           row[1]["index_language"]]["language"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append(("rdfs:subClassOf",
-                                            check_iri(objectRDF, 'PascalCase')))
-            else:
-                predicates_list.append(("rdfs:subClassOf", ":Language"))
-
-            # equivalentClasses
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-
-            for predicates in predicates_list:
                 statements = add_to_statements(
-                    language_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
+                    object_iri, "rdfs:label", language_string(object),
+                    statements, exclude_set
                 )
+            elif reln_type in cogatlas_relations:
+                predicate_iri, relation_label_type = cogatlas_relations[
+                    reln_type]
+                object_iri = check_iri(
+                    object, relation_label_type or object_label_type)
+            # if reln_type == "HASDIFFERENCE":
+            # if reln_type == "CLASSIFIEDUNDER":
+            # if reln_type == "ISA":
+            # if reln_type == "PREDICATE":
+            # if reln_type == "PREDICATE_DEF":
+            # if reln_type == "SUBJECT":
 
-    # licenses worksheet
-    for row in licenses.iterrows():
-        license = row[1]["license"]
-        if license not in exclude_list:
-
-            predicates_list = []
-            predicates_list.append(("rdfs:label", language_string(license)))
-            license_iri = check_iri(license, 'PascalCase')
-
-            # equivalentClasses
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            # indices to parent classes
-            if row[1]["indices_license"] not in exclude_list:
-                indices_license = row[1]["indices_license"]
-                if isinstance(indices_license, float) or \
-                        isinstance(indices_license, int):
-                    indices = [np.int(indices_license)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_license.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = licenses[licenses["index"] ==
-                                           index]["license"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("rdfs:subClassOf",
-                                                check_iri(objectRDF, 'PascalCase')))
-            else:
-                predicates_list.append(("rdfs:subClassOf", ":License"))
+            if predicate_iri not in exclude_set:
+                #print('"{0}", {1}, "{2}"'.format(subject, predicate_iri, object))
 
-            for predicates in predicates_list:
                 statements = add_to_statements(
-                    license_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
+                    subject_iri, predicate_iri, object_iri,
+                    statements, exclude_set
                 )
 
     return statements
 
 
-def ingest_assessments(assessments_xls, resources_xls, disorders_xls, statements={}):
+def ingest_assessments(assessments_xls, resources_xls, disorders_xls,
+                       statements={}, processes=None):
     """
     Function to ingest assessments spreadsheet
 
     Parameters
     ----------
-    assessments_xls: pandas ExcelFile
-    resources_xls: pandas ExcelFile
-    disorders_xls: pandas ExcelFile
+    assessments_xls: pandas ExcelFile or string (file path)
+    resources_xls: pandas ExcelFile or string (file path)
+    disorders_xls: pandas ExcelFile or string (file path)
 
     statements:  dictionary
         key: string
@@ -2177,6 +2782,9 @@ def ingest_assessments(assessments_xls, resources_xls, disorders_xls, statements
                 RDF predicate
             value: {string}
                 set of RDF objects
+    processes: integer or None
+        number of worker processes for the independent worksheets
+        (see ingest_worksheets)
 
     Returns
     -------
@@ -2193,888 +2801,456 @@ def ingest_assessments(assessments_xls, resources_xls, disorders_xls, statements
     -------
     """
 
-    # load worksheets as pandas dataframes
-    assessments_classes = assessments_xls.parse("Classes")
-    assessments_properties = assessments_xls.parse("Properties")
-    # questions
-    questionnaires = assessments_xls.parse("questionnaires")
-    questions = assessments_xls.parse("questions")
-    response_types = assessments_xls.parse("response_types")
-    # tasks
-    tasks = assessments_xls.parse("tasks")
-    implementations = assessments_xls.parse("task_implementations")
-    indicators = assessments_xls.parse("task_indicators")
-    conditions = assessments_xls.parse("task_conditions")
-    contrasts = assessments_xls.parse("task_contrasts")
-    assertions_indices = assessments_xls.parse("task_assertions_indices")
-    references = assessments_xls.parse("references")
-    projects = resources_xls.parse("projects")
-    people = resources_xls.parse("people")
-    licenses = resources_xls.parse("licenses")
-    languages = resources_xls.parse("languages")
-    disorders = disorders_xls.parse("disorders")
-    disorder_categories = disorders_xls.parse("disorder_categories")
-    disorder_subcategories = disorders_xls.parse("disorder_subcategories")
-    disorder_subsubcategories = disorders_xls.parse("disorder_subsubcategories")
- 
-    # fill NANs with emptyValue
-    assessments_classes = assessments_classes.fillna(emptyValue)
-    assessments_properties = assessments_properties.fillna(emptyValue)
-    questionnaires = questionnaires.fillna(emptyValue)
-    questions = questions.fillna(emptyValue)
-    response_types = response_types.fillna(emptyValue)
-    tasks = tasks.fillna(emptyValue)
-    implementations = implementations.fillna(emptyValue)
-    indicators = indicators.fillna(emptyValue)
-    conditions = conditions.fillna(emptyValue)
-    contrasts = contrasts.fillna(emptyValue)
-    assertions_indices = assertions_indices.fillna(emptyValue)
-    references = references.fillna(emptyValue)
-    projects = projects.fillna(emptyValue)
-    people = people.fillna(emptyValue)
-    licenses = licenses.fillna(emptyValue)
-    languages = languages.fillna(emptyValue)
-    disorders = disorders.fillna(emptyValue)
-    disorder_categories = disorder_categories.fillna(emptyValue)
-    disorder_subcategories = disorder_subcategories.fillna(emptyValue)
-    disorder_subsubcategories = disorder_subsubcategories.fillna(emptyValue)
+    # load worksheets as pandas dataframes, filling NANs with emptyValue
+    (assessments_classes, assessments_properties, questionnaires, questions,
+     response_types, tasks, implementations, indicators, conditions,
+     contrasts, assertions_indices, references) = [
+        worksheet.fillna(emptyValue) for worksheet in parse_worksheets(
+            assessments_xls, [
+                "Classes", "Properties", "questionnaires", "questions",
+                "response_types", "tasks", "task_implementations",
+                "task_indicators", "task_conditions", "task_contrasts",
+                "task_assertions_indices", "references"], cache_dir)]
+    projects, people, licenses, languages = [
+        worksheet.fillna(emptyValue) for worksheet in parse_worksheets(
+            resources_xls, ["projects", "people", "licenses", "languages"],
+            cache_dir)]
+    (disorders, disorder_categories, disorder_subcategories,
+     disorder_subsubcategories) = [
+        worksheet.fillna(emptyValue) for worksheet in parse_worksheets(
+            disorders_xls, [
+                "disorders", "disorder_categories", "disorder_subcategories",
+                "disorder_subsubcategories"], cache_dir)]
+
+    # strip text cells once for the whole worksheet
+    questions = strip_columns(questions, [
+        "question", "paper_instructions_preamble", "paper_instructions",
+        "digital_instructions_preamble", "digital_instructions"])
+    for worksheet in [questionnaires, implementations, references]:
+        strip_columns(worksheet, ["link"])
+
+    # map index values to worksheet cells
+    questionnaire_title_by_index = lookup_by_index(questionnaires, "title")
+    response_type_by_index = lookup_by_index(response_types, "response_type")
+    reference_title_by_index = lookup_by_index(references, "title")
+    person_by_index = lookup_by_index(people, "person")
+    license_by_index = lookup_by_index(licenses, "license")
+    language_by_index = lookup_by_index(languages, "language")
+    disorder_by_index = lookup_by_index(disorders, "disorder")
+    disorder_category_by_index = lookup_by_index(disorder_categories,
+                                                 "disorder_category")
+    disorder_subcategory_by_index = lookup_by_index(disorder_subcategories,
+                                                    "disorder_subcategory")
+    disorder_subsubcategory_by_index = lookup_by_index(
+        disorder_subsubcategories, "disorder_subsubcategory")
+
+    # map index values to IRIs of worksheet cells
+    questionnaire_iri_by_index = check_iri_lookup(
+        questionnaire_title_by_index, exclude=exclude_set)
+    reference_iri_by_index = check_iri_lookup(reference_title_by_index,
+                                              exclude=exclude_set)
+    person_iri_by_index = check_iri_lookup(person_by_index, 'PascalCase',
+                                           exclude_set)
+    license_iri_by_index = check_iri_lookup(license_by_index, 'PascalCase',
+                                            exclude_set)
+    language_iri_by_index = check_iri_lookup(language_by_index, 'PascalCase',
+                                             exclude_set)
+    disorder_iri_by_index = check_iri_lookup(disorder_by_index, 'PascalCase',
+                                             exclude_set)
+    disorder_category_iri_by_index = check_iri_lookup(
+        disorder_category_by_index, 'PascalCase', exclude_set)
+    disorder_subcategory_iri_by_index = check_iri_lookup(
+        disorder_subcategory_by_index, 'PascalCase', exclude_set)
+    disorder_subsubcategory_iri_by_index = check_iri_lookup(
+        disorder_subsubcategory_by_index, 'PascalCase', exclude_set)
+
+    # task worksheets, which refer to no worksheet but each other
+    (tasks_statements, task_implementations_statements,
+     task_conditions_statements, task_contrasts_statements,
+     task_indicators_statements, task_assertions_statements) = \
+        ingest_worksheets([
+            (ingest_tasks, (tasks,)),
+            (ingest_task_implementations, (implementations, tasks, projects)),
+            (ingest_task_conditions, (conditions,)),
+            (ingest_task_contrasts, (contrasts,)),
+            (ingest_task_indicators, (indicators,)),
+            (ingest_task_assertions, (assertions_indices, tasks,
+                                      implementations, indicators,
+                                      conditions, contrasts))], processes)
 
     #statements = audience_statements(statements)
 
-    # Classes worksheet
-    for row in assessments_classes.iterrows():
-        class_iri = check_iri(row[1]["ClassName"])
-        class_label = language_string(row[1]["label"])
+    # Classes and Properties worksheets
+    statements = ingest_classes(assessments_classes, statements)
+    statements = ingest_properties(assessments_properties, statements)
+
+    # questionnaires worksheet
+    questionnaires = exclude_rows(questionnaires, "title", exclude_set)
+    for (title, abbreviation, description, link, authors,
+         number_of_questions, minutes_to_complete, age_min, age_max, year,
+         index_disorder_subsubcategory, index_license, index_language,
+         use_with_assessments, indices_respondent, indices_subject,
+         indices_disorder, indices_disorder_category,
+         indices_disorder_subcategory, indices_reference,
+         indices_language) in zip(
+            *column_lists(
+                questionnaires, ["title", "abbreviation", "description",
+                                 "link", "authors", "number_of_questions",
+                                 "minutes_to_complete", "age_min",
+                                 "age_max"]),
+            *[index_values(questionnaires[column]) for column in [
+                "year", "indices_disorder_subsubcategory", "index_license",
+                "index_language"]],
+            *[split_indices(questionnaires[column]) for column in [
+                "use_with_assessments", "indices_respondent",
+                "indices_subject", "indices_disorder",
+                "indices_disorder_category", "indices_disorder_subcategory",
+                "indices_reference", "indices_language_not_in_mhdb"]]):
         predicates_list = []
-        predicates_list.append(("a", "rdf:Class"))
-        predicates_list.append(("rdfs:label", class_label))
-        if row[1]["definition"] not in exclude_list:
+
+        # reference IRI
+        questionnaire_iri = check_iri(title)
+        predicates_list.append(("a", ":Questionnaire"))
+        predicates_list.append(("rdfs:label", language_string(title)))
+        predicates_list.append((":hasTitle", language_string(title)))
+
+        # general columns
+        if abbreviation not in exclude_set:
+            predicates_list.append((":hasAbbreviation",
+                                    language_string(abbreviation)))
+        if description not in exclude_set:
             predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs", row[1]["sameAs"]))
-        if row[1]["equivalentClasses"] not in exclude_list:
-            equivalentClasses = row[1]["equivalentClasses"]
-            equivalentClasses = [x.strip() for x in
-                             equivalentClasses.strip().split(',') if len(x) > 0]
-            for equivalentClass in equivalentClasses:
-                if equivalentClass not in exclude_list:
-                    predicates_list.append(("rdfs:equivalentClass",
-                                            equivalentClass))
-        if row[1]["subClassOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subClassOf",
-                                    check_iri(row[1]["subClassOf"])))
-        for predicates in predicates_list:
+                                    language_string(description)))
+        if link not in exclude_set:
+            predicates_list.append((":hasWebsite",
+                                    '"{0}"^^xsd:anyURI'.format(link)))
+
+        # # specific to females/males?
+        # index_gender = row[1]["index_gender"]
+        # if index_gender not in exclude_list:
+        #     if int(index_gender) == 1:  # female
+        #         predicates_list.append(
+        #             ("schema:audienceType", "schema:Female"))
+        #         predicates_list.append(
+        #             ("schema:epidemiology", "schema:Female"))
+        #     elif int(index_gender) == 2:  # male
+        #         predicates_list.append(
+        #             ("schema:audienceType", "schema:Male"))
+        #         predicates_list.append(
+        #             ("schema:epidemiology", "schema:Male"))
+
+        # research article-specific columns
+        if authors not in exclude_set:
+            predicates_list.append((":hasAuthorList",
+                                    language_string(authors)))
+        if year is not None:
+            predicates_list.append((":hasPublicationYear",
+                                    '"{0}"^^xsd:gyear'.format(year)))
+
+        # questionnaire-specific columns
+        for index in use_with_assessments:
+            objectIRI = questionnaire_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append((":useWith", objectIRI))
+        if number_of_questions not in exclude_set and \
+                isinstance(number_of_questions, str):
+            #if "-" in number_of_questions:
+            #    predicates_list.append((":hasNumberOfQuestions",
+            #                            '"{0}"^^xsd:string'.format(
+            #                                number_of_questions)))
+            predicates_list.append((":hasNumberOfQuestions",
+                                    '"{0}"^^xsd:nonNegativeInteger'.format(
+                                        number_of_questions)))
+        if minutes_to_complete not in exclude_set and \
+                isinstance(minutes_to_complete, str):
+            #if "-" in minutes_to_complete:
+            #    predicates_list.append((":takesMinutesToComplete",
+            #        '"{0}"^^xsd:string'.format(minutes_to_complete)))
+            predicates_list.append((":takesMinutesToComplete",
+                '"{0}"^^xsd:decimal'.format(minutes_to_complete)))
+        if age_min not in exclude_set and isinstance(age_min, str):
+            predicates_list.append(("schema:requiredMinAge",
+                '"{0}"^^xsd:decimal'.format(age_min)))
+        if age_max not in exclude_set and isinstance(age_max, str):
+            predicates_list.append(("schema:requiredMaxAge",
+                '"{0}"^^xsd:decimal'.format(age_max)))
+
+        # indices to other worksheets about who uses the shared
+        for index in indices_respondent:
+            objectIRI = person_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append(("schema:audienceType", objectIRI))
+        for index in indices_subject:
+            objectIRI = person_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append(("schema:about", objectIRI))
+        for index in indices_disorder:
+            objectIRI = disorder_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append(("schema:about", objectIRI))
+        for index in indices_disorder_category:
+            objectIRI = disorder_category_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append(("schema:about", objectIRI))
+        for index in indices_disorder_subcategory:
+            objectIRI = disorder_subcategory_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append(("schema:about", objectIRI))
+        if index_disorder_subsubcategory is not None:
+            objectIRI = disorder_subsubcategory_iri_by_index[
+                index_disorder_subsubcategory]
+            if objectIRI is not None:
+                predicates_list.append(("schema:about", objectIRI))
+
+        for index in indices_reference:
+            # cited reference IRI
+            objectIRI = reference_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append((":isReferencedBy", objectIRI))
+        if index_license is not None:
+            objectIRI = license_iri_by_index[index_license]
+            if objectIRI is not None:
+                predicates_list.append((":hasLicense", objectIRI))
+        if index_language is not None:
+            objectIRI = language_iri_by_index[index_language]
+            if objectIRI is not None:
+                predicates_list.append((":hasLanguage", objectIRI))
+        for index in indices_language:
+            objectIRI = language_iri_by_index[index]
+            if objectIRI is not None:
+                predicates_list.append((":hasLanguage", objectIRI))
+
+        statements = add_predicates(questionnaire_iri, predicates_list,
+                                    statements, exclude_set)
+
+    # questions worksheet, numbering the questions of each questionnaire
+    questions = exclude_rows(questions, "question", exclude_set)
+    questionnaire_titles = questions["index_questionnaire"].map(
+        questionnaire_title_by_index).str.strip()
+    unmatched = questionnaire_titles.isna()
+    if unmatched.any():
+        raise ValueError("; ".join([
+            "no questionnaire with index {0!r} for question in row {1}".format(
+                index, row) for row, index in
+            questions["index_questionnaire"][unmatched].items()]))
+    # numbering restarts at 1 on the first question of each questionnaire
+    # and otherwise counts on from the previous question
+    first_questions = ~questionnaire_titles.duplicated()
+    question_numbers = questionnaire_titles.groupby(
+        first_questions.cumsum()).cumcount() + 1
+    for (question_label, questionnaire, questionnaire_iri, qnum,
+         paper_instructions_preamble, paper_instructions,
+         digital_instructions_preamble, digital_instructions,
+         response_options, indices_response_type) in zip(
+            language_string_column(questions["question"]),
+            questionnaire_titles.tolist(),
+            check_iri_column(questionnaire_titles),
+            question_numbers.tolist(),
+            *column_lists(
+                questions, ["paper_instructions_preamble",
+                            "paper_instructions",
+                            "digital_instructions_preamble",
+                            "digital_instructions", "response_options"]),
+            split_indices(questions["indices_response_type"])):
+        question_iri = check_iri("{0}_Q{1}".format(questionnaire, qnum))
+
+        predicates_list = []
+        predicates_list.append(("a", ":Question"))
+        predicates_list.append(("rdfs:label", question_label))
+        predicates_list.append((":hasQuestionText", question_label))
+        predicates_list.append((":isReferencedBy", questionnaire_iri))
+
+        if digital_instructions_preamble not in exclude_set:
+            digital_instructions_preamble_iri = check_iri(
+                digital_instructions_preamble)
+            predicates_list.append((":hasInstructionsPreamble",
+                                    digital_instructions_preamble_iri))
             statements = add_to_statements(
-                class_iri,
-                predicates[0],
-                predicates[1],
+                digital_instructions_preamble_iri,
+                ":hasInstructionsPreambleText",
+                language_string(digital_instructions_preamble),
                 statements,
-                exclude_list
+                exclude_set
             )
-
-    # Properties worksheet
-    for row in assessments_properties.iterrows():
-        property_iri = check_iri(row[1]["property"])
-        property_label = language_string(row[1]["label"])
-        predicates_list = []
-        predicates_list.append(("a", "rdf:Property"))
-        predicates_list.append(("rdfs:label", property_label))
-        if row[1]["propertyDomain"] not in exclude_list:
-            predicates_list.append(("rdfs:domain",
-                                    check_iri(row[1]["propertyDomain"])))
-        if row[1]["propertyRange"] not in exclude_list:
-            predicates_list.append(("rdfs:range",
-                                    check_iri(row[1]["propertyRange"])))
-        if row[1]["definition"] not in exclude_list:
-            predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs",
-                                    row[1]["sameAs"]))
-        if row[1]["equivalentProperty"] not in exclude_list:
-            predicates_list.append(("rdfs:equivalentProperty",
-                                    row[1]["equivalentProperty"]))
-        if row[1]["subPropertyOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subPropertyOf",
-                                    check_iri(row[1]["subPropertyOf"])))
-        for predicates in predicates_list:
+        if digital_instructions not in exclude_set:
+            digital_instructions_label = language_string(digital_instructions)
+            predicates_list.append((":hasInstructions",
+                                    digital_instructions_label))
             statements = add_to_statements(
-                property_iri,
-                predicates[0],
-                predicates[1],
+                check_iri(digital_instructions),
+                ":hasInstructionsText",
+                digital_instructions_label,
                 statements,
-                exclude_list
+                exclude_set
             )
+        if paper_instructions_preamble not in exclude_set and \
+            paper_instructions_preamble != digital_instructions_preamble:
 
-    # questionnaires worksheet
-    for row in questionnaires.iterrows():
-        title = row[1]["title"]
-        if title not in exclude_list:
-            predicates_list = []
-
-            # reference IRI
-            questionnaire_iri = check_iri(title)
-            predicates_list.append(("a", ":Questionnaire"))
-            predicates_list.append(("rdfs:label", language_string(title)))
-            predicates_list.append((":hasTitle", language_string(title)))
-
-            # general columns
-            abbreviation = row[1]["abbreviation"]
-            description = row[1]["description"]
-            link = row[1]["link"]
-            if abbreviation not in exclude_list:
-                predicates_list.append((":hasAbbreviation",
-                                        language_string(abbreviation)))
-            if description not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(description)))
-            if link not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(link.strip())))
-
-            # # specific to females/males?
-            # index_gender = row[1]["index_gender"]
-            # if index_gender not in exclude_list:
-            #     if np.int(index_gender) == 1:  # female
-            #         predicates_list.append(
-            #             ("schema:audienceType", "schema:Female"))
-            #         predicates_list.append(
-            #             ("schema:epidemiology", "schema:Female"))
-            #     elif np.int(index_gender) == 2:  # male
-            #         predicates_list.append(
-            #             ("schema:audienceType", "schema:Male"))
-            #         predicates_list.append(
-            #             ("schema:epidemiology", "schema:Male"))
-
-            # research article-specific columns
-            authors = row[1]["authors"]
-            year = row[1]["year"]
-            if authors not in exclude_list:
-                predicates_list.append((":hasAuthorList",
-                                        language_string(authors)))
-            if year not in exclude_list:
-                predicates_list.append((":hasPublicationYear",
-                                        '"{0}"^^xsd:gyear'.format(int(year))))
-
-            # questionnaire-specific columns
-            use_with_assessments = row[1]["use_with_assessments"]
-            number_of_questions = row[1]["number_of_questions"]
-            minutes_to_complete = row[1]["minutes_to_complete"]
-            age_min = row[1]["age_min"]
-            age_max = row[1]["age_max"]
-            if use_with_assessments not in exclude_list:
-                indices = [np.int(x) for x in
-                           use_with_assessments.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = questionnaires[
-                        questionnaires["index"] == index]["title"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":useWith",
-                                                check_iri(objectRDF)))
-            if number_of_questions not in exclude_list and \
-                    isinstance(number_of_questions, str):
-                #if "-" in number_of_questions:
-                #    predicates_list.append((":hasNumberOfQuestions",
-                #                            '"{0}"^^xsd:string'.format(
-                #                                number_of_questions)))
-                predicates_list.append((":hasNumberOfQuestions",
-                                        '"{0}"^^xsd:nonNegativeInteger'.format(
-                                            number_of_questions)))
-            if minutes_to_complete not in exclude_list and \
-                    isinstance(minutes_to_complete, str):
-                #if "-" in minutes_to_complete:
-                #    predicates_list.append((":takesMinutesToComplete",
-                #        '"{0}"^^xsd:string'.format(minutes_to_complete)))
-                predicates_list.append((":takesMinutesToComplete",
-                    '"{0}"^^xsd:decimal'.format(minutes_to_complete)))
-            if age_min not in exclude_list and isinstance(age_min, str):
-                predicates_list.append(("schema:requiredMinAge",
-                    '"{0}"^^xsd:decimal'.format(age_min)))
-            if age_max not in exclude_list and isinstance(age_max, str):
-                predicates_list.append(("schema:requiredMaxAge",
-                    '"{0}"^^xsd:decimal'.format(age_max)))
-
-            # indices to other worksheets about who uses the shared
-            indices_respondent = row[1]["indices_respondent"]
-            indices_subject = row[1]["indices_subject"]
-            indices_disorder = row[1]["indices_disorder"]
-            indices_disorder_category = row[1]["indices_disorder_category"]
-            indices_disorder_subcategory = row[1]["indices_disorder_subcategory"]
-            index_disorder_subsubcategory = row[1]["indices_disorder_subsubcategory"]
-            indices_reference = row[1]["indices_reference"]
-            index_license = row[1]["index_license"]
-            index_language = row[1]["index_language"]
-            indices_language = row[1]["indices_language_not_in_mhdb"]
-            if indices_respondent not in exclude_list:
-                if isinstance(indices_respondent, float):
-                    indices = [np.int(indices_respondent)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_respondent.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = people[
-                        people["index"] ==
-                        index]["person"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("schema:audienceType",
-                                                check_iri(objectRDF, 'PascalCase')))
-            if indices_subject not in exclude_list:
-                if isinstance(indices_subject, float):
-                    indices = [np.int(indices_subject)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_subject.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = people[
-                        people["index"] ==
-                        index]["person"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("schema:about",
-                                                check_iri(objectRDF, 'PascalCase')))
-            if indices_disorder not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_disorder.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = disorders[disorders["index"] ==
-                                          index]["disorder"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("schema:about", check_iri(objectRDF, 'PascalCase')))
-            if indices_disorder_category not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_disorder_category.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = disorder_categories[disorder_categories["index"] ==
-                                     index]["disorder_category"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("schema:about", check_iri(objectRDF, 'PascalCase')))
-            if indices_disorder_subcategory not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_disorder_subcategory.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = disorder_subcategories[disorder_subcategories["index"] ==
-                                     index]["disorder_subcategory"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append(("schema:about", check_iri(objectRDF, 'PascalCase')))
-            if index_disorder_subsubcategory not in exclude_list:
-                objectRDF = disorder_subsubcategories[disorder_subsubcategories["index"] ==
-                                     index_disorder_subsubcategory]["disorder_subsubcategory"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append(("schema:about", check_iri(objectRDF, 'PascalCase')))
-
-            if indices_reference not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_reference.strip().split(',') if len(x)>0]
-                for index in indices:
-                    # cited reference IRI
-                    title_cited = references[
-                        references["index"] == index]["title"].values[0]
-                    if title_cited not in exclude_list:
-                        predicates_list.append((":isReferencedBy",
-                                                check_iri(title_cited)))
-            if index_license not in exclude_list:
-                objectRDF = licenses[licenses["index"] ==
-                                       index_license]["license"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append((":hasLicense", check_iri(objectRDF, 'PascalCase')))
-            if index_language not in exclude_list:
-                objectRDF = languages[
-                    languages["index"] == index_language]["language"].values[0]
-                if objectRDF not in exclude_list:
-                    predicates_list.append((":hasLanguage",
-                                            check_iri(objectRDF, 'PascalCase')))
-            if indices_language not in exclude_list:
-                indices = [np.int(x) for x in
-                           indices_language.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = languages[
-                        languages["index"] == index]["language"].values[0]
-                    if objectRDF not in exclude_list:
-                        predicates_list.append((":hasLanguage",
-                                                check_iri(objectRDF, 'PascalCase')))
+            paper_instructions_preamble_iri = check_iri(
+                paper_instructions_preamble)
+            predicates_list.append((":hasPaperInstructionsPreamble",
+                                    paper_instructions_preamble_iri))
+            statements = add_to_statements(
+                paper_instructions_preamble_iri,
+                ":hasPaperInstructionsPreambleText",
+                language_string(paper_instructions_preamble),
+                statements,
+                exclude_set
+            )
+        if paper_instructions not in exclude_set and \
+            paper_instructions != digital_instructions:
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    questionnaire_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            paper_instructions_iri = check_iri(paper_instructions)
+            predicates_list.append((":hasPaperInstructions",
+                                    paper_instructions_iri))
+            statements = add_to_statements(
+                paper_instructions_iri,
+                ":hasPaperInstructionsText",
+                language_string(paper_instructions),
+                statements,
+                exclude_set
+            )
 
-    # questions worksheet
-    qnum = 1
-    old_questionnaires = []
-    for row in questions.iterrows():
-        question = row[1]["question"].strip()
-        index_questionnaire = row[1]["index_questionnaire"]
-        if question not in exclude_list:
-            questionnaire = questionnaires[questionnaires["index"] ==
-                                index_questionnaire]["title"].values[0].strip()
-            if questionnaire not in old_questionnaires:
-                qnum = 1
-                old_questionnaires.append(questionnaire)
+        if response_options not in exclude_set:
+            response_options = response_options.strip('-')
+            response_options = response_options.replace("\n", "")
+            response_options_iri = check_iri(response_options)
+            if '"' in response_options:
+                response_options = response_option_pattern.findall(
+                    response_options)
             else:
-                qnum += 1
-
-            question_label = language_string(question)
-            question_iri = check_iri("{0}_Q{1}".format(questionnaire, qnum))
-
-            predicates_list = []
-            predicates_list.append(("a", ":Question"))
-            predicates_list.append(("rdfs:label", question_label))
-            predicates_list.append((":hasQuestionText", question_label))
-            predicates_list.append((":isReferencedBy", check_iri(questionnaire)))
-
-            paper_instructions_preamble = row[1]["paper_instructions_preamble"].strip()
-            paper_instructions = row[1]["paper_instructions"].strip()
-            digital_instructions_preamble = row[1]["digital_instructions_preamble"].strip()
-            digital_instructions = row[1]["digital_instructions"].strip()
-            response_options = row[1]["response_options"]
-
-            if digital_instructions_preamble not in exclude_list:
-                predicates_list.append((":hasInstructionsPreamble",
-                                        check_iri(digital_instructions_preamble)))
-                statements = add_to_statements(
-                    check_iri(digital_instructions_preamble),
-                    ":hasInstructionsPreambleText",
-                    language_string(digital_instructions_preamble),
-                    statements,
-                    exclude_list
-                )
-            if digital_instructions not in exclude_list:
-                predicates_list.append((":hasInstructions",
-                                        language_string(digital_instructions)))
-                statements = add_to_statements(
-                    check_iri(digital_instructions),
-                    ":hasInstructionsText",
-                    language_string(digital_instructions),
-                    statements,
-                    exclude_list
-                )
-            if paper_instructions_preamble not in exclude_list and \
-                paper_instructions_preamble != digital_instructions_preamble:
-
-                predicates_list.append((":hasPaperInstructionsPreamble",
-                                        check_iri(paper_instructions_preamble)))
-                statements = add_to_statements(
-                    check_iri(paper_instructions_preamble),
-                    ":hasPaperInstructionsPreambleText",
-                    language_string(paper_instructions_preamble),
-                    statements,
-                    exclude_list
-                )
-            if paper_instructions not in exclude_list and \
-                paper_instructions != digital_instructions:
-
-                predicates_list.append((":hasPaperInstructions",
-                                        check_iri(paper_instructions)))
-                statements = add_to_statements(
-                    check_iri(paper_instructions),
-                    ":hasPaperInstructionsText",
-                    language_string(paper_instructions),
-                    statements,
-                    exclude_list
-                )
+                response_options = response_options.split(",")
+            #print(row[1]["index"], ' response options: ', response_options)
 
-            if response_options not in exclude_list:
-                response_options = response_options.strip('-')
-                response_options = response_options.replace("\n", "")
-                response_options_iri = check_iri(response_options)
-                if '"' in response_options:
-                    response_options = re.findall('[-+]?[0-9]+=".*?"',
-                                                  response_options)
+            statements = add_to_statements(
+                question_iri,
+                ":hasResponseOptions",
+                response_options_iri,
+                statements,
+                exclude_set
+            )
+            statements = add_to_statements(response_options_iri,
+                                           "a", "rdf:Seq",
+                                           statements, exclude_set)
+            for iresponse, response_option in enumerate(response_options):
+                response = response_option.split("=")[1].strip()
+                if response in exclude_set:
+                    response_iri = ":Empty"
                 else:
-                    response_options = response_options.split(",")
-                #print(row[1]["index"], ' response options: ', response_options)
+                    response_iri = check_iri(response)
+                    statements = add_to_statements(
+                        response_iri,
+                        ":hasResponseOptionText",
+                        language_string(response),
+                        statements,
+                        exclude_set
+                    )
+                    statements = add_to_statements(
+                        response_options_iri,
+                        "rdf:_{0}".format(iresponse + 1),
+                        response_iri,
+                        statements,
+                        exclude_set
+                    )
 
-                statements = add_to_statements(
-                    question_iri,
-                    ":hasResponseOptions",
-                    response_options_iri,
-                    statements,
-                    exclude_list
-                )
-                statements = add_to_statements(response_options_iri,
-                                               "a", "rdf:Seq",
-                                               statements, exclude_list)
-                for iresponse, response_option in enumerate(response_options):
-                    response = response_option.split("=")[1].strip()
-                    if response in exclude_list:
-                        response_iri = ":Empty"
-                    else:
-                        response_iri = check_iri(response)
-                        statements = add_to_statements(
-                            response_iri,
-                            ":hasResponseOptionText",
-                            language_string(response),
-                            statements,
-                            exclude_list
-                        )
-                        statements = add_to_statements(
-                            response_options_iri,
-                            "rdf:_{0}".format(iresponse + 1),
-                            response_iri,
-                            statements,
-                            exclude_list
-                        )
-
-            indices_response_type = row[1]["indices_response_type"]
-            if indices_response_type not in exclude_list:
-                if isinstance(indices_response_type, float) or \
-                        isinstance(indices_response_type, int):
-                    indices = [np.int(indices_response_type)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_response_type.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = response_types[response_types["index"] ==
-                                               index]["response_type"].values[0]
-                    if isinstance(objectRDF, str):
-                        predicates_list.append((":hasResponseType",
-                                                check_iri(objectRDF, 'PascalCase')))
-            # index_scale_type = row[1]["scale_type"]
-            # index_value_type = row[1]["value_type"]
-            # num_options = row[1]["num_options"]
-            # index_neutral = row[1]["index_neutral"]
-            # index_min = row[1]["index_min_extreme_oo_unclear_na_none"]
-            # index_max = row[1]["index_max_extreme_oo_unclear_na_none"]
-            # index_dontknow = row[1]["index_dontknow_na"]
-            # if index_scale_type not in exclude_list:
-            #     scale_type_iri = scale_types[scale_types["index"] ==
-            #                                  index_scale_type]["IRI"].values[0]
-            #     if scale_type_iri in exclude_list:
-            #         scale_type_iri = check_iri(scale_types[scale_types["index"] ==
-            #                                   index_scale_type]["scale_type"].values[0], 'PascalCase')
-            #     if scale_type_iri not in exclude_list:
-            #         predicates_list.append((":hasScaleType", check_iri(scale_type_iri, 'PascalCase')))
-            # if index_value_type not in exclude_list:
-            #     value_type_iri = value_types[value_types["index"] ==
-            #                                  index_value_type]["IRI"].values[0]
-            #     if value_type_iri in exclude_list:
-            #         value_type_iri = check_iri(value_types[value_types["index"] ==
-            #                                   index_value_type]["value_type"].values[0], 'PascalCase')
-            #     if value_type_iri not in exclude_list:
-            #         predicates_list.append((":hasValueType", check_iri(value_type_iri, 'PascalCase')))
-            # if num_options not in exclude_list:
-            #     predicates_list.append((":hasNumberOfOptions",
-            #                             '"{0}"^^xsd:nonNegativeInteger'.format(
-            #                                 num_options)))
-            # if index_neutral not in exclude_list:
-            #     if index_neutral not in ['oo', 'n/a']:
-            #         predicates_list.append((":hasNeutralValueForResponseIndex",
-            #                                 '"{0}"^^xsd:integer'.format(
-            #                                     index_neutral)))
-            # if index_min not in exclude_list:
-            #     if index_min not in ['oo', 'n/a']:
-            #         predicates_list.append((":hasExtremeValueForResponseIndex",
-            #                                 '"{0}"^^xsd:integer'.format(
-            #                                     index_min)))
-            # if index_max not in exclude_list:
-            #     if index_max not in ['oo', 'n/a']:
-            #         predicates_list.append((":hasExtremeValueForResponseIndex",
-            #                                 '"{0}"^^xsd:integer'.format(
-            #                                     index_max)))
-            # if index_dontknow not in exclude_list:
-            #     predicates_list.append((":hasDontKnowOrNanForResponseIndex",
-            #                             '"{0}"^^xsd:integer'.format(
-            #                                 index_dontknow)))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    question_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+        for index in indices_response_type:
+            objectRDF = response_type_by_index[index]
+            if isinstance(objectRDF, str):
+                predicates_list.append((":hasResponseType",
+                                        check_iri(objectRDF, 'PascalCase')))
+        # index_scale_type = row[1]["scale_type"]
+        # index_value_type = row[1]["value_type"]
+        # num_options = row[1]["num_options"]
+        # index_neutral = row[1]["index_neutral"]
+        # index_min = row[1]["index_min_extreme_oo_unclear_na_none"]
+        # index_max = row[1]["index_max_extreme_oo_unclear_na_none"]
+        # index_dontknow = row[1]["index_dontknow_na"]
+        # if index_scale_type not in exclude_list:
+        #     scale_type_iri = scale_types[scale_types["index"] ==
+        #                                  index_scale_type]["IRI"].values[0]
+        #     if scale_type_iri in exclude_list:
+        #         scale_type_iri = check_iri(scale_types[scale_types["index"] ==
+        #                                   index_scale_type]["scale_type"].values[0], 'PascalCase')
+        #     if scale_type_iri not in exclude_list:
+        #         predicates_list.append((":hasScaleType", check_iri(scale_type_iri, 'PascalCase')))
+        # if index_value_type not in exclude_list:
+        #     value_type_iri = value_types[value_types["index"] ==
+        #                                  index_value_type]["IRI"].values[0]
+        #     if value_type_iri in exclude_list:
+        #         value_type_iri = check_iri(value_types[value_types["index"] ==
+        #                                   index_value_type]["value_type"].values[0], 'PascalCase')
+        #     if value_type_iri not in exclude_list:
+        #         predicates_list.append((":hasValueType", check_iri(value_type_iri, 'PascalCase')))
+        # if num_options not in exclude_list:
+        #     predicates_list.append((":hasNumberOfOptions",
+        #                             '"{0}"^^xsd:nonNegativeInteger'.format(
+        #                                 num_options)))
+        # if index_neutral not in exclude_list:
+        #     if index_neutral not in ['oo', 'n/a']:
+        #         predicates_list.append((":hasNeutralValueForResponseIndex",
+        #                                 '"{0}"^^xsd:integer'.format(
+        #                                     index_neutral)))
+        # if index_min not in exclude_list:
+        #     if index_min not in ['oo', 'n/a']:
+        #         predicates_list.append((":hasExtremeValueForResponseIndex",
+        #                                 '"{0}"^^xsd:integer'.format(
+        #                                     index_min)))
+        # if index_max not in exclude_list:
+        #     if index_max not in ['oo', 'n/a']:
+        #         predicates_list.append((":hasExtremeValueForResponseIndex",
+        #                                 '"{0}"^^xsd:integer'.format(
+        #                                     index_max)))
+        # if index_dontknow not in exclude_list:
+        #     predicates_list.append((":hasDontKnowOrNanForResponseIndex",
+        #                             '"{0}"^^xsd:integer'.format(
+        #                                 index_dontknow)))
+
+        statements = add_predicates(question_iri, predicates_list,
+                                    statements, exclude_set)
 
     # response_types worksheet
-    for row in response_types.iterrows():
-        response_type = row[1]["response_type"].strip()
-        if response_type not in exclude_list:
+    for response_type, definition, equivalentClasses in zip(
+            *column_lists(response_types, ["response_type", "definition"]),
+            split_column(response_types["equivalentClasses"], exclude_set)):
+        response_type = response_type.strip()
+        if response_type not in exclude_set:
 
             response_type_iri = check_iri(response_type, 'PascalCase')
             response_type_label = language_string(response_type)
             statements = add_to_statements(
                 response_type_iri, "rdfs:subClassOf", ":ResponseType",
-                statements, exclude_list)
+                statements, exclude_set)
             statements = add_to_statements(
                 response_type_iri, "rdfs:label", response_type_label,
-                statements, exclude_list)
+                statements, exclude_set)
 
-            if row[1]["definition"] not in exclude_list:
+            if definition not in exclude_set:
                 predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["definition"])))
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                     equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
+                                        language_string(definition)))
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
 
     # tasks worksheet
-    for row in tasks.iterrows():
-        name = row[1]["name"].strip()
-        if name not in exclude_list:
-
-            task_label = language_string(name)
-            task_iri = check_iri(name, 'PascalCase')
-
-            predicates_list = []
-            predicates_list.append(("rdfs:subClassOf", ":Task"))
-            predicates_list.append(("rdfs:label", task_label))
-
-            if row[1]["description"] not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["description"])))
-            if row[1]["aliases"] not in exclude_list:
-                aliases = row[1]["aliases"].split(',')
-                for alias in aliases:
-                    predicates_list.append(("rdfs:label", language_string(alias)))
-
-            # # Cognitive Atlas-specific column
-            # cogatlas_node_id = check_iri(row[1]["cogatlas_node_id"])
-            # if cogatlas_node_id not in exclude_list:
-            #     predicates_list.append((":hasCognitiveAtlasNodeID",
-            #                             cogatlas_node_id))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    task_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    statements = merge_statements(statements, tasks_statements)
 
     # task_implementations worksheet
-    for row in implementations.iterrows():
-        implementation = row[1]["implementation"].strip()
-        if implementation not in exclude_list:
-
-            implementation_label = language_string(implementation)
-            implementation_iri = check_iri(implementation)
-
-            predicates_list = []
-            predicates_list.append(("a", ":TaskImplementation"))
-            predicates_list.append(("rdfs:label", implementation_label))
-            if row[1]["description"] not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["description"])))
-            if row[1]["link"] not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["link"].strip())))
-
-            # indices to other worksheets
-            indices_task = row[1]["indices_task"]
-            indices_project = row[1]["indices_project"]
-            if indices_task not in exclude_list:
-                if isinstance(indices_task, float) or \
-                        isinstance(indices_task, int):
-                    indices = [np.int(indices_task)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_task.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = tasks[tasks["index"] == index]["name"].values[0]
-                    if isinstance(objectRDF, str):
-                        #predicates_list.append(("rdfs:subClassOf",
-                        #                        check_iri(objectRDF, 'PascalCase')))
-                        statements = add_to_statements(
-                            check_iri(objectRDF, 'PascalCase'), ":hasTaskImplementation",
-                            implementation_iri, statements, exclude_list)
-            if indices_project not in exclude_list:
-                if isinstance(indices_project, float) or \
-                        isinstance(indices_project, int):
-                    indices = [np.int(indices_project)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_project.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = projects[projects["index"] ==
-                                         index]["project"].values[0]
-                    if isinstance(objectRDF, str):
-                        predicates_list.append((":hasProject",
-                                                "mhdb-resources" + check_iri(objectRDF)))
-
-            # # Cognitive Atlas-specific column
-            # cogatlas_node_id = row[1]["cogatlas_node_id"]
-            # if cogatlas_node_id not in exclude_list:
-            #     predicates_list.append((":hasCognitiveAtlasNodeID",
-            #                             check_iri(cogatlas_node_id)))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    implementation_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    statements = merge_statements(statements, task_implementations_statements)
 
     # task_conditions worksheet
-    for row in conditions.iterrows():
-        condition = row[1]["condition"].strip()
-        if condition not in exclude_list:
-
-            condition_label = language_string(condition)
-            condition_iri = check_iri(condition)
-
-            predicates_list = []
-            predicates_list.append(("a", ":TaskCondition"))
-            predicates_list.append(("rdfs:label", condition_label))
-            if row[1]["description"] not in exclude_list:
-                predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["description"])))
-
-            # # Cognitive Atlas-specific column
-            # cogatlas_node_id = row[1]["cogatlas_node_id"]
-            # if cogatlas_node_id not in exclude_list:
-            #     predicates_list.append((":hasCognitiveAtlasNodeID",
-            #                             check_iri(cogatlas_node_id)))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    condition_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    statements = merge_statements(statements, task_conditions_statements)
 
     # task_contrasts worksheet
-    for row in contrasts.iterrows():
-        contrast = row[1]["contrast"].strip()
-        if contrast not in exclude_list:
-
-            contrast_label = language_string(contrast)
-            contrast_iri = check_iri(contrast)
-
-            predicates_list = []
-            predicates_list.append(("a", ":TaskContrast"))
-            predicates_list.append(("rdfs:label", contrast_label))
-
-            # # Cognitive Atlas-specific column
-            # cogatlas_node_id = row[1]["cogatlas_node_id"]
-            # if cogatlas_node_id not in exclude_list:
-            #     predicates_list.append((":hasCognitiveAtlasNodeID",
-            #                             check_iri(cogatlas_node_id)))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    contrast_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    statements = merge_statements(statements, task_contrasts_statements)
 
     # task_indicators worksheet
-    for row in indicators.iterrows():
-        indicator = row[1]["indicator"].strip()
-        if indicator not in exclude_list:
-
-            indicator_label = language_string(indicator)
-            indicator_iri = check_iri(indicator)
-
-            predicates_list = []
-            predicates_list.append(("a", ":TaskIndicator"))
-            predicates_list.append(("rdfs:label", indicator_label))
-
-            # # Cognitive Atlas-specific column
-            # cogatlas_node_id = row[1]["cogatlas_node_id"]
-            # if cogatlas_node_id not in exclude_list:
-            #     predicates_list.append((":hasCognitiveAtlasNodeID",
-            #                             check_iri(cogatlas_node_id)))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    indicator_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    statements = merge_statements(statements, task_indicators_statements)
 
     # task_assertions_indices worksheet
-    for row in assertions_indices.iterrows():
-
-        reln_type = str(row[1]["cogatlas_reln_type"])
-        startNode = int(row[1]["cogatlas_startNode"])
-        endNode = int(row[1]["cogatlas_endNode"])
-        subject = ""
-        object = ""
-
-        # Find subject and object from the different worksheets
-
-        # tasks worksheet
-        if subject in exclude_list:
-            subject_task = tasks[tasks['cogatlas_node_id'] == startNode]["name"]
-            if not subject_task.empty:
-                subject = tasks[tasks['cogatlas_node_id'] == startNode]["name"].values[0]
-            subject_label_type = 'PascalCase'
-        if object in exclude_list:
-            object_task = tasks[tasks['cogatlas_node_id'] == endNode]["name"]
-            if not object_task.empty:
-                object = tasks[tasks['cogatlas_node_id'] == endNode]["name"].values[0]
-            object_label_type = 'PascalCase'
-
-        # task_implementations worksheet
-        if subject in exclude_list:
-            subject_implementation = implementations[implementations['cogatlas_node_id'] == startNode]["implementation"]
-            if not subject_implementation.empty:
-                subject = implementations[implementations['cogatlas_node_id'] == startNode]["implementation"].values[0]
-            subject_label_type = 'delimited'
-        if object in exclude_list:
-            object_implementation = implementations[implementations['cogatlas_node_id'] == endNode]["implementation"]
-            if not object_implementation.empty:
-                object = implementations[implementations['cogatlas_node_id'] == endNode]["implementation"].values[0]
-            object_label_type = 'delimited'
-
-        # task_indicators worksheet
-        if subject in exclude_list:
-            subject_indicator = indicators[indicators['cogatlas_node_id'] == startNode]["indicator"]
-            if not subject_indicator.empty:
-                subject = indicators[indicators['cogatlas_node_id'] == startNode]["indicator"].values[0]
-            subject_label_type = 'delimited'
-        if object in exclude_list:
-            object_indicator = indicators[indicators['cogatlas_node_id'] == endNode]["indicator"]
-            if not object_indicator.empty:
-                object = indicators[indicators['cogatlas_node_id'] == endNode]["indicator"].values[0]
-            object_label_type = 'delimited'
-
-        # task_conditions worksheet
-        if subject in exclude_list:
-            subject_condition = conditions[conditions['cogatlas_node_id'] == startNode]["condition"]
-            if not subject_condition.empty:
-                subject = conditions[conditions['cogatlas_node_id'] == startNode]["condition"].values[0]
-            subject_label_type = 'delimited'
-        if object in exclude_list:
-            object_condition = conditions[conditions['cogatlas_node_id'] == endNode]["condition"]
-            if not object_condition.empty:
-                object = conditions[conditions['cogatlas_node_id'] == endNode]["condition"].values[0]
-            object_label_type = 'delimited'
-
-        # task_contrasts worksheet
-        if subject in exclude_list:
-            subject_contrast = contrasts[contrasts['cogatlas_node_id'] == startNode]["contrast"]
-            if not subject_contrast.empty:
-                subject = contrasts[contrasts['cogatlas_node_id'] == startNode]["contrast"].values[0]
-            subject_label_type = 'delimited'
-        if object in exclude_list:
-            object_contrast = contrasts[contrasts['cogatlas_node_id'] == endNode]["contrast"]
-            if not object_contrast.empty:
-                object = contrasts[contrasts['cogatlas_node_id'] == endNode]["contrast"].values[0]
-            object_label_type = 'delimited'
-
-        if subject not in exclude_list and object not in exclude_list and not subject == object:
-
-            # Build subject - predicate - object triple
-            subject_iri = check_iri(subject, subject_label_type)
-            object_iri = check_iri(object, object_label_type)
-
-            if reln_type == "ASSERTS":
-                object_iri = check_iri(object, 'PascalCase')
-                reln_type = ":assertsCognitiveAtlasConcept"
-                # task -> asserts -> concept (identify concept)
-                statements = add_to_statements(
-                    object_iri, "rdfs:subClassOf", ":CognitiveAtlasConcept",
-                    statements, exclude_list
-                )
-                statements = add_to_statements(
-                    object_iri, "rdfs:label", language_string(object),
-                    statements, exclude_list
-                )
-            elif reln_type == "HASCITATION":
-                predicate_iri = ":hasBibliographicCitation"
-                object_iri = check_iri(object, object_label_type)
-            elif reln_type == "HASCONDITION":
-                predicate_iri = ":hasTaskCondition"
-                object_iri = check_iri(object, object_label_type)
-            elif reln_type == "HASCONTRAST":
-                predicate_iri = ":hasTaskContrast"
-                object_iri = check_iri(object)
-            elif reln_type == "HASIMPLEMENTATION":
-                predicate_iri = ":hasTaskImplementation"
-                object_iri = check_iri(object)
-            elif reln_type == "HASINDICATOR":
-                predicate_iri = ":hasTaskIndicator"
-                object_iri = check_iri(object)
-            elif reln_type == "KINDOF":
-                predicate_iri = ":isKindOf"
-                object_iri = check_iri(object, 'PascalCase')
-            elif reln_type == "MEASUREDBY":
-                predicate_iri = ":measuredBy"
-                object_iri = check_iri(object)
-            elif reln_type == "PARTOF":
-                predicate_iri = ":isPartOf"
-                object_iri = check_iri(object, 'PascalCase')
-            else:
-                predicate_iri = ""
-            # if reln_type == "HASDIFFERENCE":
-            # if reln_type == "CLASSIFIEDUNDER":
-            # if reln_type == "ISA":
-            # if reln_type == "PREDICATE":
-            # if reln_type == "PREDICATE_DEF":
-            # if reln_type == "SUBJECT":
-
-            if predicate_iri not in exclude_list:
-                #print('"{0}", {1}, "{2}"'.format(subject, predicate_iri, object))
-
-                statements = add_to_statements(
-                    subject_iri, predicate_iri, object_iri,
-                    statements, exclude_list
-                )
+    statements = merge_statements(statements, task_assertions_statements)
 
     # references worksheet
-    for row in references.iterrows():
-        title = row[1]["title"]
-        if title not in exclude_list:
-            predicates_list = []
-
-            # reference IRI
-            reference_iri = check_iri(title)
-            predicates_list.append(("a", ":BibliographicResource"))
-            predicates_list.append(("rdfs:label", language_string(title)))
-            predicates_list.append((":hasTitle", language_string(title)))
-
-            # general columns
-            link = row[1]["link"]
-            if link not in exclude_list:
-                predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(link.strip())))
-
-            # research article-specific columns
-            authors = row[1]["authors"]
-            pubdate = row[1]["pubdate"]
-            PubMedID = row[1]["PubMedID"]
-            if authors not in exclude_list:
-                predicates_list.append((":hasAuthorList",
-                                        language_string(authors)))
-            if pubdate not in exclude_list:
-                predicates_list.append((":hasPublicationDate",
-                                        language_string(pubdate)))
-            if PubMedID not in exclude_list:
-                predicates_list.append((":hasPubMedID",
-                                        '"{0}"^^xsd:nonNegativeInteger'.format(int(PubMedID))))
-
-            # # Cognitive Atlas-specific column
-            # cogatlas_node_id = row[1]["cogatlas_node_id"]
-            # if cogatlas_node_id not in exclude_list:
-            #     predicates_list.append((":hasCognitiveAtlasNodeID",
-            #                             check_iri(cogatlas_node_id)))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    reference_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+    statements = ingest_references(references, statements)
 
     return statements
 
@@ -3085,7 +3261,7 @@ def ingest_sensors(sensors_xls, statements={}):
 
     Parameters
     ----------
-    sensors_xls: pandas ExcelFile
+    sensors_xls: pandas ExcelFile or string (file path)
 
     statements:  dictionary
         key: string
@@ -3111,90 +3287,34 @@ def ingest_sensors(sensors_xls, statements={}):
     -------
     """
 
-    # load worksheets as pandas dataframes
-    sensors_classes = sensors_xls.parse("Classes")
-    sensors_properties = sensors_xls.parse("Properties")
-    sensors = sensors_xls.parse("sensors")
-    measurands = sensors_xls.parse("measurands")
-    scales = sensors_xls.parse("scales")
-
-    # fill NANs with emptyValue
-    sensors_classes = sensors_classes.fillna(emptyValue)
-    sensors_properties = sensors_properties.fillna(emptyValue)
-    sensors = sensors.fillna(emptyValue)
-    measurands = measurands.fillna(emptyValue)
-    scales = scales.fillna(emptyValue)
-
-    # Classes worksheet
-    for row in sensors_classes.iterrows():
-        class_iri = check_iri(row[1]["ClassName"])
-        class_label = language_string(row[1]["label"])
-        predicates_list = []
-        predicates_list.append(("a", "rdf:Class"))
-        predicates_list.append(("rdfs:label", class_label))
-        if row[1]["definition"] not in exclude_list:
-            predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs", row[1]["sameAs"]))
-        if row[1]["equivalentClasses"] not in exclude_list:
-            equivalentClasses = row[1]["equivalentClasses"]
-            equivalentClasses = [x.strip() for x in
-                             equivalentClasses.strip().split(',') if len(x) > 0]
-            for equivalentClass in equivalentClasses:
-                if equivalentClass not in exclude_list:
-                    predicates_list.append(("rdfs:equivalentClass",
-                                            equivalentClass))
-        if row[1]["subClassOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subClassOf",
-                                    check_iri(row[1]["subClassOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                class_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+    # load worksheets as pandas dataframes, filling NANs with emptyValue
+    sensors_classes, sensors_properties, sensors, measurands, scales = [
+        worksheet.fillna(emptyValue) for worksheet in parse_worksheets(
+            sensors_xls, ["Classes", "Properties", "sensors", "measurands",
+                          "scales"], cache_dir)]
 
-    # Properties worksheet
-    for row in sensors_properties.iterrows():
-        property_iri = check_iri(row[1]["property"])
-        property_label = language_string(row[1]["label"])
-        predicates_list = []
-        predicates_list.append(("a", "rdf:Property"))
-        predicates_list.append(("rdfs:label", property_label))
-        if row[1]["propertyDomain"] not in exclude_list:
-            predicates_list.append(("rdfs:domain",
-                                    check_iri(row[1]["propertyDomain"])))
-        if row[1]["propertyRange"] not in exclude_list:
-            predicates_list.append(("rdfs:range",
-                                    check_iri(row[1]["propertyRange"])))
-        if row[1]["definition"] not in exclude_list:
-            predicates_list.append(("rdfs:comment",
-                                    language_string(row[1]["definition"])))
-        if row[1]["sameAs"] not in exclude_list:
-            predicates_list.append(("owl:sameAs",
-                                    row[1]["sameAs"]))
-        if row[1]["equivalentProperty"] not in exclude_list:
-            predicates_list.append(("rdfs:equivalentProperty",
-                                    row[1]["equivalentProperty"]))
-        if row[1]["subPropertyOf"] not in exclude_list:
-            predicates_list.append(("rdfs:subPropertyOf",
-                                    check_iri(row[1]["subPropertyOf"])))
-        for predicates in predicates_list:
-            statements = add_to_statements(
-                property_iri,
-                predicates[0],
-                predicates[1],
-                statements,
-                exclude_list
-            )
+    # map index values to worksheet cells
+    sensor_by_index = lookup_by_index(sensors, "sensor")
+    scale_by_index = lookup_by_index(scales, "scale")
+
+    # strip link cells once for the whole worksheet
+    strip_columns(sensors, ["definition_link"])
+    strip_columns(measurands, ["measurand_definition_link",
+                               "sensor_type_definition_link"])
+
+    # Classes and Properties worksheets
+    statements = ingest_classes(sensors_classes, statements)
+    statements = ingest_properties(sensors_properties, statements)
 
     # sensors worksheet
-    for row in sensors.iterrows():
-        sensor = row[1]["sensor"].strip()
-        if sensor not in exclude_list:
+    for (sensor, definition, definition_link, aliases,
+         equivalentClasses) in zip(
+            *column_lists(sensors, ["sensor", "definition",
+                                    "definition_link"]),
+            split_column(sensors["aliases"], exclude_set),
+            split_column(sensors["equivalentClasses"], exclude_set)):
+        sensor = sensor.strip()
+        if sensor not in exclude_set:
 
             sensor_label = language_string(sensor)
             sensor_iri = check_iri(sensor, 'PascalCase')
@@ -3202,46 +3322,41 @@ def ingest_sensors(sensors_xls, statements={}):
             predicates_list = []
             predicates_list.append(("rdfs:label", sensor_label))
 
-            aliases = row[1]["aliases"]
-            if aliases not in exclude_list:
-                aliases = [x for x in aliases.strip().split(',') if len(x)>0]
-                for alias in aliases:
-                    if alias not in exclude_list:
-                        if isinstance(alias, str):
-                            predicates_list.append(("rdfs:label", language_string(alias)))
+            for alias in aliases:
+                predicates_list.append(("rdfs:label", language_string(alias)))
 
-            if row[1]["definition"] not in exclude_list:
+            if definition not in exclude_set:
                 predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["definition"])))
-            definition_link = row[1]["definition_link"]
-            if definition_link not in exclude_list:
+                                        language_string(definition)))
+            if definition_link not in exclude_set:
                 predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(definition_link.strip())))
+                                        '"{0}"^^xsd:anyURI'.format(definition_link)))
 
             predicates_list.append(("rdfs:subClassOf", ":SensingDevice"))
 
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    sensor_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(sensor_iri, predicates_list,
+                                        statements, exclude_set)
 
     # measurands worksheet
-    for row in measurands.iterrows():
-        measurand = row[1]["measurand"].strip()
-        if measurand not in exclude_list:
+    for (measurand, measurand_definition, measurand_definition_link,
+         sensor_type, sensor_type_definition, sensor_type_definition_link,
+         measurand_equivalentClasses, aliases, sensor_type_equivalentClasses,
+         indices_sensor) in zip(
+            *column_lists(
+                measurands, ["measurand", "measurand_definition",
+                             "measurand_definition_link", "sensor_type",
+                             "sensor_type_definition",
+                             "sensor_type_definition_link"]),
+            *[split_column(measurands[column], exclude_set) for column in [
+                "measurand_equivalentClasses", "aliases",
+                "sensor_type_equivalentClasses"]],
+            split_indices(measurands["indices_sensor"])):
+        measurand = measurand.strip()
+        if measurand not in exclude_set:
 
             # measurand:
 
@@ -3251,99 +3366,70 @@ def ingest_sensors(sensors_xls, statements={}):
             predicates_list = []
             predicates_list.append(("rdfs:label", measurand_label))
 
-            if row[1]["measurand_definition"] not in exclude_list:
+            if measurand_definition not in exclude_set:
                 predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["measurand_definition"])))
-            if row[1]["measurand_definition_link"] not in exclude_list:
+                                        language_string(measurand_definition)))
+            if measurand_definition_link not in exclude_set:
                 predicates_list.append((":hasWebsite",
-                                        '"{0}"^^xsd:anyURI'.format(row[1]["measurand_definition_link"].strip())))
+                                        '"{0}"^^xsd:anyURI'.format(measurand_definition_link)))
 
             predicates_list.append(("rdfs:subClassOf", ":Measurand"))
 
-            if row[1]["measurand_equivalentClasses"] not in exclude_list:
-                measurand_equivalentClasses = row[1]["measurand_equivalentClasses"]
-                measurand_equivalentClasses = [x.strip() for x in
-                    measurand_equivalentClasses.strip().split(',') if len(x) > 0]
-                for measurand_equivalentClass in measurand_equivalentClasses:
-                    if measurand_equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                measurand_equivalentClass))
-            aliases = row[1]["aliases"]
-            if aliases not in exclude_list:
-                aliases = [x for x in aliases.strip().split(',') if len(x)>0]
-                for alias in aliases:
-                    if alias not in exclude_list:
-                        if isinstance(alias, str):
-                            predicates_list.append(("rdfs:label", language_string(alias)))
-
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    measurand_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            for measurand_equivalentClass in measurand_equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        measurand_equivalentClass))
+            for alias in aliases:
+                predicates_list.append(("rdfs:label", language_string(alias)))
+
+            statements = add_predicates(measurand_iri, predicates_list,
+                                        statements, exclude_set)
 
             # sensor_type:
 
-            sensor_type = row[1]["sensor_type"].strip()
+            sensor_type = sensor_type.strip()
             sensor_type_label = language_string(sensor_type)
             sensor_type_iri = check_iri(sensor_type, 'PascalCase')
 
             sensor_type_predicates_list = []
             sensor_type_predicates_list.append(("rdfs:label", sensor_type_label))
 
-            if row[1]["sensor_type_definition"] not in exclude_list:
+            if sensor_type_definition not in exclude_set:
                 sensor_type_predicates_list.append(("rdfs:comment",
-                    language_string(row[1]["sensor_type_definition"])))
-            if row[1]["sensor_type_definition_link"] not in exclude_list:
+                    language_string(sensor_type_definition)))
+            if sensor_type_definition_link not in exclude_set:
                 sensor_type_predicates_list.append((":hasWebsite",
-                    '"{0}"^^xsd:anyURI'.format(row[1]["sensor_type_definition_link"].strip())))
+                    '"{0}"^^xsd:anyURI'.format(sensor_type_definition_link)))
 
             predicates_list.append(("rdfs:subClassOf", ":SensingDevice"))
 
-            if row[1]["sensor_type_equivalentClasses"] not in exclude_list:
-                sensor_type_equivalentClasses = row[1]["sensor_type_equivalentClasses"]
-                sensor_type_equivalentClasses = [x.strip() for x in
-                    sensor_type_equivalentClasses.strip().split(',') if len(x) > 0]
-                for sensor_type_equivalentClass in sensor_type_equivalentClasses:
-                    if sensor_type_equivalentClass not in exclude_list:
-                        sensor_type_predicates_list.append(("rdfs:equivalentClass",
-                            sensor_type_equivalentClass))
+            for sensor_type_equivalentClass in sensor_type_equivalentClasses:
+                sensor_type_predicates_list.append(("rdfs:equivalentClass",
+                                                    sensor_type_equivalentClass))
 
-            for sensor_type_predicates in sensor_type_predicates_list:
-                statements = add_to_statements(
-                    sensor_type_iri,
-                    sensor_type_predicates[0],
-                    sensor_type_predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(sensor_type_iri,
+                                        sensor_type_predicates_list,
+                                        statements, exclude_set)
 
-            indices_sensor = row[1]["indices_sensor"]
-            if indices_sensor not in exclude_list:
-                if isinstance(indices_sensor, float) or \
-                        isinstance(indices_sensor, int):
-                    indices = [np.int(indices_sensor)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_sensor.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = sensors[sensors["index"] == index]["sensor"].values[0]
-                    if isinstance(objectRDF, str):
-                        statements = add_to_statements(
-                            check_iri(objectRDF, 'PascalCase'),
-                            "rdfs:subClassOf",
-                            sensor_type_iri,
-                            statements,
-                            exclude_list
+            for index in indices_sensor:
+                objectRDF = sensor_by_index[index]
+                if isinstance(objectRDF, str):
+                    statements = add_to_statements(
+                        check_iri(objectRDF, 'PascalCase'),
+                        "rdfs:subClassOf",
+                        sensor_type_iri,
+                        statements,
+                        exclude_set
                     )
 
     # scales worksheet
-    for row in scales.iterrows():
-        scale = row[1]["scale"].strip()
-        if scale not in exclude_list:
+    for (scale, definition, equivalentClasses, aliases,
+         indices_scale) in zip(
+            *column_lists(scales, ["scale", "definition"]),
+            split_column(scales["equivalentClasses"], exclude_set),
+            split_column(scales["aliases"], exclude_set),
+            split_indices(scales["indices_scale"])):
+        scale = scale.strip()
+        if scale not in exclude_set:
 
             scale_label = language_string(scale)
             scale_iri = check_iri(scale, 'PascalCase')
@@ -3351,76 +3437,52 @@ def ingest_sensors(sensors_xls, statements={}):
             predicates_list = []
             predicates_list.append(("rdfs:label", scale_label))
 
-            if row[1]["definition"] not in exclude_list:
+            if definition not in exclude_set:
                 predicates_list.append(("rdfs:comment",
-                                        language_string(row[1]["definition"])))
-
-            if row[1]["equivalentClasses"] not in exclude_list:
-                equivalentClasses = row[1]["equivalentClasses"]
-                equivalentClasses = [x.strip() for x in
-                                 equivalentClasses.strip().split(',') if len(x) > 0]
-                for equivalentClass in equivalentClasses:
-                    if equivalentClass not in exclude_list:
-                        predicates_list.append(("rdfs:equivalentClass",
-                                                equivalentClass))
-            aliases = row[1]["aliases"]
-            if aliases not in exclude_list:
-                aliases = [x for x in aliases.strip().split(',') if len(x)>0]
-                for alias in aliases:
-                    if alias not in exclude_list:
-                        if isinstance(alias, str):
-                            predicates_list.append(("rdfs:label", language_string(alias)))
-
-            indices_scale = row[1]["indices_scale"]
-            if indices_scale not in exclude_list:
-                if isinstance(indices_scale, float) or \
-                        isinstance(indices_scale, int):
-                    indices = [np.int(indices_scale)]
-                else:
-                    indices = [np.int(x) for x in
-                               indices_scale.strip().split(',') if len(x)>0]
-                for index in indices:
-                    objectRDF = scales[scales["index"] ==
-                                         index]["scale"].values[0]
+                                        language_string(definition)))
+
+            for equivalentClass in equivalentClasses:
+                predicates_list.append(("rdfs:equivalentClass",
+                                        equivalentClass))
+            for alias in aliases:
+                predicates_list.append(("rdfs:label", language_string(alias)))
+
+            if indices_scale:
+                for index in indices_scale:
+                    objectRDF = scale_by_index[index]
                     if isinstance(objectRDF, str):
                         predicates_list.append(("rdfs:subClassOf",
                                                 check_iri(objectRDF, 'PascalCase')))
             else:
                 predicates_list.append(("rdfs:subClassOf", ":Scale"))
 
-            for predicates in predicates_list:
-                statements = add_to_statements(
-                    scale_iri,
-                    predicates[0],
-                    predicates[1],
-                    statements,
-                    exclude_list
-                )
+            statements = add_predicates(scale_iri, predicates_list,
+                                        statements, exclude_set)
 
     return statements
 
 
 #     # medications worksheet
 #     for row in medications.iterrows():
-#         if row[1]["IRI"] not in exclude_list:
+#         if row[1]["IRI"] not in exclude_set:
 #             medication_iri = check_iri(row[1]["IRI"], 'PascalCase')
 #         else:
 #             medication_iri = check_iri(row[1]["medication"])
 #         statements = add_to_statements(medication_iri, "a",
-#                             ":Medication", statements, exclude_list)
+#                             ":Medication", statements, exclude_set)
 #         statements = add_to_statements(medication_iri, "rdfs:label",
 #                             language_string(row[1]["medication"], 'PascalCase'),
-#                                        statements, exclude_list)
+#                                        statements, exclude_set)
 #
 #     # treatments worksheet
 #     for row in treatments.iterrows():
-#         if row[1]["IRI"] not in exclude_list:
+#         if row[1]["IRI"] not in exclude_set:
 #             treatment_iri = check_iri(row[1]["IRI"], 'PascalCase')
 #         else:
 #             treatment_iri = check_iri(row[1]["treatment"], 'PascalCase')
 #         statements = add_to_statements(treatment_iri, "a",
-#                             ":Treatment", statements, exclude_list)
+#                             ":Treatment", statements, exclude_set)
 #         statements = add_to_statements(treatment_iri, "rdfs:label",
 #                             language_string(row[1]["treatment"]),
-#                                        statements, exclude_list)
+#                                        statements, exclude_set)
 
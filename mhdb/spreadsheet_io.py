@@ -10,10 +10,21 @@ Authors:
 Copyright 2020, Child Mind Institute (http://childmind.org), Apache v2.0 License
 
 """
+import glob
+import hashlib
 import os
 import pandas as pd
+import pickle
+import re
+import tempfile
 import urllib.request as urllibrequest #import urllib
 
+# placeholders of empty cells, which are not malformed indices
+index_placeholders = ["EmptyValue", "", "nan", "NaN", "NAN"]
+
+# control characters that xlsx files store as "_xhhhh_" escapes
+control_characters = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
 
 def download_google_sheet(filepath, docid):
     """
@@ -39,6 +50,186 @@ def download_google_sheet(filepath, docid):
     return filepath
 
 
+def file_digest(filepath):
+    """
+    Compute the SHA-256 digest of a file.
+
+    Parameters
+    ----------
+    filepath : string
+
+    Returns
+    -------
+    digest : string
+        hexadecimal SHA-256 digest
+    """
+    sha256 = hashlib.sha256()
+    with open(filepath, 'rb') as fid:
+        for block in iter(lambda: fid.read(1 << 20), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def open_workbook(filepath):
+    """
+    Open an Excel workbook, preferring the python-calamine engine.
+
+    The Rust-based calamine engine (pandas >= 2.2 with the optional
+    python-calamine package installed: pip install "MHDB[calamine]")
+    parses xlsx files several times faster than openpyxl. Unlike openpyxl,
+    it also decodes escaped control characters such as "_x0001_", which
+    parse_worksheets escapes again (see escape_control_characters).
+    Without it, pandas' default engine is used.
+
+    Parameters
+    ----------
+    filepath : string
+
+    Returns
+    -------
+    xls : pandas ExcelFile
+
+    Examples
+    --------
+    >>> import sys
+    >>> filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    ...                         os.pardir, "input", "states.xlsx")
+    >>> calamine = sys.modules.get("python_calamine")
+    >>> sys.modules["python_calamine"] = None  # as if not installed
+    >>> open_workbook(filepath).engine != "calamine"
+    True
+    >>> if calamine is None:
+    ...     del sys.modules["python_calamine"]
+    ... else:
+    ...     sys.modules["python_calamine"] = calamine
+    """
+    try:
+        import python_calamine
+        return pd.ExcelFile(filepath, engine="calamine")
+    except (ImportError, ValueError):
+        return pd.ExcelFile(filepath)
+
+
+def escape_control_characters(worksheet):
+    """
+    Escape control characters in string cells the way xlsx files store them.
+
+    xlsx files store control characters other than tab, line feed and
+    carriage return as "_xhhhh_" escapes (lowercase in Google Sheets
+    exports), which openpyxl leaves as they are but calamine decodes.
+    Escaping them again makes worksheets (and the turtle written from
+    them) independent of the parsing engine.
+
+    Parameters
+    ----------
+    worksheet : pandas dataframe
+
+    Returns
+    -------
+    worksheet : pandas dataframe
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> worksheet = pd.DataFrame({"a": ["memory\x01Utilizes", 1, "b"]})
+    >>> escape_control_characters(worksheet)["a"].tolist()
+    ['memory_x0001_Utilizes', 1, 'b']
+    """
+    for column in worksheet.columns:
+        if worksheet[column].dtype != object and \
+                not pd.api.types.is_string_dtype(worksheet[column]):
+            continue
+        escaped = worksheet[column].map(
+            lambda x: control_characters.sub(
+                lambda c: "_x{0:04x}_".format(ord(c.group())), x)
+            if isinstance(x, str) else x)
+        if not escaped.equals(worksheet[column]):
+            worksheet[column] = escaped
+    return worksheet
+
+
+def parse_worksheets(workbook, sheet_names, cache_dir=None, usecols=None):
+    """
+    Parse worksheets of an Excel workbook, caching them on disk.
+
+    If the workbook is given as a file path, parsed worksheets are pickled
+    to cache_dir in a file named after the workbook, its SHA-256 digest
+    and the parsing engine, so an unchanged workbook is only parsed once.
+    Cache files of earlier versions of the same workbook are removed.
+    Workbooks given as pandas ExcelFiles are always parsed, and worksheets
+    are still returned if the cache cannot be written.
+
+    Parameters
+    ----------
+    workbook : string or pandas ExcelFile
+        path to an Excel workbook, or an open workbook
+    sheet_names : list of strings
+        worksheet names
+    cache_dir : string
+        directory of cached worksheets (None: no caching)
+    usecols : dictionary
+        key: string
+            worksheet name
+        value: list of strings
+            column headers to read from that worksheet (default: all)
+
+    Returns
+    -------
+    worksheets : list of pandas dataframes
+        one dataframe per worksheet name
+    """
+    usecols = usecols or {}
+    if not isinstance(workbook, str):
+        return [escape_control_characters(workbook.parse(
+            sheet_name, usecols=usecols.get(sheet_name)))
+            for sheet_name in sheet_names]
+
+    xls = open_workbook(workbook)
+    if not cache_dir:
+        return [escape_control_characters(xls.parse(
+            sheet_name, usecols=usecols.get(sheet_name)))
+            for sheet_name in sheet_names]
+
+    keys = [(sheet_name, tuple(usecols[sheet_name]))
+            if sheet_name in usecols else sheet_name
+            for sheet_name in sheet_names]
+    cache_prefix = os.path.join(cache_dir, os.path.basename(workbook))
+    cache_file = "{0}-{1}-{2}.pkl".format(
+        cache_prefix, file_digest(workbook), xls.engine)
+    cached = {}
+    if os.path.isfile(cache_file):
+        try:
+            with open(cache_file, 'rb') as fid:
+                cached = pickle.load(fid)
+        except Exception:
+            cached = {}
+
+    missing = [(sheet_name, key) for sheet_name, key in zip(sheet_names, keys)
+               if key not in cached]
+    if missing:
+        for sheet_name, key in missing:
+            cached[key] = escape_control_characters(xls.parse(
+                sheet_name, usecols=usecols.get(sheet_name)))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fid, temp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fid, 'wb') as fid:
+                    pickle.dump(cached, fid)
+                os.replace(temp_file, cache_file)
+            except BaseException:
+                os.remove(temp_file)
+                raise
+            for stale_file in glob.glob("{0}-*-{1}.pkl".format(
+                    glob.escape(cache_prefix), xls.engine)):
+                if stale_file != cache_file:
+                    os.remove(stale_file)
+        except OSError:
+            pass
+
+    return [cached[key].copy() for key in keys]
+
+
 def return_none_for_nan(input_value):
     """
     Return None if input is a NaN value; otherwise, return the input.
@@ -271,6 +462,299 @@ def get_cells(worksheet, index, worksheet2=None, exclude=[], no_nan=True):
            definition, definition_ref, definition_ref_uri
 
 
+def column_lists(worksheet, columns):
+    """
+    Return worksheet columns as lists, to iterate over rows with zip().
+
+    Parameters
+    ----------
+    worksheet : pandas dataframe
+        worksheet with column headers
+    columns : list of strings
+        worksheet column headers
+
+    Returns
+    -------
+    lists : list of lists
+        one list of cell values per column
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"index": [1, 2], "label": ["a", "b"]})
+    >>> for index, label in zip(*column_lists(df, ["index", "label"])):
+    ...     print(index, label)
+    1 a
+    2 b
+    """
+    return [worksheet[column].tolist() for column in columns]
+
+
+def exclude_rows(worksheet, column, exclude=[]):
+    """
+    Drop the rows of a worksheet whose cell in a column is excluded.
+
+    The whole column is tested at once with pandas isin, so a loop over
+    the remaining rows need not test each cell.
+
+    Parameters
+    ----------
+    worksheet : pandas dataframe
+        worksheet with column headers
+    column : string
+        worksheet column header
+    exclude : list
+        exclusion list
+
+    Returns
+    -------
+    worksheet : pandas dataframe
+        rows whose cell in column is not in the exclusion list
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"cost": ["free", "EmptyValue", "paid"]})
+    >>> exclude_rows(df, "cost", ["EmptyValue", []])["cost"].tolist()
+    ['free', 'paid']
+    """
+    return worksheet[~worksheet[column].isin(
+        [x for x in exclude if not isinstance(x, list)])]
+
+
+def lookup_by_index(worksheet, column, index_column="index"):
+    """
+    Map each value of a worksheet's index column to a cell of another column.
+
+    Where an index value repeats, the first row wins, as it would when
+    filtering the worksheet on that value and taking the first match.
+
+    Parameters
+    ----------
+    worksheet : pandas dataframe
+        worksheet with column headers
+    column : string
+        worksheet column header for the values
+    index_column : string
+        worksheet column header for the keys
+
+    Returns
+    -------
+    lookup : dictionary
+        key: index value
+        value: corresponding cell of column
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"index": [1, 2, 2], "label": ["a", "b", "c"]})
+    >>> lookup = lookup_by_index(df, "label")
+    >>> lookup[2]
+    'b'
+    """
+    lookup = {}
+    for index, value in zip(worksheet[index_column].tolist(),
+                            worksheet[column].tolist()):
+        lookup.setdefault(index, value)
+    return lookup
+
+
+def strip_columns(worksheet, columns):
+    """
+    Strip surrounding whitespace from string cells of worksheet columns.
+
+    Missing columns and cells that are not strings are left alone.
+
+    Parameters
+    ----------
+    worksheet : pandas dataframe
+        worksheet with column headers
+    columns : list of strings
+        worksheet column headers
+
+    Returns
+    -------
+    worksheet : pandas dataframe
+        the same worksheet
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"a": [" x ", "y "], "b": [1, 2], "c": [" z", 3]})
+    >>> df = strip_columns(df, ["a", "b", "c", "d"])
+    >>> df["a"].tolist(), df["b"].tolist(), df["c"].tolist()
+    (['x', 'y'], [1, 2], ['z', 3])
+    """
+    for column in columns:
+        if column in worksheet and \
+                not pd.api.types.is_numeric_dtype(worksheet[column]):
+            worksheet[column] = worksheet[column].map(
+                lambda x: x.strip() if isinstance(x, str) else x)
+    return worksheet
+
+
+def check_indices(tokens, indices):
+    """
+    Raise an error for index tokens that are not numbers.
+
+    Placeholders for empty cells ("EmptyValue", "", "nan", "NaN", "NAN",
+    None and NaN) are allowed to have no number.
+
+    Parameters
+    ----------
+    tokens : pandas Series
+        index tokens, labelled by worksheet row
+    indices : pandas Series
+        tokens converted with pd.to_numeric(tokens, errors="coerce")
+
+    Examples
+    --------
+    >>> tokens = pd.Series(["1", "EmptyValue", "12a"], name="indices")
+    >>> check_indices(tokens, pd.to_numeric(tokens, errors="coerce"))
+    Traceback (most recent call last):
+    ...
+    ValueError: malformed index '12a' in row 2 of column indices
+    """
+    malformed = indices.isna().to_numpy() & tokens.notna().to_numpy() & \
+        ~tokens.astype(str).str.strip().isin(index_placeholders).to_numpy()
+    if malformed.any():
+        raise ValueError("; ".join([
+            "malformed index {0!r} in row {1} of column {2}".format(
+                token, row, tokens.name)
+            for row, token in zip(tokens.index[malformed],
+                                  tokens[malformed].tolist())]))
+
+
+def index_values(column):
+    """
+    Convert a worksheet column of single indices into Python integers.
+
+    The whole column goes through a nullable integer ("Int64") conversion;
+    cells without a number (empty, NaN or placeholder values) yield None,
+    and other cells that are not numbers raise a ValueError.
+
+    Parameters
+    ----------
+    column : pandas Series
+        worksheet column of indices
+
+    Returns
+    -------
+    indices : list of integers or None
+        one per row of the column
+
+    Examples
+    --------
+    >>> index_values(pd.Series([1.0, "EmptyValue", "3"]))
+    [1, None, 3]
+    """
+    indices = pd.to_numeric(column, errors="coerce")
+    check_indices(column, indices)
+    indices = indices.astype("Int64")
+    return [None if index is pd.NA else index for index in indices.tolist()]
+
+
+def split_indices(column):
+    """
+    Parse a worksheet column of comma-separated indices into lists of integers.
+
+    The whole column is split, stripped and converted with pandas string
+    and numeric operations; cells without any integer (empty, NaN or
+    placeholder values) yield an empty list, and other tokens that are not
+    numbers (such as "12a" or "3;4") raise a ValueError.
+
+    Parameters
+    ----------
+    column : pandas Series
+        worksheet column of comma-separated indices or single numbers
+
+    Returns
+    -------
+    indices : list of lists of integers
+        one list per row of the column
+
+    Examples
+    --------
+    >>> split_indices(pd.Series(["1, 2,", 3.0, "EmptyValue"]))
+    [[1, 2], [3], []]
+    """
+    rows = column.index
+    column = column.reset_index(drop=True)
+    tokens = column.fillna("").astype(str).str.split(",").explode() \
+        .str.strip()
+    indices = pd.to_numeric(tokens, errors="coerce")
+    check_indices(tokens.set_axis(rows[tokens.index]).rename(column.name),
+                  indices)
+    indices = indices.dropna()
+    lists = [[] for _ in range(len(column))]
+    for row, index in zip(indices.index.tolist(),
+                          indices.astype(int).tolist()):
+        lists[row].append(index)
+    return lists
+
+
+def split_column(column, exclude=[], delimiter=","):
+    """
+    Split a worksheet column of delimited strings into lists of strings.
+
+    The whole column is split, exploded and stripped with pandas string
+    operations; empty items and items in the exclusion list are dropped.
+
+    Parameters
+    ----------
+    column : pandas Series
+        worksheet column of delimited strings
+    exclude : list
+        exclusion list
+    delimiter : string
+
+    Returns
+    -------
+    items : list of lists of strings
+        one list per row of the column
+
+    Examples
+    --------
+    >>> split_column(pd.Series(["a, b,", "EmptyValue", "c"]), ["EmptyValue"])
+    [['a', 'b'], [], ['c']]
+    """
+    column = column.reset_index(drop=True)
+    items = column.astype(str).str.split(delimiter).explode().str.strip()
+    items = items[(items.str.len() > 0) & ~items.isin(
+        [x for x in exclude if isinstance(x, str)])]
+    lists = [[] for _ in range(len(column))]
+    for row, item in zip(items.index.tolist(), items.tolist()):
+        lists[row].append(item)
+    return lists
+
+
+def prefix_column(column, prefix, exclude=[]):
+    """
+    Prefix each cell of a worksheet column, as a string, with a namespace.
+
+    The whole column is converted and concatenated with pandas string
+    operations; cells in the exclusion list yield None.
+
+    Parameters
+    ----------
+    column : pandas Series
+        worksheet column
+    prefix : string
+        prefix for each cell, such as "ICD9CM:"
+    exclude : list
+        exclusion list
+
+    Returns
+    -------
+    values : list of strings or None
+        one per row of the column
+
+    Examples
+    --------
+    >>> prefix_column(pd.Series([300.02, "EmptyValue", "F41.1"]), "ICD:",
+    ...               ["EmptyValue"])
+    ['ICD:300.02', None, 'ICD:F41.1']
+    """
+    values = (prefix + column.astype(str)).astype(object)
+    return values.where(~column.isin(list(exclude)), None).tolist()
+
+
 def split_on_slash(df, column, delimiter=" / "):
     """
     Function to build appropriate rows when
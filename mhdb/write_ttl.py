@@ -18,9 +18,18 @@ top_dir = os.path.abspath(os.path.join(
 ))
 if top_dir not in sys.path:
     sys.path.append(top_dir)
+from functools import lru_cache
 import numpy as np
+import re
 
+# patterns used by convert_string_to_label and check_iri, compiled once
+underscore_runs = re.compile(r"_{2,}")
+hyphen_runs = re.compile(r"-{2,}")
+whitespace = re.compile(r"\s")
+non_label_chars = re.compile(r"[^\w-]")  # keeps alphanumerics, "_" and "-"
 
+
+@lru_cache(maxsize=None)
 def language_string(s, lang="en"):
     """
     Function to encode a literal as being in a specific language.
@@ -58,6 +67,44 @@ def language_string(s, lang="en"):
     )
 
 
+def language_string_column(column, lang="en", exclude=[]):
+    """
+    Apply language_string to a worksheet column, once per distinct value.
+
+    Parameters
+    ----------
+    column : pandas Series
+
+    lang : string
+        ISO character code, default="en"
+    exclude : list
+        values (after stripping) for which to return None
+
+    Returns
+    -------
+    strings : list of strings
+        one Turtle literal (or None) per row of the column
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> for s in language_string_column(pd.Series(["goose", "goose", " "]),
+    ...                                 exclude=[""]):
+    ...     print(s)
+    \"""goose\"""@en
+    \"""goose\"""@en
+    None
+    """
+    strings = {}
+    values = column.tolist()
+    for value in values:
+        if value not in strings:
+            stripped = value.strip() if isinstance(value, str) else value
+            strings[value] = None if stripped in exclude else \
+                language_string(value, lang)
+    return [strings[value] for value in values]
+
+
 def return_string(input_string, replace=[], replace_with=[]):
     """
     Return a stripped string with optional character replacements.
@@ -182,13 +229,9 @@ def convert_string_to_label(input_string, label_type='delimited'):
         'WRITE_this-in_delimited'
 
         """
-        while " " in s:
-            s = s.replace(" ", "_")
-        while "__" in s:
-            s = s.replace("__", "_")
+        s = underscore_runs.sub("_", s.replace(" ", "_"))
         s = s.replace("_-_", "-")
-        while "--" in s:
-            s = s.replace("--", "-")
+        s = hyphen_runs.sub("-", s)
 
         return s
 
@@ -205,10 +248,7 @@ def convert_string_to_label(input_string, label_type='delimited'):
             output_string = toDelimit(input_string)
         else:
             Exception('label_type input is incorrect')
-        keep_chars = ('-', '_')
-
-        output_string = "".join(c for c in str(output_string) if c.isalnum()
-                                or c in keep_chars).rstrip()
+        output_string = non_label_chars.sub("", str(output_string)).rstrip()
         #output_string = ''.join(x for x in output_string if not x.isspace())
 
         return output_string
@@ -216,6 +256,7 @@ def convert_string_to_label(input_string, label_type='delimited'):
         raise Exception('"{0}" is not a string!'.format(input_string))
 
 
+@lru_cache(maxsize=None)
 def check_iri(iri, label_type='delimited'):
     """
     Function to format IRIs by type, such as <iri> or prefix:iri
@@ -246,7 +287,7 @@ def check_iri(iri, label_type='delimited'):
 
     iri = str(iri).strip()
 
-    if ":" in iri and not [x for x in iri if x.isspace()]:
+    if ":" in iri and not whitespace.search(iri):
         if iri.endswith(":"):
             return check_iri(iri[:-1], label_type) #, prefixes)
         elif ":/" in iri and \
@@ -303,25 +344,156 @@ def turtle_from_dict(ttl_dict):
         np.nan,
         None
     ]
-    return(
-        "\n\n".join([
-            "{0} {1} .".format(
-                subject,
-                " ;\n\t".join([
-                    "{0} {1}".format(
-                        predicate,
-                        object
-                    ) for predicate in ttl_dict[
-                        subject
-                    ] for object in ttl_dict[
-                        subject
-                    ][
-                        predicate
-                    ]
-                ])
-            ) for subject in ttl_dict
-        ])
-    )
+    return "\n\n".join(turtle_blocks(ttl_dict))
+
+
+def turtle_blocks(ttl_dict):
+    """
+    Generator of the Terse Triple Language statement for each subject
+
+    Parameters
+    ----------
+    ttl_dict: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+
+    Yields
+    ------
+    ttl_block: str
+        ttl statement for one subject
+
+    Example
+    -------
+    >>> list(turtle_blocks({"duck": {"continues": {"sitting"}}}))
+    ['duck continues sitting .']
+    """
+    for subject in ttl_dict:
+        yield "{0} {1} .".format(
+            subject,
+            " ;\n\t".join([
+                "{0} {1}".format(
+                    predicate,
+                    object
+                ) for predicate in ttl_dict[
+                    subject
+                ] for object in ttl_dict[
+                    subject
+                ][
+                    predicate
+                ]
+            ])
+        )
+
+
+def write_turtle(ttl_dict, fid):
+    """
+    Function to write a dictionary to an open file as Terse Triple Language
+
+    Each subject's statement is written as it is formatted, so the
+    complete ttl string (as returned by turtle_from_dict) is never built.
+
+    Parameters
+    ----------
+    ttl_dict: dictionary
+        key: string
+            RDF subject
+        value: dictionary
+            key: string
+                RDF predicate
+            value: {string}
+                set of RDF objects
+    fid: file object
+        open for writing text
+
+    Example
+    -------
+    >>> import io
+    >>> fid = io.StringIO()
+    >>> write_turtle({
+    ...     "duck": {"continues": {"sitting"}},
+    ...     "goose": {"begins": {"chasing"}}
+    ... }, fid)
+    >>> fid.getvalue()
+    'duck continues sitting .\\n\\ngoose begins chasing .'
+    """
+    separator = ""
+    for ttl_block in turtle_blocks(ttl_dict):
+        fid.write(separator)
+        fid.write(ttl_block)
+        separator = "\n\n"
+
+
+def check_iri_column(column, label_type='delimited', exclude=[]):
+    """
+    Apply check_iri to a worksheet column, once per distinct value.
+
+    Parameters
+    ----------
+    column : pandas Series
+
+    label_type: string
+        'PascalCase', 'camelCase', or 'delimited'
+        ('delimited' uses '_' delimiters and keeps hyphens)
+    exclude : list
+        values (after stripping) for which to return None
+
+    Returns
+    -------
+    iris : list of strings
+        one IRI (or None) per row of the column
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> check_iri_column(pd.Series(["Canada goose", "owl:Thing", " "]),
+    ...                  'PascalCase', exclude=[""])
+    [':CanadaGoose', 'owl:Thing', None]
+    """
+    iris = {}
+    values = column.tolist()
+    for value in values:
+        if value not in iris:
+            stripped = value.strip() if isinstance(value, str) else value
+            iris[value] = None if stripped in exclude else \
+                check_iri(value, label_type)
+    return [iris[value] for value in values]
+
+
+def check_iri_lookup(lookup, label_type='delimited', exclude=[]):
+    """
+    Apply check_iri to the values of an index lookup, once per index.
+
+    Parameters
+    ----------
+    lookup : dictionary
+        key: index value
+        value: worksheet cell (see spreadsheet_io.lookup_by_index)
+
+    label_type: string
+        'PascalCase', 'camelCase', or 'delimited'
+        ('delimited' uses '_' delimiters and keeps hyphens)
+    exclude : list
+        values for which to map the index to None
+
+    Returns
+    -------
+    iris : dictionary
+        key: index value
+        value: IRI (or None)
+
+    Example
+    -------
+    >>> check_iri_lookup({1: "Canada goose", 2: ""}, 'PascalCase',
+    ...                  exclude=[""])
+    {1: ':CanadaGoose', 2: None}
+    """
+    return {index: None if value in exclude else check_iri(value, label_type)
+            for index, value in lookup.items()}
 
 
 def write_about_statement(subject, predicate, object, predicates):
@@ -58,6 +58,7 @@ def main(**extra_args):
           platforms=PLATFORMS,
           version=VERSION,
           #requires=REQUIRES,
+          extras_require=EXTRAS_REQUIRE,
           provides=PROVIDES,
           packages=['mhdb'],
           #package_data={'mhdb': [pjoin('data', '*.txt')]},